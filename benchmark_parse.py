@@ -0,0 +1,219 @@
+"""
+Compare the parse modes of SigfoxManager on realistic API pages.
+
+Builds 100-item device and message pages shaped like the Sigfox API v2 responses, encodes them
+to JSON once, then times decoding and model construction for each parse mode.
+Under pydantic v1 "trusted" skips validation entirely; under pydantic v2 both model modes run
+the compiled validator, which is faster than building the models from Python. "raw" and
+"records" build no model at all. Memory is what one parsed page keeps alive.
+
+Usage:
+    python benchmark_parse.py [--pages N]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import pydantic
+
+from sigfox_manager.models.schemas import DeviceMessagesResponse, DevicesResponse
+from sigfox_manager.utils import json_backend
+from sigfox_manager.utils.model_builder import PARSE_MODES, build_model
+
+
+def device_page(size=100):
+    return {
+        "data": [
+            {
+                "id": f"{0x1A0000 + i:X}",
+                "name": f"Device {i}",
+                "satelliteCapable": False,
+                "repeater": False,
+                "messageModulo": 4096,
+                "deviceType": {
+                    "id": "5e8f1c2a9e93c1a4d6b2f001",
+                    "name": "Tracker",
+                    "actions": [],
+                    "resources": [],
+                },
+                "contract": {
+                    "id": "5e8f1c2a9e93c1a4d6b2f002",
+                    "name": "Platinum",
+                    "actions": [],
+                    "resources": [],
+                },
+                "group": {
+                    "id": "5e8f1c2a9e93c1a4d6b2f003",
+                    "name": "Fleet",
+                    "type": 8,
+                    "level": 1,
+                    "actions": [],
+                },
+                "modemCertificate": {
+                    "id": "5e8f1c2a9e93c1a4d6b2f004",
+                    "key": "M_0004_1234_01",
+                },
+                "prototype": False,
+                "productCertificate": {
+                    "id": "5e8f1c2a9e93c1a4d6b2f005",
+                    "key": "P_0004_1234_01",
+                },
+                "location": {"lat": 43.45, "lng": 1.26},
+                "lastComputedLocation": {
+                    "lat": 43.45,
+                    "lng": 1.26,
+                    "radius": 1200,
+                    "sourceCode": 2,
+                    "placeIds": [],
+                },
+                "pac": "1234567890ABCDEF",
+                "sequenceNumber": 1000 + i,
+                "trashSequenceNumber": 0,
+                "lastCom": 1700000000000 + i * 1000,
+                "lqi": i % 5,
+                "activationTime": 1600000000000,
+                "creationTime": 1600000000000,
+                "state": 0,
+                "comState": 1,
+                "token": {
+                    "state": 0,
+                    "detailMessage": "Valid",
+                    "end": 1800000000000,
+                    "freeMessages": 0,
+                    "freeMessagesSent": 0,
+                },
+                "createdBy": "5e8f1c2a9e93c1a4d6b2f006",
+                "lastEditionTime": 1650000000000,
+                "lastEditedBy": "5e8f1c2a9e93c1a4d6b2f006",
+                "automaticRenewal": True,
+                "automaticRenewalStatus": 0,
+                "activable": True,
+                "actions": ["edit"],
+                "resources": [],
+            }
+            for i in range(size)
+        ],
+        "paging": {"next": None},
+    }
+
+
+def message_page(size=100, rinfos=3):
+    return {
+        "data": [
+            {
+                "device": {"id": "1A0000", "name": "Device 0"},
+                "time": 1700000000000 - i * 600000,
+                "data": "0a1b2c3d4e5f60718293a4b5",
+                "ackRequired": True,
+                "lqi": i % 4,
+                "seqNumber": 5000 - i,
+                "nbFrames": 3,
+                "computedLocation": [
+                    {"lat": 43.45, "lng": 1.26, "radius": 1200, "source": 2}
+                ],
+                "rinfos": [
+                    {
+                        "baseStation": {
+                            "id": f"{0x3D00 + r:X}",
+                            "name": f"Station {r}",
+                            "resourceType": 0,
+                        },
+                        "rssi": "-121.00",
+                        "rssiRepeaters": "-121.00",
+                        "lat": "43.0",
+                        "lng": "1.0",
+                        "freq": 868130000.0,
+                        "freqRepeaters": "868130000",
+                        "rep": 0,
+                        "repetitions": [
+                            {
+                                "nseq": n,
+                                "rssi": "-122.00",
+                                "freq": 868130000.0,
+                                "repeated": False,
+                            }
+                            for n in range(3)
+                        ],
+                        "cbStatus": {
+                            "status": 200,
+                            "cbDef": "https://example.com/uplink",
+                            "time": 1700000000000,
+                            "attempts": 1,
+                        },
+                    }
+                    for r in range(rinfos)
+                ],
+                "downlinkAnswerStatuses": [
+                    {
+                        "statusCode": 0,
+                        "status": 1,
+                        "transmissionTime": 1700000001000,
+                        "baseStation": {"id": "3D00", "name": "Station 0"},
+                        "freq": 869525000.0,
+                        "plannedPower": 27.0,
+                        "data": "0011223344556677",
+                        "downlinkAckInfo": {
+                            "emissionTimestamp": 1700000001000,
+                            "retryNumber": 0,
+                            "lastCst": 1,
+                        },
+                    }
+                ],
+            }
+            for i in range(size)
+        ],
+        "paging": {"next": None},
+    }
+
+
+def retained_bytes(cls, raw, parse_mode):
+    tracemalloc.start()
+    page = build_model(cls, json_backend.loads(raw), parse_mode)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del page
+
+    return size
+
+
+def bench(label, cls, raw, pages, parse_mode):
+    start = time.perf_counter()
+    for _ in range(pages):
+        build_model(cls, json_backend.loads(raw), parse_mode)
+    elapsed = time.perf_counter() - start
+    size = retained_bytes(cls, raw, parse_mode)
+    print(
+        f"{label:<10} {parse_mode:<10} {elapsed * 1000 / pages:8.2f} ms/page {size / 1024:8.1f} KiB/page"
+    )
+
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--pages", type=int, default=200, help="pages parsed per measurement"
+    )
+    args = parser.parse_args()
+
+    print(
+        f"pydantic {pydantic.VERSION}, JSON backend: {json_backend.get_json_backend().name}"
+    )
+    for label, cls, page in (
+        ("devices", DevicesResponse, device_page()),
+        ("messages", DeviceMessagesResponse, message_page()),
+    ):
+        raw = json_backend.dumps(page)
+        timings = {
+            mode: bench(label, cls, raw, args.pages, mode) for mode in PARSE_MODES
+        }
+        baseline = timings[PARSE_MODES[0]]
+        for mode in PARSE_MODES[1:]:
+            print(
+                f"{label:<10} {mode:<10} {baseline / timings[mode]:8.2f}x speedup over {PARSE_MODES[0]}"
+            )
+
+
+if __name__ == "__main__":
+    main()
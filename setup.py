@@ -47,12 +47,22 @@ setup(
     python_requires=">=3.8",
     install_requires=read_requirements(),
     extras_require={
+        "async": [
+            "httpx>=0.23.0",
+        ],
+        "fast": [
+            "orjson>=3.0",
+        ],
+        "numpy": [
+            "numpy>=1.20",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
             "black>=21.0",
             "flake8>=3.8",
             "mypy>=0.800",
+            "httpx>=0.23.0",
         ],
     },
     include_package_data=True,
@@ -11,6 +11,9 @@ __email__ = "your.email@example.com"
 
 # Import main classes for easy access
 from .sigfox_manager import SigfoxManager
+from .async_sigfox_manager import AsyncSigfoxManager
+from .message_poller import MessagePoller, AdaptivePollScheduler
+from .callback_server import CallbackServer
 from .models.schemas import (
     ContractsResponse,
     DevicesResponse,
@@ -28,11 +31,43 @@ from .sigfox_manager_exceptions.sigfox_exceptions import (
     SigfoxAuthError,
     SigfoxDeviceCreateConflictException,
     SigfoxDeviceTypeNotFoundException,
+    SigfoxBulkDeviceError,
+    SigfoxBulkAuthError,
+    SigfoxTimeoutError,
+    SigfoxIncompleteBackfillError,
 )
+from .models.records import Record, RecordPage
+from .models.results import (
+    BatchResult,
+    ProvisioningReport,
+    ProvisioningRowResult,
+    SyncEvent,
+    SyncReport,
+)
+from .utils.http_utils import HttpTransport
+from .utils.pagination import PageIterator
+from .utils.checkpoint import PaginationCheckpoint
+from .utils.rate_limit import RetryPolicy, TokenBucket
+from .utils.single_flight import SingleFlight
+from .utils.response_cache import ResponseCache
+from .utils.fleet_store import FleetStore
+from .utils.device_table import DeviceTable
+from .utils.numpy_export import messages_to_numpy
+from .utils.sinks import MessageSink, CallbackSink, QueueSink
+from .utils.device_type_catalog import DeviceTypeCatalog
+from .utils.async_http_utils import AsyncHttpTransport
+from .utils.json_backend import JsonBackend, get_json_backend, set_json_backend
 
 # Define what gets imported with "from sigfox_manager import *"
 __all__ = [
     "SigfoxManager",
+    "AsyncSigfoxManager",
+    "MessagePoller",
+    "AdaptivePollScheduler",
+    "CallbackServer",
+    "MessageSink",
+    "CallbackSink",
+    "QueueSink",
     "ContractsResponse",
     "DevicesResponse",
     "Device",
@@ -47,4 +82,30 @@ __all__ = [
     "SigfoxAuthError",
     "SigfoxDeviceCreateConflictException",
     "SigfoxDeviceTypeNotFoundException",
+    "SigfoxBulkDeviceError",
+    "SigfoxBulkAuthError",
+    "SigfoxTimeoutError",
+    "SigfoxIncompleteBackfillError",
+    "BatchResult",
+    "ProvisioningReport",
+    "ProvisioningRowResult",
+    "SyncEvent",
+    "SyncReport",
+    "Record",
+    "RecordPage",
+    "HttpTransport",
+    "PageIterator",
+    "PaginationCheckpoint",
+    "RetryPolicy",
+    "TokenBucket",
+    "SingleFlight",
+    "ResponseCache",
+    "FleetStore",
+    "DeviceTable",
+    "messages_to_numpy",
+    "DeviceTypeCatalog",
+    "AsyncHttpTransport",
+    "JsonBackend",
+    "get_json_backend",
+    "set_json_backend",
 ]
@@ -0,0 +1,415 @@
+from base64 import b64encode
+from typing import Optional
+
+from sigfox_manager.models.schemas import (
+    ContractsResponse,
+    DevicesResponse,
+    Device,
+    DeviceMessagesResponse,
+    DeviceMessageStats,
+    BaseDevice,
+    DeviceTypesResponse,
+    Paging,
+)
+from sigfox_manager.sigfox_manager import (
+    DEFAULT_API_URL,
+    build_create_device_kwargs,
+    validate_provisioning_inputs,
+)
+from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+    SigfoxAPIException,
+    SigfoxDeviceNotFoundError,
+    SigfoxAuthError,
+    SigfoxDeviceCreateConflictException,
+    SigfoxDeviceTypeNotFoundException,
+)
+from sigfox_manager.utils.async_http_utils import (
+    async_do_get,
+    async_do_post,
+    AsyncHttpTransport,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+)
+from sigfox_manager.utils.json_backend import response_json
+from sigfox_manager.utils.model_builder import (
+    MODEL_PARSE_MODES,
+    PARSE_VALIDATE,
+    build_model,
+    check_parse_mode,
+)
+
+
+class AsyncSigfoxManager:
+    """
+    asyncio counterpart of SigfoxManager.
+
+    Every coroutine shares one pooled AsyncHttpTransport, so a single event loop can keep
+    hundreds of requests in flight. Errors are mapped to the same exceptions as the
+    synchronous client.
+    """
+
+    def __init__(
+        self,
+        user,
+        pwd,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        transport: Optional[AsyncHttpTransport] = None,
+        api_url: str = DEFAULT_API_URL,
+        parse_mode: str = PARSE_VALIDATE,
+    ):
+        """
+        :param user: Sigfox API login
+        :param pwd: Sigfox API password
+        :param max_connections: maximum number of concurrent connections in the shared pool
+        :param max_keepalive_connections: maximum number of idle connections kept alive
+        :param transport: optional pre-built AsyncHttpTransport to share between several managers; close() leaves it open
+        :param api_url: base URL of the Sigfox API v2, e.g. to target a local stand-in server
+        :param parse_mode: "validate" (default) or "trusted", see SigfoxManager; listing and message methods
+        accept a per-call parse_mode overriding it, which may also be "raw" or "records"
+        """
+        self.user = user
+        self.pwd = pwd
+        self.auth = b64encode(f"{self.user}:{self.pwd}".encode("utf-8")).decode("ascii")
+        self.api_url = api_url.rstrip("/")
+        # Only a transport created here is closed by close()
+        self._owns_transport = transport is None
+        if transport is None:
+            transport = AsyncHttpTransport(
+                self.auth.encode("utf-8"),
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            )
+        self.transport = transport
+        self.parse_mode = check_parse_mode(parse_mode, MODEL_PARSE_MODES)
+
+    async def close(self) -> None:
+        """
+        Release the pooled connections held by the manager's transport, unless the transport was passed in.
+        """
+        if self._owns_transport:
+            await self.transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def _parse_mode(self, parse_mode: Optional[str]) -> str:
+        """
+        :param parse_mode: per-call parse mode, or None for the manager's
+        :return: parse mode to use
+        """
+        return self.parse_mode if parse_mode is None else check_parse_mode(parse_mode)
+
+    async def _fetch_remaining_pages(
+        self, first_page, response_cls, raise_on_auth=False, parse_mode=PARSE_VALIDATE
+    ):
+        """
+        Follow paging.next from an already fetched first page and merge every page into it.
+        :param first_page: parsed first page of the listing
+        :param response_cls: response model used to parse each page
+        :param raise_on_auth: if True, a 403 on a later page raises SigfoxAuthError
+        :param parse_mode: "validate", "trusted", "raw" or "records", see build_model
+        :return: first_page with the merged data; complete=False and paging.next set to the failed page
+        if a page could not be fetched
+        """
+        all_items = list(first_page.data)
+        current_page = first_page
+        next_url = None
+
+        while current_page.paging and current_page.paging.next:
+            next_url = current_page.paging.next
+            resp = await async_do_get(next_url, self.transport)
+
+            if raise_on_auth and resp.status_code == 403:
+                raise SigfoxAuthError
+            elif resp.status_code != 200:
+                # If we can't get a page, break and return what we have
+                break
+
+            data = response_json(resp)
+            current_page = build_model(response_cls, data, parse_mode)
+            all_items.extend(current_page.data)
+            next_url = None
+
+        first_page.data = all_items
+        first_page.paging = Paging(next=next_url)
+        first_page.complete = next_url is None
+
+        return first_page
+
+    async def get_contracts(
+        self, fetch_all_pages: bool = True, parse_mode: Optional[str] = None
+    ) -> ContractsResponse:
+        """
+        Get all contracts from Sigfox API the user can see
+        :param fetch_all_pages: if True, fetches all pages automatically; if False, returns only first page
+        :param parse_mode: "validate", "trusted", "raw" or "records"; None uses the manager's parse_mode
+        :return: ContractsResponse object containing all contracts
+        """
+        parse_mode = self._parse_mode(parse_mode)
+        contract_url = f"{self.api_url}/contract-infos/"
+
+        resp = await async_do_get(contract_url, self.transport)
+        if resp.status_code != 200:
+            raise SigfoxAPIException(
+                status_code=resp.status_code, message="No Contract data found."
+            )
+
+        data = response_json(resp)
+        contracts_response = build_model(ContractsResponse, data, parse_mode)
+
+        if (
+            fetch_all_pages
+            and contracts_response.paging
+            and contracts_response.paging.next
+        ):
+            contracts_response = await self._fetch_remaining_pages(
+                contracts_response, ContractsResponse, parse_mode=parse_mode
+            )
+
+        return contracts_response
+
+    async def get_devices_by_contract(
+        self,
+        contract_id: str,
+        fetch_all_pages: bool = True,
+        parse_mode: Optional[str] = None,
+    ) -> DevicesResponse:
+        """
+        Get all the devices associated with a contract ID
+        :param contract_id: string containing the contract ID to search for
+        :param fetch_all_pages: if True, fetches all pages automatically; if False, returns only first page
+        :param parse_mode: "validate", "trusted", "raw" or "records"; None uses the manager's parse_mode
+        :return: DevicesResponse object containing the information for all the devices associated with the contract
+        """
+        parse_mode = self._parse_mode(parse_mode)
+        devs_url = f"{self.api_url}/contract-infos/{contract_id}/devices"
+
+        resp = await async_do_get(devs_url, self.transport)
+
+        if resp.status_code != 200:
+            raise SigfoxDeviceNotFoundError
+
+        data = response_json(resp)
+        devices_response = build_model(DevicesResponse, data, parse_mode)
+
+        if fetch_all_pages and devices_response.paging and devices_response.paging.next:
+            devices_response = await self._fetch_remaining_pages(
+                devices_response, DevicesResponse, parse_mode=parse_mode
+            )
+
+        return devices_response
+
+    async def get_device_info(self, dev_id: str) -> Device:
+        """
+        Gets the detailed information for a specific device by its ID.
+        :param dev_id: string containing the Sigfox ID for the selected device.
+        :return: Device object describing the requested device.
+        """
+        dev_url = f"{self.api_url}/devices/{dev_id}"
+
+        resp = await async_do_get(dev_url, self.transport)
+
+        if resp.status_code == 403:
+            raise SigfoxAuthError
+        elif resp.status_code == 404:
+            raise SigfoxDeviceNotFoundError
+
+        data = response_json(resp)
+
+        return build_model(Device, data, self.parse_mode)
+
+    async def get_device_messages(
+        self,
+        dev_id: str,
+        threshold: Optional[int] = None,
+        parse_mode: Optional[str] = None,
+    ) -> DeviceMessagesResponse:
+        """
+        Retrieves a list of messages for the specified device. An optional parameter of threshold can define the
+        starting point for the message list.
+        :param dev_id: string containing the Sigfox ID for the selected device.
+        :param threshold: timestamp value in epoch that shows the starting point for the query, if no value is provided
+        the query grabs all messages available in the backend.
+        :param parse_mode: "validate", "trusted", "raw" or "records"; None uses the manager's parse_mode
+        :return: List of messages for the device, contained in the DeviceMessagesResponse
+        """
+        parse_mode = self._parse_mode(parse_mode)
+        if threshold is None:
+            msgs_url = f"{self.api_url}/devices/{dev_id}/messages"
+        else:
+            msgs_url = f"{self.api_url}/devices/{dev_id}/messages?since={threshold}"
+
+        resp = await async_do_get(msgs_url, self.transport)
+
+        if resp.status_code == 403:
+            raise SigfoxAuthError
+        elif resp.status_code == 404:
+            raise SigfoxDeviceNotFoundError
+
+        data = response_json(resp)
+
+        return build_model(DeviceMessagesResponse, data, parse_mode)
+
+    async def get_device_message_number(self, dev_id) -> DeviceMessageStats:
+        """
+        Returns message metrics for the specified device.
+        :param dev_id: string containing the Sigfox ID for the selected device.
+        :return: DeviceMessageStats object that shows message transmission metrics.
+        """
+        metric_url = f"{self.api_url}/devices/{dev_id}/messages/metric"
+        resp = await async_do_get(metric_url, self.transport)
+        if resp.status_code == 403:
+            raise SigfoxAuthError
+        elif resp.status_code == 404:
+            raise SigfoxDeviceNotFoundError
+
+        data = response_json(resp)
+
+        return DeviceMessageStats(**data)
+
+    async def create_device(
+        self,
+        dev_id,
+        pac,
+        dev_type_id,
+        name,
+        activable=True,
+        lat=0.0,
+        lng=0.0,
+        product_cert=None,
+        prototype=False,
+        automatic_renewal=True,
+    ) -> BaseDevice:
+        """
+        Creates a new device in the Sigfox backend.
+        :param dev_id: string containing the HEX value of the Sigfox ID.
+        :param pac: string containing the HEX value of the sigfox PAC.
+        :param dev_type_id: string containing the Sigfox device type ID.
+        :param name: name for the device.
+        :param activable: bool value that determines if the device is activable.
+        :param lat: float corresponding to the latitude of the device.
+        :param lng: float corresponding to the longitude of the device.
+        :param product_cert: dictionary containing the product certificate for the device.
+        :param prototype: bool value that determines if the device is a prototype.
+        :param automatic_renewal: bool value that determines if the device has automatic renewal.
+        :return: BaseDevice object containing the information for the newly created device.
+        """
+        dev_create_url = f"{self.api_url}/devices/"
+        payload = {
+            "id": dev_id,
+            "name": name,
+            "pac": pac,
+            "lat": lat,
+            "lng": lng,
+            "automatic_renewal": automatic_renewal,
+            "activable": activable,
+            "prototype": prototype,
+            "deviceTypeId": dev_type_id,
+        }
+
+        if product_cert is not None and isinstance(product_cert, dict):
+            if "key" in product_cert.keys():
+                payload["productCertificate"] = product_cert
+
+        headers = {"Content-Type": "application/json"}
+
+        resp = await async_do_post(
+            dev_create_url, payload, self.transport, headers=headers
+        )
+
+        if resp.status_code == 403:
+            raise SigfoxAuthError
+        elif resp.status_code == 409:
+            raise SigfoxDeviceCreateConflictException
+
+        data = response_json(resp)
+
+        return BaseDevice(**data)
+
+    async def get_device_types(
+        self, fetch_all_pages: bool = True, parse_mode: Optional[str] = None
+    ) -> DeviceTypesResponse:
+        """
+        GET /v2/devicetypes
+        :param fetch_all_pages: if True, fetches all pages automatically; if False, returns only first page
+        :param parse_mode: "validate", "trusted", "raw" or "records"; None uses the manager's parse_mode
+        :return: DeviceTypesResponse object containing all device types
+        """
+        parse_mode = self._parse_mode(parse_mode)
+        device_types_url = f"{self.api_url}/devicetypes"
+
+        resp = await async_do_get(device_types_url, self.transport)
+
+        if resp.status_code == 403:
+            raise SigfoxAuthError
+        elif resp.status_code != 200:
+            raise SigfoxAPIException(
+                status_code=resp.status_code, message="Failed to fetch device types."
+            )
+
+        data = response_json(resp)
+        device_types_response = build_model(DeviceTypesResponse, data, parse_mode)
+
+        if (
+            fetch_all_pages
+            and device_types_response.paging
+            and device_types_response.paging.next
+        ):
+            device_types_response = await self._fetch_remaining_pages(
+                device_types_response,
+                DeviceTypesResponse,
+                raise_on_auth=True,
+                parse_mode=parse_mode,
+            )
+
+        return device_types_response
+
+    async def resolve_device_type_id(self, ref: str) -> str:
+        """
+        Resolve a device type reference (id first, then exact name) to its id.
+        :param ref: Device type id or name to resolve
+        :return: Device type id
+        :raises SigfoxDeviceTypeNotFoundException: if device type cannot be resolved
+        """
+        device_types = (await self.get_device_types(fetch_all_pages=True)).data
+
+        for dt in device_types:
+            if dt.id and dt.id == ref:
+                return dt.id
+
+        for dt in device_types:
+            if dt.name == ref and dt.id:
+                return dt.id
+
+        raise SigfoxDeviceTypeNotFoundException(f"Device type not found: {ref}")
+
+    async def provision_device(
+        self,
+        dev_id: str,
+        pac: str,
+        dev_type_ref: str,
+        name: Optional[str] = None,
+        **kwargs,
+    ) -> BaseDevice:
+        """
+        Validate inputs, resolve device type, and call create_device.
+        :param dev_id: Sigfox device ID (uppercase hex, 3-16 chars)
+        :param pac: PAC code (16-char alphanumeric)
+        :param dev_type_ref: Device type id or name
+        :param name: Optional device name
+        :param kwargs: Additional parameters to pass to create_device (prototype, automatic_renewal, lat, lng, etc.)
+        :return: BaseDevice object
+        :raises ValueError: if dev_id or pac format is invalid
+        :raises SigfoxDeviceTypeNotFoundException: if device type cannot be resolved
+        """
+        validate_provisioning_inputs(dev_id, pac)
+
+        dev_type_id = await self.resolve_device_type_id(dev_type_ref)
+
+        return await self.create_device(
+            **build_create_device_kwargs(dev_id, pac, dev_type_id, name, kwargs)
+        )
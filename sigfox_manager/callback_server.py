@@ -0,0 +1,332 @@
+import asyncio
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from sigfox_manager.models.schemas import DeviceMessage
+from sigfox_manager.utils import json_backend
+from sigfox_manager.utils.sinks import SinkLike, as_sink
+
+DEFAULT_CALLBACK_PATH = "/sigfox/uplink"
+DEFAULT_MAX_QUEUE = 10000
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_MAX_BODY = 1024 * 1024
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_MAX_ERRORS = 100
+
+# LQI names sent by Sigfox callbacks ({lqi}) mapped to the numeric value of the messages API
+LQI_LEVELS = {"limit": 0, "average": 1, "good": 2, "excellent": 3}
+
+_REASONS = {
+    202: "Accepted",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    503: "Service Unavailable",
+}
+
+
+def _callback_time(value: Any) -> int:
+    """
+    :param value: time field of a callback payload, an integer or a string of digits
+    :return: the time in milliseconds
+    :raises ValueError: if the time is missing or is not an integer
+    """
+    if isinstance(value, str) and value.isdigit():
+        value = int(value)
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError("callback payload has no integer time")
+    # {time} is expressed in seconds while the messages API uses milliseconds
+    return value * 1000 if value < 10**11 else value
+
+
+def parse_callback_message(payload: Dict[str, Any]) -> Tuple[str, DeviceMessage]:
+    """
+    Convert one Sigfox data callback body into a DeviceMessage.
+    The callback template is expected to send at least device, time, data and seqNumber; time may be
+    in seconds ({time}) or milliseconds, and lqi may be numeric or a callback LQI name.
+    :param payload: decoded callback JSON object
+    :return: (device id, DeviceMessage)
+    :raises ValueError: if the payload has no device id, no integer time or does not validate as a DeviceMessage
+    """
+    message = dict(payload)
+    device = message.get("device")
+    dev_id = device.get("id") if isinstance(device, dict) else device
+    if not dev_id:
+        raise ValueError("callback payload has no device id")
+    message["device"] = {"id": dev_id}
+
+    message["time"] = _callback_time(message.get("time"))
+
+    lqi = message.get("lqi", 0)
+    if isinstance(lqi, str) and not lqi.isdigit():
+        lqi = LQI_LEVELS.get(lqi.lower(), 0)
+    message["lqi"] = int(lqi)
+    message.setdefault("nbFrames", 1)
+    message.setdefault("computedLocation", [])
+    message.setdefault("rinfos", [])
+
+    return str(dev_id), DeviceMessage(**message)
+
+
+class CallbackServer:
+    """
+    Embeddable asyncio HTTP endpoint receiving Sigfox data callbacks.
+
+    Each POST body (one callback object or a list of them) is queued as-is on a bounded
+    queue and answered 202 right away, or 400 when it is not JSON or a callback has no integer time; when the queue stays full for enqueue_timeout
+    seconds the request is answered 503 with Retry-After so the sender backs off. A single
+    consumer task drains the queue in batches of up to batch_size payloads, validates them
+    into DeviceMessage objects, groups them per device (oldest first) and hands them to the
+    same sinks as MessagePoller. Sinks run in the default executor so a blocking sink never
+    stalls the event loop.
+
+    Callbacks are acknowledged before delivery, so Sigfox never resends them: a failed delivery
+    is retried max_retries times with exponential backoff, holding its queue slot meanwhile so
+    new callbacks are answered 503 while the sink is down. A batch still failing then goes to
+    the dead_letter sink, or is counted as failed when there is none.
+    """
+
+    def __init__(
+        self,
+        sink: SinkLike,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        path: str = DEFAULT_CALLBACK_PATH,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        enqueue_timeout: float = 1.0,
+        auth_token: Optional[str] = None,
+        max_body: int = DEFAULT_MAX_BODY,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_delay: float = 0.5,
+        dead_letter: Optional[SinkLike] = None,
+        max_errors: int = DEFAULT_MAX_ERRORS,
+    ):
+        """
+        :param sink: MessageSink, queue.Queue or callable(dev_id, messages) receiving the messages
+        :param host: interface to listen on
+        :param port: TCP port; 0 picks a free one (see the port attribute once started)
+        :param path: URL path accepting callbacks
+        :param max_queue: maximum number of callback bodies waiting for validation
+        :param batch_size: maximum number of callback messages validated and delivered together
+        :param enqueue_timeout: seconds a request waits for room in a full queue before being answered 503
+        :param auth_token: if set, requests must send this value in the Authorization header
+        :param max_body: maximum accepted body size in bytes
+        :param max_retries: delivery attempts after the first failed one, per device batch
+        :param retry_delay: seconds before the first retry, doubled after each further failure
+        :param dead_letter: MessageSink, queue.Queue or callable(dev_id, messages) receiving the batches
+        whose delivery kept failing
+        :param max_errors: number of most recent delivery errors kept in errors
+        """
+        self.sink = as_sink(sink)
+        self.host = host
+        self.port = port
+        self.path = path
+        self.batch_size = batch_size
+        self.enqueue_timeout = enqueue_timeout
+        self.auth_token = auth_token
+        self.max_body = max_body
+        self.max_queue = max_queue
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.dead_letter = as_sink(dead_letter) if dead_letter is not None else None
+        self.stats = {
+            "received": 0,
+            "delivered": 0,
+            "invalid": 0,
+            "rejected": 0,
+            "retried": 0,
+            "dead_lettered": 0,
+            "failed": 0,
+        }
+        # (dev_id, exception) of the most recent failed deliveries
+        self.errors: Deque[Tuple[str, Exception]] = deque(maxlen=max_errors)
+        self._queue: Optional[asyncio.Queue] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._consumer: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """
+        Start listening and consuming callbacks.
+        """
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._consumer = asyncio.ensure_future(self._consume())
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """
+        Stop accepting requests, deliver every queued callback, then stop the consumer.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._consumer is not None:
+            await self._queue.join()
+            self._consumer.cancel()
+            try:
+                await self._consumer
+            except asyncio.CancelledError:
+                pass
+            self._consumer = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Serve the HTTP/1.1 requests of one connection.
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length") or 0)
+                if length > self.max_body:
+                    await self._respond(writer, 413, close=True)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                status, extra = await self._dispatch(method, target, headers, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                await self._respond(writer, status, extra, close=not keep_alive)
+                if not keep_alive:
+                    break
+        except (ValueError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method: str, target: str, headers: dict, body: bytes):
+        """
+        :return: (HTTP status, extra response headers)
+        """
+        if target.split("?", 1)[0] != self.path:
+            return 404, {}
+        if method != "POST":
+            return 405, {"Allow": "POST"}
+        if (
+            self.auth_token is not None
+            and headers.get("authorization") != self.auth_token
+        ):
+            return 401, {}
+
+        try:
+            payload = json_backend.loads(body)
+        except ValueError:
+            return 400, {}
+        items = payload if isinstance(payload, list) else [payload]
+        # a message without its time would poison the cursors and deduplication of the sinks
+        try:
+            for item in items:
+                _callback_time(item.get("time"))
+        except (ValueError, AttributeError):
+            self.stats["invalid"] += len(items)
+            return 400, {}
+
+        try:
+            await asyncio.wait_for(self._queue.put(items), timeout=self.enqueue_timeout)
+        except asyncio.TimeoutError:
+            self.stats["rejected"] += len(items)
+            return 503, {"Retry-After": "1"}
+
+        self.stats["received"] += len(items)
+        return 202, {}
+
+    @staticmethod
+    async def _respond(
+        writer: asyncio.StreamWriter,
+        status: int,
+        headers: Optional[dict] = None,
+        close=False,
+    ):
+        lines = [f"HTTP/1.1 {status} {_REASONS.get(status, '')}", "Content-Length: 0"]
+        lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+        if close:
+            lines.append("Connection: close")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+
+    async def _consume(self) -> None:
+        """
+        Drain the queue in batches, validate them and deliver them per device.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            bodies = [await self._queue.get()]
+            size = len(bodies[0])
+            while size < self.batch_size and not self._queue.empty():
+                bodies.append(self._queue.get_nowait())
+                size += len(bodies[-1])
+
+            try:
+                per_device: "OrderedDict[str, List[DeviceMessage]]" = OrderedDict()
+                for items in bodies:
+                    for item in items:
+                        try:
+                            dev_id, message = parse_callback_message(item)
+                        except (ValueError, TypeError, AttributeError):
+                            self.stats["invalid"] += 1
+                            continue
+                        per_device.setdefault(dev_id, []).append(message)
+
+                for dev_id, messages in per_device.items():
+                    messages.sort(key=lambda m: (m.time, m.seqNumber))
+                    await self._deliver(loop, dev_id, messages)
+            finally:
+                for _ in bodies:
+                    self._queue.task_done()
+
+    async def _deliver(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        dev_id: str,
+        messages: List[DeviceMessage],
+    ) -> None:
+        """
+        Deliver one device batch, retrying with backoff, then falling back to the dead-letter sink.
+        """
+        delay = self.retry_delay
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.stats["retried"] += 1
+                await asyncio.sleep(delay)
+                delay *= 2
+            try:
+                await loop.run_in_executor(None, self.sink.deliver, dev_id, messages)
+            except Exception as exc:
+                self.errors.append((dev_id, exc))
+                continue
+            self.stats["delivered"] += len(messages)
+            return
+
+        if self.dead_letter is not None:
+            try:
+                await loop.run_in_executor(
+                    None, self.dead_letter.deliver, dev_id, messages
+                )
+            except Exception as exc:
+                self.errors.append((dev_id, exc))
+            else:
+                self.stats["dead_lettered"] += len(messages)
+                return
+        self.stats["failed"] += len(messages)
@@ -0,0 +1,426 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import requests
+
+from sigfox_manager.models.results import BatchResult
+from sigfox_manager.models.schemas import Device, DeviceMessage, DeviceMessageStats
+from sigfox_manager.sigfox_manager import SigfoxManager
+from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+    SigfoxAPIException,
+)
+from sigfox_manager.utils.concurrency import bounded_map_unordered
+from sigfox_manager.utils.http_utils import DEFAULT_POOL_MAXSIZE
+from sigfox_manager.utils.poll_schedule import (
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+    DEFAULT_POLLS_PER_MESSAGE,
+    SECONDS_PER_DAY,
+    base_interval,
+    fit_budget,
+    message_rate,
+)
+from sigfox_manager.utils.sinks import SinkLike, as_sink
+
+# Number of recent seqNumbers remembered per device to drop replayed messages
+DEFAULT_SEQ_WINDOW = 32
+
+
+class DeviceCursor:
+    """
+    High-water mark of the messages already delivered for one device.
+    """
+
+    def __init__(
+        self, time: int, seq_number: Optional[int] = None, recent: Iterable[int] = ()
+    ):
+        """
+        :param time: epoch ms of the newest delivered message, or the polling start for a new device
+        :param seq_number: seqNumber of the newest delivered message
+        :param recent: seqNumbers of the most recently delivered messages
+        """
+        self.time = time
+        self.seq_number = seq_number
+        self.recent = deque(recent, maxlen=DEFAULT_SEQ_WINDOW)
+
+    def is_new(self, message: DeviceMessage) -> bool:
+        """
+        :param message: polled message
+        :return: True if the message is past the high-water mark and its seqNumber was not delivered recently
+        """
+        if message.seqNumber in self.recent:
+            return False
+        if message.time != self.time:
+            return message.time > self.time
+
+        # Same millisecond as the mark: only messages not delivered yet
+        return self.seq_number is None or message.seqNumber != self.seq_number
+
+    def advance(self, messages: List[DeviceMessage]) -> None:
+        """
+        :param messages: delivered messages, oldest first
+        """
+        for message in messages:
+            self.recent.append(message.seqNumber)
+        newest = messages[-1]
+        self.time, self.seq_number = newest.time, newest.seqNumber
+
+    def to_dict(self) -> dict:
+        return {
+            "time": self.time,
+            "seqNumber": self.seq_number,
+            "recent": list(self.recent),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DeviceCursor":
+        return cls(data["time"], data.get("seqNumber"), data.get("recent") or ())
+
+
+class MessagePoller:
+    """
+    Polls the messages of many devices and delivers only the new ones.
+
+    Each device keeps a high-water mark (time and seqNumber of the newest delivered message);
+    a poll asks the API for messages since that time, drops the ones already delivered
+    (including replays of a recent seqNumber) and hands the rest to the sink, oldest first.
+    Devices are polled concurrently through the manager's pooled transport, while delivery
+    and state updates happen on the calling thread. The marks are only advanced after a
+    successful delivery (at-least-once) and can be persisted to a JSON file across restarts.
+    """
+
+    def __init__(
+        self,
+        manager: SigfoxManager,
+        dev_ids: Iterable[str],
+        sink: SinkLike,
+        state_path: Optional[str] = None,
+        max_concurrency: int = DEFAULT_POOL_MAXSIZE,
+        initial_since: Optional[int] = None,
+    ):
+        """
+        :param manager: SigfoxManager used for the requests
+        :param dev_ids: Sigfox IDs of the devices to poll
+        :param sink: MessageSink, queue.Queue or callable(dev_id, messages) receiving the new messages
+        :param state_path: JSON file persisting the high-water marks; loaded if it exists
+        :param max_concurrency: maximum number of devices polled at once
+        :param initial_since: epoch ms from which devices without a high-water mark are polled; defaults to now
+        """
+        self.manager = manager
+        self.sink = as_sink(sink)
+        self.state_path = state_path
+        self.max_concurrency = max_concurrency
+        self.initial_since = initial_since
+        self.dev_ids: List[str] = []
+        self._polled: Set[str] = set()
+        self.cursors: Dict[str, DeviceCursor] = {}
+        self._stop = threading.Event()
+        if state_path is not None:
+            self.load_state()
+        self.add_devices(dev_ids)
+
+    def add_devices(self, dev_ids: Iterable[str]) -> None:
+        """
+        Start polling more devices; devices already polled are ignored.
+        :param dev_ids: Sigfox IDs of the devices
+        """
+        start = (
+            self.initial_since
+            if self.initial_since is not None
+            else int(time.time() * 1000)
+        )
+        for dev_id in dev_ids:
+            if dev_id not in self.cursors:
+                self.cursors[dev_id] = DeviceCursor(start)
+            if dev_id not in self._polled:
+                self._polled.add(dev_id)
+                self.dev_ids.append(dev_id)
+
+    def remove_devices(self, dev_ids: Iterable[str]) -> None:
+        """
+        Stop polling devices and forget their high-water marks.
+        :param dev_ids: Sigfox IDs of the devices
+        """
+        removed = set(dev_ids)
+        self.dev_ids = [d for d in self.dev_ids if d not in removed]
+        self._polled -= removed
+        for dev_id in removed:
+            self.cursors.pop(dev_id, None)
+
+    def high_water_mark(self, dev_id: str) -> Optional[Tuple[int, Optional[int]]]:
+        """
+        :param dev_id: Sigfox ID of the device
+        :return: (time, seqNumber) of the newest delivered message, or None for an unknown device
+        """
+        cursor = self.cursors.get(dev_id)
+        return (cursor.time, cursor.seq_number) if cursor is not None else None
+
+    def _fetch_new(self, dev_id: str) -> List[DeviceMessage]:
+        """
+        Fetch the messages of a device past its high-water mark.
+        :param dev_id: Sigfox ID of the device
+        :return: new messages, oldest first
+        :raises SigfoxAPIException: if a page could not be fetched, so the mark never skips messages
+        """
+        cursor = self.cursors[dev_id]
+        messages = self.manager.iter_device_messages(dev_id, since=cursor.time)
+        new = [m for m in messages if cursor.is_new(m)]
+        if not messages.complete:
+            raise SigfoxAPIException(
+                status_code=502, message=f"Message listing of {dev_id} was interrupted."
+            )
+        new.reverse()
+
+        return new
+
+    def poll_once(self, dev_ids: Optional[Iterable[str]] = None) -> BatchResult:
+        """
+        Poll devices once, deliver their new messages and persist the high-water marks.
+        :param dev_ids: devices to poll; defaults to every device of the poller
+        :return: BatchResult mapping each device to the number of messages delivered, with per-device errors
+        """
+        targets = [
+            d
+            for d in (self.dev_ids if dev_ids is None else dev_ids)
+            if d in self.cursors
+        ]
+        batch = BatchResult()
+
+        for dev_id, messages, error in bounded_map_unordered(
+            self._fetch_new,
+            targets,
+            self.max_concurrency,
+            capture=(SigfoxAPIException, requests.RequestException, ValueError),
+        ):
+            if error is not None:
+                batch.errors[dev_id] = error
+                continue
+            if messages:
+                try:
+                    self.sink.deliver(dev_id, messages)
+                except Exception as exc:
+                    # Not delivered: keep the mark so the messages are polled again
+                    batch.errors[dev_id] = exc
+                    continue
+                self.cursors[dev_id].advance(messages)
+            batch.results[dev_id] = len(messages)
+
+        if self.state_path is not None:
+            self.save_state()
+
+        return batch
+
+    def run(self, interval: float, max_cycles: Optional[int] = None) -> None:
+        """
+        Poll every device every `interval` seconds until stop() is called.
+        :param interval: seconds between the start of two polling cycles
+        :param max_cycles: stop after this many cycles; None runs until stop()
+        """
+        self._stop.clear()
+        cycles = 0
+        while not self._stop.is_set():
+            started = time.monotonic()
+            self.poll_once()
+            cycles += 1
+            if max_cycles is not None and cycles >= max_cycles:
+                break
+            self._stop.wait(max(0.0, interval - (time.monotonic() - started)))
+
+    def stop(self) -> None:
+        """
+        Ask run() to return after the current cycle.
+        """
+        self._stop.set()
+
+    def save_state(self) -> None:
+        """
+        Atomically write the high-water marks to state_path.
+        """
+        state = {"devices": {d: c.to_dict() for d, c in self.cursors.items()}}
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.state_path)
+
+    def load_state(self) -> None:
+        """
+        Restore the high-water marks saved in state_path, if the file exists.
+        """
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return
+
+        for dev_id, data in state.get("devices", {}).items():
+            self.cursors[dev_id] = DeviceCursor.from_dict(data)
+
+
+class AdaptivePollScheduler:
+    """
+    Gives each device of a MessagePoller its own polling interval, scaled with its traffic.
+
+    Message rates come from get_device_message_number (lastDay, then lastWeek, then lastMonth),
+    refreshed every stats_max_age seconds. Devices without traffic back off with the time since
+    their last communication, taken from Device.lastCom (observe_devices) or from the newest
+    message delivered by the poller. When the resulting schedule, including the metric requests,
+    exceeds requests_per_hour, every interval is stretched by the same factor.
+    """
+
+    def __init__(
+        self,
+        poller: MessagePoller,
+        requests_per_hour: Optional[float] = None,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        polls_per_message: float = DEFAULT_POLLS_PER_MESSAGE,
+        stats_max_age: float = SECONDS_PER_DAY,
+    ):
+        """
+        :param poller: MessagePoller whose devices are scheduled
+        :param requests_per_hour: global budget of API requests per hour; None disables it
+        :param min_interval: shortest polling interval in seconds
+        :param max_interval: longest polling interval in seconds before the budget is applied
+        :param polls_per_message: polls per expected message interval of a device
+        :param stats_max_age: seconds after which the message metrics are fetched again
+        """
+        self.poller = poller
+        self.requests_per_hour = requests_per_hour
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.polls_per_message = polls_per_message
+        self.stats_max_age = stats_max_age
+        self.stats: Dict[str, DeviceMessageStats] = {}
+        self.last_com: Dict[str, int] = {}
+        self.intervals: Dict[str, float] = {}
+        self.next_due: Dict[str, float] = {}
+        self._stats_loaded_at: Optional[float] = None
+        self._stop = threading.Event()
+
+    def observe_devices(self, devices: Iterable[Device]) -> None:
+        """
+        Record the lastCom of devices already at hand, e.g. from get_devices_by_contract or a FleetStore.
+        :param devices: Device objects
+        """
+        for device in devices:
+            if device.lastCom is not None:
+                self.last_com[device.id] = max(
+                    device.lastCom, self.last_com.get(device.id, 0)
+                )
+
+    def refresh_rates(self, now: Optional[float] = None) -> BatchResult:
+        """
+        Fetch the message metrics of every device concurrently and recompute the intervals.
+        :param now: current epoch time in seconds; defaults to time.time()
+        :return: BatchResult mapping each device to its DeviceMessageStats, with per-device errors
+        """
+        batch = BatchResult()
+        for dev_id, stats, error in bounded_map_unordered(
+            self.poller.manager.get_device_message_number,
+            list(self.poller.dev_ids),
+            self.poller.max_concurrency,
+            capture=(SigfoxAPIException, requests.RequestException, ValueError),
+        ):
+            if error is not None:
+                batch.errors[dev_id] = error
+            else:
+                self.stats[dev_id] = batch.results[dev_id] = stats
+
+        self._stats_loaded_at = time.time() if now is None else now
+        self.recompute(now)
+
+        return batch
+
+    def recompute(self, now: Optional[float] = None) -> Dict[str, float]:
+        """
+        Recompute every device's interval from its message rate and last communication, within the budget.
+        Devices never polled are due immediately; a device whose interval shrank is brought forward.
+        :param now: current epoch time in seconds; defaults to time.time()
+        :return: interval in seconds per device
+        """
+        now = time.time() if now is None else now
+        base = {}
+        for dev_id in self.poller.dev_ids:
+            last_com = self.last_com.get(dev_id)
+            cursor = self.poller.cursors.get(dev_id)
+            if cursor is not None and cursor.seq_number is not None:
+                last_com = max(cursor.time, last_com or 0)
+            base[dev_id] = base_interval(
+                message_rate(self.stats.get(dev_id)),
+                None if last_com is None else max(0.0, now - last_com / 1000.0),
+                self.min_interval,
+                self.max_interval,
+                self.polls_per_message,
+            )
+
+        budget = self.requests_per_hour
+        if budget is not None:
+            # The metric refreshes are paid from the same budget
+            budget = max(budget - len(base) * 3600.0 / self.stats_max_age, 1.0)
+        self.intervals = fit_budget(base, budget)
+
+        for dev_id, interval in self.intervals.items():
+            due = self.next_due.get(dev_id)
+            self.next_due[dev_id] = now if due is None else min(due, now + interval)
+
+        return self.intervals
+
+    def due(self, now: Optional[float] = None) -> List[str]:
+        """
+        :param now: current epoch time in seconds; defaults to time.time()
+        :return: devices whose next poll is due, most overdue first
+        """
+        now = time.time() if now is None else now
+        due = [d for d in self.poller.dev_ids if self.next_due.get(d, now) <= now]
+
+        return sorted(due, key=lambda d: self.next_due.get(d, now))
+
+    def run_once(self, now: Optional[float] = None) -> BatchResult:
+        """
+        Poll the devices that are due and schedule their next poll.
+        :param now: current epoch time in seconds; defaults to time.time()
+        :return: BatchResult of MessagePoller.poll_once for the polled devices
+        """
+        now = time.time() if now is None else now
+        if (
+            self._stats_loaded_at is None
+            or now - self._stats_loaded_at >= self.stats_max_age
+        ):
+            self.refresh_rates(now)
+
+        due = self.due(now)
+        batch = self.poller.poll_once(due) if due else BatchResult()
+        if any(batch.results.values()):
+            # New messages move the devices' last communication forward
+            self.recompute(now)
+        for dev_id in due:
+            self.next_due[dev_id] = now + self.intervals.get(dev_id, self.max_interval)
+
+        return batch
+
+    def run(self, max_cycles: Optional[int] = None) -> None:
+        """
+        Poll devices as they become due until stop() is called.
+        :param max_cycles: stop after this many polling rounds; None runs until stop()
+        """
+        self._stop.clear()
+        cycles = 0
+        while not self._stop.is_set():
+            self.run_once()
+            cycles += 1
+            if max_cycles is not None and cycles >= max_cycles:
+                break
+            next_due = min(
+                self.next_due.values(), default=time.time() + self.min_interval
+            )
+            self._stop.wait(max(0.0, next_due - time.time()))
+
+    def stop(self) -> None:
+        """
+        Ask run() to return after the current round.
+        """
+        self._stop.set()
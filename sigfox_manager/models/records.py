@@ -0,0 +1,107 @@
+from collections import namedtuple
+from typing import Any, Dict, List, Optional, Tuple
+
+from sigfox_manager.models.schemas import Paging
+
+
+def get_field(item: Any, name: str) -> Any:
+    """
+    Read one field from an item in any parse mode.
+    :param item: decoded JSON dict ("raw"), Record ("records") or pydantic model
+    :param name: field name
+    :return: value of the field, None when absent
+    """
+    if isinstance(item, dict):
+        return item.get(name)
+
+    return getattr(item, name, None)
+
+
+class Record:
+    """
+    Compact read-only view of one API item: a named tuple with one field per top-level field of its model.
+
+    Nested values (group, rinfos, token, ...) are kept as the plain dicts and lists decoded from
+    the JSON, so building a record costs one tuple and no validation. Fields missing from the
+    JSON read as None. Record classes are created by record_class, e.g. DeviceRecord for Device.
+    """
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+    _model = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Record":
+        """
+        :param data: decoded JSON object of one item
+        :return: record holding its fields
+        """
+        return tuple.__new__(cls, map(data.get, cls._fields))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        :return: dict of the fields that are set
+        """
+        return {
+            name: value for name, value in zip(self._fields, self) if value is not None
+        }
+
+    def __reduce__(self):
+        # Record classes are created at runtime, so pickle the model they mirror instead
+        return _rebuild_record, (self._model, self.to_dict())
+
+
+_record_classes: Dict[type, type] = {}
+
+
+def record_class(model: type) -> type:
+    """
+    Record class with the top-level fields of a pydantic model, created once per model.
+    :param model: pydantic model class, e.g. Device
+    :return: Record named tuple class named after the model, e.g. DeviceRecord
+    """
+    cls = _record_classes.get(model)
+    if cls is None:
+        fields = getattr(model, "model_fields", None)
+        if fields is None:
+            fields = model.__fields__
+        name = f"{model.__name__}Record"
+        cls = type(
+            name,
+            (namedtuple(name, list(fields)), Record),
+            {"__slots__": (), "_model": model, "__module__": __name__},
+        )
+        _record_classes[model] = cls
+
+    return cls
+
+
+def _rebuild_record(model: type, data: Dict[str, Any]) -> Record:
+    return record_class(model).from_dict(data)
+
+
+class RecordPage:
+    """
+    Listing returned in "raw" or "records" parse mode, shaped like the listing response models.
+    data holds plain dicts ("raw") or Record objects ("records").
+    """
+
+    __slots__ = ("data", "paging", "complete")
+
+    def __init__(
+        self, data: List[Any], paging: Optional[Paging] = None, complete: bool = True
+    ):
+        """
+        :param data: items of the listing
+        :param paging: paging of the listing; paging.next is the page to resume from when complete is False
+        :param complete: False when the listing was not read to the end
+        """
+        self.data = data
+        self.paging = paging if paging is not None else Paging()
+        self.complete = complete
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return f"RecordPage(items={len(self.data)}, next={self.paging.next!r}, complete={self.complete})"
@@ -0,0 +1,119 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class BatchResult:
+    """
+    Outcome of a batch operation: successful results and per-key failures.
+    """
+
+    results: Dict[Any, Any] = field(default_factory=dict)
+    errors: Dict[Any, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """True when every key of the batch succeeded."""
+        return not self.errors
+
+
+@dataclass
+class ProvisioningRowResult:
+    """
+    Outcome of one row of a bulk provisioning run.
+    status is "created", "conflict" (SigfoxDeviceCreateConflictException), "invalid" (bad dev_id/pac or
+    unknown device type), "failed" (any other API or transport error) or, for bulk creation jobs that
+    did not finish in time, "pending" (job_id identifies the job to check later).
+    """
+
+    index: int
+    dev_id: Optional[str]
+    status: str
+    device: Optional[Any] = None
+    error: Optional[Exception] = None
+    job_id: Optional[str] = None
+
+
+@dataclass
+class ProvisioningReport:
+    """
+    Per-row report of a bulk provisioning run, ordered like the input rows.
+    """
+
+    rows: List[ProvisioningRowResult] = field(default_factory=list)
+
+    def with_status(self, status: str) -> List[ProvisioningRowResult]:
+        """
+        :param status: one of "created", "conflict", "invalid", "failed", "pending"
+        :return: rows with the given status
+        """
+        return [row for row in self.rows if row.status == status]
+
+    @property
+    def created(self) -> List[ProvisioningRowResult]:
+        return self.with_status("created")
+
+    @property
+    def conflicts(self) -> List[ProvisioningRowResult]:
+        return self.with_status("conflict")
+
+    @property
+    def invalid(self) -> List[ProvisioningRowResult]:
+        return self.with_status("invalid")
+
+    @property
+    def failed(self) -> List[ProvisioningRowResult]:
+        return self.with_status("failed")
+
+    @property
+    def pending(self) -> List[ProvisioningRowResult]:
+        return self.with_status("pending")
+
+
+@dataclass
+class SyncEvent:
+    """
+    One change found by an incremental fleet sync.
+    kind is "added", "changed" or "removed"; entity is "contract" or "device". record holds the
+    new ContractDetail/Device, or None for removals.
+    """
+
+    kind: str
+    entity: str
+    id: str
+    contract_id: Optional[str] = None
+    record: Optional[Any] = None
+
+
+@dataclass
+class SyncReport:
+    """
+    Result of an incremental fleet sync cycle.
+    high_water_marks maps each synced listing ("contracts", "devices:<contract id>") to the highest
+    lastEditionTime seen; incomplete lists the contracts whose device listing could not be read to the
+    end and were left untouched.
+    """
+
+    events: List[SyncEvent] = field(default_factory=list)
+    high_water_marks: Dict[str, Optional[int]] = field(default_factory=dict)
+    incomplete: List[str] = field(default_factory=list)
+    errors: Dict[str, Exception] = field(default_factory=dict)
+
+    def with_kind(self, kind: str) -> List[SyncEvent]:
+        """
+        :param kind: one of "added", "changed", "removed"
+        :return: events of the given kind
+        """
+        return [event for event in self.events if event.kind == kind]
+
+    @property
+    def added(self) -> List[SyncEvent]:
+        return self.with_kind("added")
+
+    @property
+    def changed(self) -> List[SyncEvent]:
+        return self.with_kind("changed")
+
+    @property
+    def removed(self) -> List[SyncEvent]:
+        return self.with_kind("removed")
@@ -63,12 +63,20 @@ class ContractDetail(BaseModel):
 
 
 class Paging(BaseModel):
+    """
+    Paging of a listing response. The listing's complete flag is False when it was not read to the
+    end; next then points at the page to resume from, and skip counts the items of that page already
+    returned when the listing was cut in the middle of it.
+    """
+
     next: Optional[str] = None
+    skip: int = 0
 
 
 class ContractsResponse(BaseModel):
     data: List[ContractDetail]
     paging: Paging
+    complete: bool = True
 
 
 class ContractBrief(BaseModel):
@@ -148,11 +156,13 @@ class Device(BaseModel):
 class DevicesResponse(BaseModel):
     data: List[Device]
     paging: Paging
+    complete: bool = True
 
 
 class DeviceTypesResponse(BaseModel):
     data: List[DeviceType]
     paging: Paging
+    complete: bool = True
 
 
 class BaseDevice(BaseModel):
@@ -269,6 +279,7 @@ class DeviceMessage(BaseModel):
 class DeviceMessagesResponse(BaseModel):
     data: List[DeviceMessage]
     paging: Paging
+    complete: bool = True
 
 
 class DeviceMessageStats(BaseModel):
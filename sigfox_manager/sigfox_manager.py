@@ -1,8 +1,12 @@
 from base64 import b64encode
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Callable, Optional, Iterable, Iterator, Tuple, Union
 import re
+import threading
+import time
+from urllib.parse import urlencode
 
-import json
+import requests
 
 from sigfox_manager.models.schemas import (
     ContractsResponse,
@@ -12,6 +16,14 @@ from sigfox_manager.models.schemas import (
     DeviceMessageStats,
     BaseDevice,
     DeviceTypesResponse,
+    Paging,
+)
+from sigfox_manager.models.results import (
+    BatchResult,
+    ProvisioningReport,
+    ProvisioningRowResult,
+    SyncEvent,
+    SyncReport,
 )
 from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
     SigfoxAPIException,
@@ -19,125 +31,877 @@ from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
     SigfoxAuthError,
     SigfoxDeviceCreateConflictException,
     SigfoxDeviceTypeNotFoundException,
+    SigfoxBulkDeviceError,
+    SigfoxBulkAuthError,
+    SigfoxTimeoutError,
+    SigfoxIncompleteBackfillError,
+)
+from sigfox_manager.utils.http_utils import (
+    do_get,
+    do_post,
+    HttpTransport,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_TIMEOUT,
+    Timeout,
+)
+from sigfox_manager.utils.checkpoint import PaginationCheckpoint
+from sigfox_manager.utils.concurrency import bounded_map_unordered
+from sigfox_manager.utils.device_table import DeviceTable
+from sigfox_manager.utils.device_type_catalog import DeviceTypeCatalog
+from sigfox_manager.utils.pagination import PageIterator
+from sigfox_manager.utils.fleet_store import FleetStore
+from sigfox_manager.utils.json_backend import response_json
+from sigfox_manager.models.records import RecordPage
+from sigfox_manager.utils.model_builder import (
+    MODEL_PARSE_MODES,
+    PARSE_RAW,
+    PARSE_VALIDATE,
+    build_model,
+    check_parse_mode,
 )
-from sigfox_manager.utils.http_utils import do_get, do_post
+from sigfox_manager.utils.response_cache import ResponseCache
+from sigfox_manager.utils.single_flight import SingleFlight
+from sigfox_manager.utils.rate_limit import (
+    RetryPolicy,
+    TokenBucket,
+    DEFAULT_MAX_RETRIES,
+)
+
+DEV_ID_PATTERN = re.compile(r"^[0-9A-F]{3,16}$")
+PAC_PATTERN = re.compile(r"^[0-9A-Za-z]{16}$")
+
+DEFAULT_API_URL = "https://api.sigfox.com/v2"
+DEFAULT_BULK_CHUNK_SIZE = 5000
+DEFAULT_DEVICE_TYPE_CACHE_TTL = 300.0
+
+
+def validate_provisioning_inputs(dev_id: str, pac: str) -> None:
+    """
+    Validate the device id and PAC formats expected by the provisioning helpers.
+    :param dev_id: Sigfox device ID (uppercase hex, 3-16 chars)
+    :param pac: PAC code (16-char alphanumeric)
+    :raises ValueError: if dev_id or pac format is invalid
+    """
+    # Validate dev_id: uppercase hex (3..16 chars)
+    if not DEV_ID_PATTERN.match(dev_id):
+        raise ValueError(
+            f"Invalid dev_id format: {dev_id}. Must be uppercase hex, 3-16 characters."
+        )
+
+    # Validate pac: 16-char alphanumeric
+    if not PAC_PATTERN.match(pac):
+        raise ValueError(
+            f"Invalid pac format: {pac}. Must be 16 alphanumeric characters."
+        )
+
+
+def build_create_device_kwargs(
+    dev_id: str, pac: str, dev_type_id: str, name: Optional[str], options: dict
+) -> dict:
+    """
+    Map provisioning inputs to create_device keyword arguments, applying create_device's defaults.
+    :param dev_id: Sigfox device ID
+    :param pac: PAC code
+    :param dev_type_id: resolved device type id
+    :param name: optional device name; dev_id is used when empty
+    :param options: optional create_device parameters (activable, lat, lng, product_cert, prototype,
+    automatic_renewal); other keys are ignored
+    :return: keyword arguments for create_device
+    """
+    return dict(
+        dev_id=dev_id,
+        pac=pac,
+        dev_type_id=dev_type_id,
+        name=name if name else dev_id,  # Use dev_id as name if not provided
+        activable=options.get("activable", True),
+        lat=options.get("lat", 0.0),
+        lng=options.get("lng", 0.0),
+        product_cert=options.get("product_cert", None),
+        prototype=options.get("prototype", False),
+        automatic_renewal=options.get("automatic_renewal", True),
+    )
 
 
 class SigfoxManager:
-    def __init__(self, user, pwd):
+    def __init__(
+        self,
+        user,
+        pwd,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        transport: Optional[HttpTransport] = None,
+        device_type_cache_ttl: Optional[float] = DEFAULT_DEVICE_TYPE_CACHE_TTL,
+        api_url: str = DEFAULT_API_URL,
+        rate_limit: Optional[float] = None,
+        rate_burst: Optional[float] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        response_cache: Optional[ResponseCache] = None,
+        store: Optional[FleetStore] = None,
+        store_max_age: Optional[float] = None,
+        parse_mode: str = PARSE_VALIDATE,
+    ):
+        """
+        :param user: Sigfox API login
+        :param pwd: Sigfox API password
+        :param pool_connections: number of per-host connection pools kept by the shared transport
+        :param pool_maxsize: maximum number of keep-alive connections per host
+        :param transport: optional pre-built HttpTransport to share between several managers; close() leaves it open
+        :param device_type_cache_ttl: seconds the device-type catalog used by resolve_device_type_id stays cached;
+        None caches it until invalidate_device_type_catalog() is called, 0 disables caching
+        :param api_url: base URL of the Sigfox API v2, e.g. to target a local stand-in server
+        :param rate_limit: maximum sustained requests per second across every call of the manager; None disables it
+        :param rate_burst: number of requests that may be sent back to back before rate_limit applies
+        :param max_retries: retries of a request answered with 429 or 5xx, honouring Retry-After
+        (ignored when transport is given)
+        :param timeout: (connect, read) timeouts in seconds of every request, or one value for both
+        (ignored when transport is given)
+        :param response_cache: optional ResponseCache serving get_device_info, get_device_message_number,
+        get_contracts and get_device_types; None disables response caching
+        :param store: optional FleetStore mirroring contracts, devices and device types; complete listings and
+        device reads are answered from it while fresh
+        :param store_max_age: seconds a mirrored listing or device stays fresh; None trusts the store until
+        refresh_store() or a write invalidates it
+        :param parse_mode: how responses become models: "validate" (default) runs full pydantic validation,
+        "trusted" builds them from the API JSON without validating it. Listing and message methods accept a
+        per-call parse_mode overriding it, which may also be "raw" (plain dicts) or "records" (compact Record
+        objects) to skip model construction entirely
+        """
         self.user = user
         self.pwd = pwd
         self.auth = b64encode(f"{self.user}:{self.pwd}".encode("utf-8")).decode("ascii")
         self.devs_page = None
+        self.api_url = api_url.rstrip("/")
+        # Only a transport created here is closed by close()
+        self._owns_transport = transport is None
+        if transport is None:
+            transport = HttpTransport(
+                self.auth.encode("utf-8"),
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                rate_limiter=(
+                    TokenBucket(rate_limit, rate_burst) if rate_limit else None
+                ),
+                retry_policy=RetryPolicy(max_retries=max_retries),
+                timeout=timeout,
+            )
+        self.transport = transport
+        self.device_type_cache_ttl = device_type_cache_ttl
+        self._device_type_catalog: Optional[DeviceTypeCatalog] = None
+        self._device_type_catalog_lock = threading.Lock()
+        # Coalesces identical concurrent reads into one request and one parsed result
+        self._single_flight = SingleFlight()
+        self.response_cache = response_cache
+        self.store = store
+        self.store_max_age = store_max_age
+        self.parse_mode = check_parse_mode(parse_mode, MODEL_PARSE_MODES)
+
+    def close(self) -> None:
+        """
+        Release the pooled connections held by the manager's transport, unless the transport was passed in.
+        """
+        if self._owns_transport:
+            self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _parse_mode(self, parse_mode: Optional[str]) -> str:
+        """
+        :param parse_mode: per-call parse mode, or None for the manager's
+        :return: parse mode to use
+        """
+        return self.parse_mode if parse_mode is None else check_parse_mode(parse_mode)
+
+    def _cached(self, endpoint: str, key, fetch):
+        """
+        Serve a read from the response cache, fetching and storing it on a miss.
+        :param endpoint: cache endpoint name, e.g. "device_info"
+        :param key: identity of the request within the endpoint
+        :param fetch: callable performing the request
+        :return: cached or freshly fetched response
+        """
+        if self.response_cache is None:
+            return fetch()
+
+        response = self.response_cache.get(endpoint, key)
+        if response is None:
+            response = fetch()
+            # Never cache a listing that was cut short by a failed page
+            if getattr(response, "complete", True):
+                self.response_cache.set(endpoint, key, response)
+
+        return response
+
+    def _stored_listing(self, key: str, response_cls, load, save, fetch):
+        """
+        Answer a complete listing from the fleet store while it is fresh, mirroring it after a fetch otherwise.
+        :param key: sync key of the listing in the store, e.g. "contracts"
+        :param response_cls: response model of the listing
+        :param load: callable returning the mirrored items
+        :param save: callable mirroring the fetched items
+        :param fetch: callable fetching the complete listing from the API
+        :return: response_cls instance
+        """
+        if self.store is None:
+            return fetch()
+
+        if self.store.is_fresh(key, self.store_max_age):
+            return response_cls(data=load(), paging=Paging(next=None))
+
+        response = fetch()
+        if response.complete:
+            save(response.data)
+
+        return response
+
+    def _invalidate_device_writes(self, dev_ids: Iterable[str]) -> None:
+        """
+        Drop the cached reads made stale by creating devices.
+        :param dev_ids: ids of the devices created
+        """
+        if self.store is not None:
+            # The new devices are missing from the mirrored contract listings
+            self.store.invalidate("contracts")
+            self.store.invalidate("devices:")
+
+        if self.response_cache is None:
+            return
+
+        for dev_id in dev_ids:
+            self.response_cache.invalidate("device_info", dev_id)
+            self.response_cache.invalidate("device_message_number", dev_id)
+        # Token usage of the contracts changes with every new device
+        self.response_cache.invalidate("contracts")
 
-    def get_contracts(self, fetch_all_pages: bool = True) -> ContractsResponse:
+    def _get(self, url: str):
+        """
+        GET a URL through the shared transport, mapping request timeouts to SigfoxTimeoutError.
+        :param url: URL to fetch
+        :return: HTTP response
+        :raises SigfoxTimeoutError: if the connect or read timeout expires; cursor is set to url
+        """
+        try:
+            return do_get(url, self.auth.encode("utf-8"), transport=self.transport)
+        except requests.Timeout as exc:
+            raise SigfoxTimeoutError(
+                message=f"Request to {url} timed out.", cursor=url
+            ) from exc
+
+    def _post(self, url: str, payload: dict, headers: dict):
+        """
+        POST a JSON payload through the shared transport, mapping request timeouts to SigfoxTimeoutError.
+        :param url: URL to post to
+        :param payload: JSON payload to send
+        :param headers: additional headers to send
+        :return: HTTP response
+        :raises SigfoxTimeoutError: if the connect or read timeout expires; cursor is set to url
+        """
+        try:
+            return do_post(
+                url,
+                payload,
+                self.auth.encode("utf-8"),
+                headers=headers,
+                transport=self.transport,
+            )
+        except requests.Timeout as exc:
+            raise SigfoxTimeoutError(
+                message=f"Request to {url} timed out.", cursor=url
+            ) from exc
+
+    @staticmethod
+    def _deadline_at(deadline: Optional[float]) -> Optional[float]:
+        """
+        :param deadline: operation budget in seconds, or None
+        :return: time.monotonic() value at which the operation expires, or None
+        """
+        return None if deadline is None else time.monotonic() + deadline
+
+    @staticmethod
+    def _await_page(future, deadline_at: Optional[float], url: str):
+        """
+        Wait for a page request, for no longer than the time left before the deadline.
+        :param future: Future of the page request
+        :param deadline_at: time.monotonic() value bounding the walk, or None to wait indefinitely
+        :param url: URL of the page, reported as the cursor to resume from
+        :return: result of the request
+        :raises SigfoxTimeoutError: if the deadline expires before the page arrives
+        """
+        remaining = None
+        if deadline_at is not None:
+            remaining = max(0.0, deadline_at - time.monotonic())
+        try:
+            return future.result(timeout=remaining)
+        except FutureTimeoutError:
+            raise SigfoxTimeoutError(
+                message="Deadline exceeded while paginating.", cursor=url
+            )
+
+    def _first_page(self, get_page, url: str, deadline_at: Optional[float]) -> dict:
+        """
+        Fetch the first page of a walk under the walk's deadline, retries and read timeouts included.
+        :param get_page: callable fetching and decoding one page
+        :param url: page URL
+        :param deadline_at: time.monotonic() value bounding the walk, or None for no limit
+        :return: decoded JSON page
+        :raises SigfoxTimeoutError: if the deadline expires before the page arrives; cursor is set to url
+        """
+        if deadline_at is None:
+            return get_page(url)
+
+        worker = ThreadPoolExecutor(max_workers=1)
+        try:
+            return self._await_page(worker.submit(get_page, url), deadline_at, url)
+        finally:
+            # Never block on a request abandoned at the deadline
+            worker.shutdown(wait=False)
+
+    def _iter_pages(
+        self,
+        data: dict,
+        response_cls,
+        raise_on_auth: bool = False,
+        max_pages: Optional[int] = None,
+        deadline_at: Optional[float] = None,
+        parse_mode: str = PARSE_VALIDATE,
+    ):
+        """
+        Yield parsed pages of a paginated listing with a one-page lookahead.
+        The next page URL is read from the decoded JSON before model validation, so the download of
+        page N+1 runs on a background thread while page N is validated and consumed. When a later page
+        cannot be fetched the iteration stops and the pages obtained so far are kept.
+        :param data: decoded JSON of the first page
+        :param response_cls: response model used to parse each page
+        :param raise_on_auth: if True, a 403 on a later page raises SigfoxAuthError
+        :param max_pages: stop after this many pages without prefetching the next one; None follows every page
+        :param deadline_at: time.monotonic() value after which waiting for a page raises SigfoxTimeoutError
+        :param parse_mode: "validate", "trusted", "raw" or "records", see build_model
+        :return: iterator of parsed response pages
+        :raises SigfoxTimeoutError: with cursor set to the page that could not be fetched in time
+        """
+        pages_left = max_pages
+        prefetcher = ThreadPoolExecutor(max_workers=1)
+        try:
+            while True:
+                next_url = (data.get("paging") or {}).get("next")
+                if pages_left is not None:
+                    pages_left -= 1
+                prefetch = None
+                if next_url and pages_left != 0:
+                    prefetch = prefetcher.submit(self._get, next_url)
+
+                yield build_model(response_cls, data, parse_mode)
+
+                if prefetch is None:
+                    return
+
+                resp = self._await_page(prefetch, deadline_at, next_url)
+
+                if raise_on_auth and resp.status_code == 403:
+                    raise SigfoxAuthError
+                elif resp.status_code != 200:
+                    # If we can't get a page, stop and keep what we have
+                    return
+
+                data = response_json(resp)
+        finally:
+            # Never block on an abandoned lookahead request (early close or deadline)
+            prefetcher.shutdown(wait=False)
+
+    def _collect_pages(
+        self,
+        data: dict,
+        response_cls,
+        raise_on_auth: bool = False,
+        deadline_at: Optional[float] = None,
+        checkpoint: Optional[PaginationCheckpoint] = None,
+        restored: Optional[list] = None,
+        parse_mode: str = PARSE_VALIDATE,
+    ):
+        """
+        Walk every page of a listing and merge them into the first page's response.
+        When a later page cannot be fetched, the response is marked complete=False and its
+        paging.next keeps the URL of that page so the walk can be resumed.
+        :param data: decoded JSON of the first page
+        :param response_cls: response model used to parse each page
+        :param raise_on_auth: if True, a 403 on a later page raises SigfoxAuthError
+        :param deadline_at: time.monotonic() value bounding the whole walk
+        :param checkpoint: optional checkpoint each page is appended to once fetched
+        :param restored: items of the pages fetched before data, e.g. restored from a checkpoint
+        :param parse_mode: "validate", "trusted", "raw" or "records", see build_model
+        :return: response_cls instance holding every item
+        :raises SigfoxTimeoutError: carrying the items fetched so far in `partial` and the resume `cursor`
+        """
+        pages = self._iter_pages(
+            data,
+            response_cls,
+            raise_on_auth=raise_on_auth,
+            deadline_at=deadline_at,
+            parse_mode=parse_mode,
+        )
+        response = next(pages)
+        all_items = list(restored or ())
+        last_page = response
+        try:
+            while True:
+                all_items.extend(last_page.data)
+                next_url = last_page.paging.next if last_page.paging else None
+                if checkpoint is not None:
+                    checkpoint.append(last_page.data, next_url)
+                last_page = next(pages, None)
+                if last_page is None:
+                    break
+        except SigfoxTimeoutError as exc:
+            exc.partial = all_items
+            raise
+
+        response.data = all_items
+        response.paging = Paging(next=next_url)
+        response.complete = next_url is None
+
+        return response
+
+    def _fetch_listing(
+        self,
+        url: str,
+        get_page,
+        response_cls,
+        raise_on_auth: bool = False,
+        deadline_at: Optional[float] = None,
+        checkpoint: Optional[Union[str, PaginationCheckpoint]] = None,
+        parse_mode: str = PARSE_VALIDATE,
+    ):
+        """
+        Fetch every page of a listing, optionally resuming from and recording to a checkpoint.
+        Pages already recorded in the checkpoint are not downloaded again; the checkpoint is
+        removed once the listing has been read to the end.
+        :param url: URL of the first page of the listing
+        :param get_page: callable fetching and decoding one page, raising on a failed first request
+        :param response_cls: response model used to parse each page
+        :param raise_on_auth: if True, a 403 on a later page raises SigfoxAuthError
+        :param deadline_at: time.monotonic() value bounding the whole walk
+        :param checkpoint: PaginationCheckpoint or path of its file; None disables checkpointing
+        :param parse_mode: "validate", "trusted", "raw" or "records", see build_model
+        :return: response_cls instance holding every item, complete=False if a page could not be fetched
+        """
+        if isinstance(checkpoint, str):
+            checkpoint = PaginationCheckpoint(checkpoint)
+
+        state = checkpoint.load(url) if checkpoint is not None else None
+        restored = None
+        if state is None:
+            data = self._first_page(get_page, url, deadline_at)
+            if checkpoint is not None:
+                checkpoint.start(url)
+        else:
+            if state.cursor is None:
+                checkpoint.clear()
+                return build_model(
+                    response_cls,
+                    {"data": state.items, "paging": {"next": None}},
+                    parse_mode,
+                )
+            restored = build_model(
+                response_cls, {"data": state.items, "paging": {}}, parse_mode
+            ).data
+            try:
+                data = self._first_page(get_page, state.cursor, deadline_at)
+            except SigfoxTimeoutError as exc:
+                exc.partial = list(restored)
+                raise
+
+        response = self._collect_pages(
+            data,
+            response_cls,
+            raise_on_auth=raise_on_auth,
+            deadline_at=deadline_at,
+            checkpoint=checkpoint,
+            restored=restored,
+            parse_mode=parse_mode,
+        )
+        if checkpoint is not None and response.complete:
+            checkpoint.clear()
+
+        return response
+
+    def get_contracts(
+        self,
+        fetch_all_pages: bool = True,
+        deadline: Optional[float] = None,
+        checkpoint: Optional[Union[str, PaginationCheckpoint]] = None,
+        parse_mode: Optional[str] = None,
+    ) -> ContractsResponse:
         """
         Get all contracts from Sigfox API the user can see
         :param fetch_all_pages: if True, fetches all pages automatically; if False, returns only first page
+        :param deadline: seconds allowed for the whole pagination walk; None means no limit
+        :param checkpoint: PaginationCheckpoint or file path recording each fetched page; a later call with the
+        same checkpoint resumes after the last recorded page
+        :param parse_mode: "validate", "trusted", "raw" or "records"; None uses the manager's parse_mode
+        :return: ContractsResponse object containing all contracts; complete=False if a page could not be fetched.
+        Served from the response cache or the fleet store when configured and neither deadline nor checkpoint is given
+        :raises SigfoxTimeoutError: if a request times out or the deadline expires; carries partial results and cursor
+        """
+        parse_mode = self._parse_mode(parse_mode)
+        # Plain dicts and records bypass the cache and store, which hold models
+        if deadline is None and checkpoint is None and parse_mode in MODEL_PARSE_MODES:
+
+            def fetch():
+                if not fetch_all_pages:
+                    return self._fetch_contracts(False, parse_mode=parse_mode)
+                return self._stored_listing(
+                    "contracts",
+                    ContractsResponse,
+                    lambda: self.store.get_contracts(),
+                    lambda contracts: self.store.replace_contracts(contracts),
+                    lambda: self._fetch_contracts(True, parse_mode=parse_mode),
+                )
+
+            return self._cached("contracts", fetch_all_pages, fetch)
+
+        return self._fetch_contracts(fetch_all_pages, deadline, checkpoint, parse_mode)
+
+    def _fetch_contracts(
+        self,
+        fetch_all_pages: bool,
+        deadline: Optional[float] = None,
+        checkpoint: Optional[Union[str, PaginationCheckpoint]] = None,
+        parse_mode: str = PARSE_VALIDATE,
+    ) -> ContractsResponse:
+        """
+        Fetch the contracts, see get_contracts.
+        :param fetch_all_pages: if True, fetches all pages automatically; if False, returns only first page
+        :param deadline: seconds allowed for the whole pagination walk; None means no limit
+        :param checkpoint: PaginationCheckpoint or file path recording each fetched page
+        :param parse_mode: "validate", "trusted", "raw" or "records", see build_model
         :return: ContractsResponse object containing all contracts
         """
-        contract_url = "https://api.sigfox.com/v2/contract-infos/"
+        deadline_at = self._deadline_at(deadline)
+        contracts_url = f"{self.api_url}/contract-infos/"
+
+        if not fetch_all_pages:
+            data = self._first_page(
+                self._get_contracts_page, contracts_url, deadline_at
+            )
+            return build_model(ContractsResponse, data, parse_mode)
 
-        resp = do_get(contract_url, self.auth.encode("utf-8"))
+        # Follow paging.next, prefetching each page while the previous one is parsed
+        contracts_response = self._fetch_listing(
+            contracts_url,
+            self._get_contracts_page,
+            ContractsResponse,
+            deadline_at=deadline_at,
+            checkpoint=checkpoint,
+            parse_mode=parse_mode,
+        )
+
+        return contracts_response
+
+    def iter_contracts(
+        self,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        deadline: Optional[float] = None,
+        parse_mode: Optional[str] = None,
+    ) -> PageIterator:
+        """
+        Stream the contracts visible to the user page by page, keeping only one page in memory.
+        :param cursor: page URL to resume from (PageIterator.cursor of a previous iteration); defaults to the first page
+        :param skip: number of items of the cursor page already consumed (PageIterator.skip)
+        :param deadline: seconds allowed for the whole iteration; waiting for a page past it raises SigfoxTimeoutError
+        :param parse_mode: "validate", "trusted", "raw" or "records"; None uses the manager's parse_mode
+        :return: PageIterator yielding ContractDetail objects
+        """
+        parse_mode = self._parse_mode(parse_mode)
+        deadline_at = self._deadline_at(deadline)
+        url = cursor or f"{self.api_url}/contract-infos/"
+        data = self._first_page(self._get_contracts_page, url, deadline_at)
+
+        return PageIterator(
+            self._iter_pages(
+                data,
+                ContractsResponse,
+                deadline_at=deadline_at,
+                parse_mode=parse_mode,
+            ),
+            url,
+            skip=skip,
+        )
+
+    def _get_contracts_page(self, url: str) -> dict:
+        """
+        Fetch and decode one page of contracts.
+        :param url: page URL
+        :return: decoded JSON page
+        """
+        resp = self._get(url)
         if resp.status_code != 200:
             raise SigfoxAPIException(
                 status_code=resp.status_code, message="No Contract data found."
             )
 
-        data = json.loads(resp.text)
-        contracts_response = ContractsResponse(**data)
-        
-        # If pagination is enabled and there are more pages, fetch them all
-        if fetch_all_pages and contracts_response.paging and contracts_response.paging.next:
-            all_contracts = list(contracts_response.data)
-            current_page = contracts_response
-            
-            while current_page.paging and current_page.paging.next:
-                # Extract the next page URL
-                next_url = current_page.paging.next
-                
-                resp = do_get(next_url, self.auth.encode("utf-8"))
-                
-                if resp.status_code != 200:
-                    # If we can't get a page, break and return what we have
-                    break
-                    
-                data = json.loads(resp.text)
-                current_page = ContractsResponse(**data)
-                all_contracts.extend(current_page.data)
-            
-            # Create a new response with all contracts and clear pagination
-            from .models.schemas import Paging
-            contracts_response.data = all_contracts
-            contracts_response.paging = Paging(next=None)
-
-        return contracts_response
+        return response_json(resp)
 
-    def get_devices_by_contract(self, contract_id: str, fetch_all_pages: bool = True) -> DevicesResponse:
+    def get_devices_by_contract(
+        self,
+        contract_id: str,
+        fetch_all_pages: bool = True,
+        deadline: Optional[float] = None,
+        checkpoint: Optional[Union[str, PaginationCheckpoint]] = None,
+        parse_mode: Optional[str] = None,
+    ) -> DevicesResponse:
         """
         Get all the devices associated with a contract ID
         :param contract_id: string containing the contract ID to search for
         :param fetch_all_pages: if True, fetches all pages automatically; if False, returns only first page
-        :return: DevicesResponse object containing the information for all the devices associated with the contract
+        :param deadline: seconds allowed for the whole pagination walk; None means no limit
+        :param checkpoint: PaginationCheckpoint or file path recording each fetched page; a later call with the
+        same checkpoint resumes after the last recorded page
+        :param parse_mode: "validate", "trusted", "raw" or "records"; None uses the manager's parse_mode
+        :return: DevicesResponse object containing the information for all the devices associated with the contract;
+        complete=False and paging.next set to the failed page if the walk was interrupted. A complete listing is
+        answered from the fleet store when configured and neither deadline nor checkpoint is given
+        :raises SigfoxTimeoutError: if a request times out or the deadline expires; carries partial results and cursor
         """
-        devs_url = f"https://api.sigfox.com/v2/contract-infos/{contract_id}/devices"
+        parse_mode = self._parse_mode(parse_mode)
+        if (
+            fetch_all_pages
+            and deadline is None
+            and checkpoint is None
+            and parse_mode in MODEL_PARSE_MODES
+        ):
+            return self._stored_listing(
+                f"devices:{contract_id}",
+                DevicesResponse,
+                lambda: self.store.get_devices(contract_id=contract_id),
+                lambda devices: self.store.replace_contract_devices(
+                    contract_id, devices
+                ),
+                lambda: self._fetch_devices_by_contract(
+                    contract_id, True, parse_mode=parse_mode
+                ),
+            )
 
-        resp = do_get(devs_url, self.auth.encode("utf-8"))
+        return self._fetch_devices_by_contract(
+            contract_id, fetch_all_pages, deadline, checkpoint, parse_mode
+        )
 
-        if resp.status_code != 200:
-            raise SigfoxDeviceNotFoundError
+    def _fetch_devices_by_contract(
+        self,
+        contract_id: str,
+        fetch_all_pages: bool,
+        deadline: Optional[float] = None,
+        checkpoint: Optional[Union[str, PaginationCheckpoint]] = None,
+        parse_mode: str = PARSE_VALIDATE,
+    ) -> DevicesResponse:
+        """
+        Fetch the devices of a contract, see get_devices_by_contract.
+        :param contract_id: string containing the contract ID to search for
+        :param fetch_all_pages: if True, fetches all pages automatically; if False, returns only first page
+        :param deadline: seconds allowed for the whole pagination walk; None means no limit
+        :param checkpoint: PaginationCheckpoint or file path recording each fetched page
+        :param parse_mode: "validate", "trusted", "raw" or "records", see build_model
+        :return: DevicesResponse object containing the devices of the contract
+        """
+        deadline_at = self._deadline_at(deadline)
+        devs_url = f"{self.api_url}/contract-infos/{contract_id}/devices"
 
-        data = json.loads(resp.text)
-        devices_response = DevicesResponse(**data)
-        
-        # If pagination is enabled and there are more pages, fetch them all
-        if fetch_all_pages and devices_response.paging and devices_response.paging.next:
-            all_devices = list(devices_response.data)
-            current_page = devices_response
-            
-            while current_page.paging and current_page.paging.next:
-                # Extract the next page URL
-                next_url = current_page.paging.next
-                
-                resp = do_get(next_url, self.auth.encode("utf-8"))
-                
-                if resp.status_code != 200:
-                    # If we can't get a page, break and return what we have
-                    break
-                    
-                data = json.loads(resp.text)
-                current_page = DevicesResponse(**data)
-                all_devices.extend(current_page.data)
-            
-            # Create a new response with all devices and clear pagination
-            from .models.schemas import Paging
-            devices_response.data = all_devices
-            devices_response.paging = Paging(next=None)
+        if not fetch_all_pages:
+            data = self._first_page(self._get_devices_page, devs_url, deadline_at)
+            return build_model(DevicesResponse, data, parse_mode)
+
+        # Follow paging.next, prefetching each page while the previous one is parsed
+        devices_response = self._fetch_listing(
+            devs_url,
+            self._get_devices_page,
+            DevicesResponse,
+            deadline_at=deadline_at,
+            checkpoint=checkpoint,
+            parse_mode=parse_mode,
+        )
 
         return devices_response
 
+    def iter_devices_by_contract(
+        self,
+        contract_id: str,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        deadline: Optional[float] = None,
+        parse_mode: Optional[str] = None,
+    ) -> PageIterator:
+        """
+        Stream the devices associated with a contract ID page by page, keeping only one page in memory.
+        Breaking out of the loop stops the walk; iterator.cursor and iterator.skip allow resuming later.
+        :param contract_id: string containing the contract ID to search for
+        :param cursor: page URL to resume from (PageIterator.cursor of a previous iteration); defaults to the first page
+        :param skip: number of items of the cursor page already consumed (PageIterator.skip)
+        :param deadline: seconds allowed for the whole iteration; waiting for a page past it raises SigfoxTimeoutError
+        :param parse_mode: "validate", "trusted", "raw" or "records"; None uses the manager's parse_mode
+        :return: PageIterator yielding Device objects
+        """
+        parse_mode = self._parse_mode(parse_mode)
+        deadline_at = self._deadline_at(deadline)
+        url = cursor or f"{self.api_url}/contract-infos/{contract_id}/devices"
+        data = self._first_page(self._get_devices_page, url, deadline_at)
+
+        return PageIterator(
+            self._iter_pages(
+                data,
+                DevicesResponse,
+                deadline_at=deadline_at,
+                parse_mode=parse_mode,
+            ),
+            url,
+            skip=skip,
+        )
+
+    def get_device_table(
+        self, contract_ids: Optional[Iterable[str]] = None
+    ) -> DeviceTable:
+        """
+        Build a columnar DeviceTable of the devices of some or all contracts.
+        Device listings are streamed page by page in "raw" parse mode straight into the table's arrays,
+        so no Device model is ever built and only one page of dicts is held at a time.
+        :param contract_ids: contract IDs whose devices to load; None loads every contract the user can see
+        :return: DeviceTable; complete=False if the contracts listing or a contract's device listing could not be
+        read to the end
+        """
+        table = DeviceTable()
+        if contract_ids is None:
+            contracts = self.get_contracts(parse_mode="raw")
+            # Devices of the contracts missing from an incomplete listing are not loaded either
+            table.complete = contracts.complete
+            contract_ids = [c["id"] for c in contracts.data]
+
+        for contract_id in contract_ids:
+            devices = self.iter_devices_by_contract(contract_id, parse_mode="raw")
+            table.extend(devices)
+            table.complete = table.complete and devices.complete
+
+        return table
+
+    def _get_devices_page(self, url: str) -> dict:
+        """
+        Fetch and decode one page of a contract's devices.
+        :param url: page URL
+        :return: decoded JSON page
+        """
+        resp = self._get(url)
+
+        if resp.status_code != 200:
+            raise SigfoxDeviceNotFoundError
+
+        return response_json(resp)
+
     def get_device_info(self, dev_id: str) -> Device:
         """
         Gets the detailed information for a specific device by its ID.
+        Concurrent calls for the same device share one request and one parsed Device, and the result is served
+        from the response cache or the fleet store when configured.
+        :param dev_id: string containing the Sigfox ID for the selected device.
+        :return: Device object describing the requested device.
+        """
+        return self._cached(
+            "device_info",
+            dev_id,
+            lambda: self._single_flight.do(
+                ("device_info", dev_id), lambda: self._fetch_device_info(dev_id)
+            ),
+        )
+
+    def _fetch_device_info(self, dev_id: str) -> Device:
+        """
+        Read one device from the fleet store while fresh, otherwise fetch it and mirror it.
+        :param dev_id: string containing the Sigfox ID for the selected device.
+        :return: Device object describing the requested device.
+        """
+        if self.store is None:
+            return self._request_device_info(dev_id)
+
+        device = self.store.get_device(dev_id, max_age=self.store_max_age)
+        if device is None:
+            device = self._request_device_info(dev_id)
+            self.store.upsert_devices([device])
+
+        return device
+
+    def _request_device_info(self, dev_id: str) -> Device:
+        """
+        Fetch and parse one device.
         :param dev_id: string containing the Sigfox ID for the selected device.
         :return: Device object describing the requested device.
         """
-        dev_url = f"https://api.sigfox.com/v2/devices/{dev_id}"
+        dev_url = f"{self.api_url}/devices/{dev_id}"
 
-        resp = do_get(dev_url, self.auth.encode("utf-8"))
+        resp = self._get(dev_url)
 
         if resp.status_code == 403:
             raise SigfoxAuthError
         elif resp.status_code == 404:
             raise SigfoxDeviceNotFoundError
 
-        data = json.loads(resp.text)
-        device = Device(**data)
+        data = response_json(resp)
+        device = build_model(Device, data, self.parse_mode)
 
         return device
 
+    def iter_device_info_many(
+        self, dev_ids: Iterable[str], max_concurrency: int = DEFAULT_POOL_MAXSIZE
+    ) -> Iterator[Tuple[str, Optional[Device], Optional[Exception]]]:
+        """
+        Fetch the detailed information of many devices concurrently, yielding each result as it completes.
+        Per-device failures (SigfoxDeviceNotFoundError, SigfoxAuthError, transport or decoding errors) are yielded
+        instead of aborting the batch. Keep max_concurrency at or below the transport pool_maxsize so every
+        worker reuses a pooled connection.
+        :param dev_ids: iterable of Sigfox device IDs; duplicates are fetched once.
+        :param max_concurrency: maximum number of requests in flight.
+        :return: iterator of (dev_id, Device or None, exception or None) tuples in completion order.
+        """
+        return bounded_map_unordered(
+            self.get_device_info,
+            dict.fromkeys(dev_ids),
+            max_concurrency,
+            capture=(SigfoxAPIException, requests.RequestException, ValueError),
+        )
+
+    def get_device_info_many(
+        self, dev_ids: Iterable[str], max_concurrency: int = DEFAULT_POOL_MAXSIZE
+    ) -> BatchResult:
+        """
+        Fetch the detailed information of many devices concurrently.
+        :param dev_ids: iterable of Sigfox device IDs.
+        :param max_concurrency: maximum number of requests in flight.
+        :return: BatchResult whose results map dev_id -> Device and errors map dev_id -> exception.
+        """
+        batch = BatchResult()
+        for dev_id, device, error in self.iter_device_info_many(
+            dev_ids, max_concurrency=max_concurrency
+        ):
+            if error is not None:
+                batch.errors[dev_id] = error
+            else:
+                batch.results[dev_id] = device
+
+        return batch
+
     def get_device_messages(
-        self, dev_id: str, threshold: Optional[int] = None
+        self,
+        dev_id: str,
+        threshold: Optional[int] = None,
+        since: Optional[int] = None,
+        before: Optional[int] = None,
+        fetch_all_pages: bool = False,
+        max_messages: Optional[int] = None,
+        deadline: Optional[float] = None,
+        parse_mode: Optional[str] = None,
+        cursor: Optional[str] = None,
+        skip: int = 0,
     ) -> DeviceMessagesResponse:
         """
         Retrieves a list of messages for the specified device. An optional parameter of threshold can define the
@@ -145,41 +909,232 @@ class SigfoxManager:
         :param dev_id: string containing the Sigfox ID for the selected device.
         :param threshold: timestamp value in epoch that shows the starting point for the query, if no value is provided
         the query grabs all messages available in the backend.
-        :return: List of messages for the device, contained in the Device<essageResponse
+        :param since: epoch timestamp in ms; only messages at or after it are returned (overrides threshold).
+        :param before: epoch timestamp in ms; only messages strictly before it are returned.
+        :param fetch_all_pages: if True, follows paging.next; if False, returns only the first page.
+        :param max_messages: maximum number of messages to return; when the cap is hit paging.next keeps the
+        URL of the page holding the next message and paging.skip the number of its messages already returned.
+        :param deadline: seconds allowed for the whole pagination walk; None means no limit
+        :param parse_mode: "validate", "trusted", "raw" or "records"; None uses the manager's parse_mode
+        :param cursor: page URL to resume from, e.g. paging.next of a previous response
+        :param skip: number of messages of the cursor page already returned, e.g. paging.skip of that response
+        :return: List of messages for the device, contained in the DeviceMessagesResponse
+        :raises SigfoxTimeoutError: if a request times out or the deadline expires; carries partial results and cursor
         """
-        if threshold is None:
-            msgs_url = f"https://api.sigfox.com/v2/devices/{dev_id}/messages"
-        else:
-            msgs_url = (
-                f"https://api.sigfox.com/v2/devices/{dev_id}/messages?since={threshold}"
+        if since is None:
+            since = threshold
+        parse_mode = self._parse_mode(parse_mode)
+
+        if not fetch_all_pages and max_messages is None and cursor is None:
+            data = self._first_page(
+                self._get_device_messages_page,
+                self._device_messages_url(dev_id, since=since, before=before),
+                self._deadline_at(deadline),
             )
+            return build_model(DeviceMessagesResponse, data, parse_mode)
 
-        resp = do_get(msgs_url, self.auth.encode("utf-8"))
+        messages = self.iter_device_messages(
+            dev_id,
+            since=since,
+            before=before,
+            max_messages=max_messages,
+            cursor=cursor,
+            skip=skip,
+            max_pages=None if fetch_all_pages else 1,
+            deadline=deadline,
+            parse_mode=parse_mode,
+        )
+        all_messages = []
+        try:
+            for message in messages:
+                all_messages.append(message)
+        except SigfoxTimeoutError as exc:
+            exc.partial = all_messages
+            raise
+
+        paging = (
+            Paging(next=None)
+            if messages.complete
+            else Paging(next=messages.cursor, skip=messages.skip)
+        )
+        if parse_mode not in MODEL_PARSE_MODES:
+            return RecordPage(all_messages, paging, messages.complete)
+
+        return DeviceMessagesResponse(
+            data=all_messages, paging=paging, complete=messages.complete
+        )
+
+    def iter_device_messages(
+        self,
+        dev_id: str,
+        since: Optional[int] = None,
+        before: Optional[int] = None,
+        max_messages: Optional[int] = None,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        max_pages: Optional[int] = None,
+        deadline: Optional[float] = None,
+        parse_mode: Optional[str] = None,
+    ) -> PageIterator:
+        """
+        Stream a device's messages newest first, following paging.next, with constant memory.
+        :param dev_id: string containing the Sigfox ID for the selected device.
+        :param since: epoch timestamp in ms; the iteration ends at the first older message.
+        :param before: epoch timestamp in ms; only messages strictly before it are returned.
+        :param max_messages: stop after this many messages.
+        :param cursor: page URL to resume from (PageIterator.cursor of a previous iteration).
+        :param skip: number of items of the cursor page already consumed (PageIterator.skip).
+        :param max_pages: stop after this many pages; None follows every page.
+        :param deadline: seconds allowed for the whole iteration; waiting for a page past it raises SigfoxTimeoutError
+        :param parse_mode: "validate", "trusted", "raw" or "records"; None uses the manager's parse_mode
+        :return: PageIterator yielding DeviceMessage objects
+        """
+        parse_mode = self._parse_mode(parse_mode)
+        deadline_at = self._deadline_at(deadline)
+        url = cursor or self._device_messages_url(dev_id, since=since, before=before)
+        data = self._first_page(self._get_device_messages_page, url, deadline_at)
+
+        pages = self._iter_pages(
+            data,
+            DeviceMessagesResponse,
+            raise_on_auth=True,
+            max_pages=max_pages,
+            deadline_at=deadline_at,
+            parse_mode=parse_mode,
+        )
+
+        return PageIterator(
+            pages,
+            url,
+            skip=skip,
+            max_items=max_messages,
+            # Messages come newest first, so the first one older than `since` ends the window
+            stop_when=(
+                None
+                if since is None
+                else (
+                    (lambda msg: msg["time"] < since)
+                    if parse_mode == PARSE_RAW
+                    else (lambda msg: msg.time < since)
+                )
+            ),
+        )
+
+    def backfill_device_messages(
+        self,
+        dev_id: str,
+        since: int,
+        before: int,
+        shards: Optional[int] = None,
+        max_concurrency: int = DEFAULT_POOL_MAXSIZE,
+        newest_first: bool = True,
+    ) -> DeviceMessagesResponse:
+        """
+        Backfill a device's message history by splitting [since, before) into time shards that are walked
+        concurrently, then merged in time/seqNumber order. Messages returned by two shards (at a shard
+        boundary) are kept once.
+        :param dev_id: string containing the Sigfox ID for the selected device.
+        :param since: epoch timestamp in ms of the window start (inclusive).
+        :param before: epoch timestamp in ms of the window end (exclusive).
+        :param shards: number of time shards; defaults to max_concurrency.
+        :param max_concurrency: maximum number of shards fetched at once.
+        :param newest_first: if True (API order) the newest message comes first, else the oldest.
+        :return: DeviceMessagesResponse holding every message of the window.
+        :raises SigfoxIncompleteBackfillError: if a page of a shard could not be fetched; carries the merged
+        messages in `partial` and the failed (since, before) windows in `windows`
+        """
+        if before <= since:
+            raise ValueError("before must be greater than since")
+
+        shard_count = max(1, min(shards or max_concurrency, before - since))
+        step = -(-(before - since) // shard_count)
+        windows = [
+            (start, min(start + step, before)) for start in range(since, before, step)
+        ]
+
+        def fetch_shard(window):
+            messages = self.iter_device_messages(
+                dev_id, since=window[0], before=window[1]
+            )
+            return list(messages), messages.complete
+
+        merged = {}
+        failed = []
+        for window, (shard_messages, complete), _ in bounded_map_unordered(
+            fetch_shard, windows, max_concurrency, capture=()
+        ):
+            if not complete:
+                failed.append(window)
+            for message in shard_messages:
+                merged.setdefault((message.time, message.seqNumber), message)
+
+        response = DeviceMessagesResponse(
+            data=[merged[key] for key in sorted(merged, reverse=newest_first)],
+            paging=Paging(next=None),
+            complete=not failed,
+        )
+        if failed:
+            raise SigfoxIncompleteBackfillError(sorted(failed), partial=response)
+
+        return response
+
+    def _device_messages_url(
+        self, dev_id: str, since: Optional[int] = None, before: Optional[int] = None
+    ) -> str:
+        """
+        Build the messages URL of a device for an optional [since, before) window.
+        :param dev_id: string containing the Sigfox ID for the selected device.
+        :param since: epoch timestamp in ms of the window start
+        :param before: epoch timestamp in ms of the window end
+        :return: URL of the first messages page
+        """
+        msgs_url = f"{self.api_url}/devices/{dev_id}/messages"
+        params = {"since": since, "before": before}
+        query = urlencode({k: v for k, v in params.items() if v is not None})
+
+        return f"{msgs_url}?{query}" if query else msgs_url
+
+    def _get_device_messages_page(self, url: str) -> dict:
+        """
+        Fetch and decode one page of device messages.
+        :param url: page URL
+        :return: decoded JSON page
+        """
+        resp = self._get(url)
 
         if resp.status_code == 403:
             raise SigfoxAuthError
         elif resp.status_code == 404:
             raise SigfoxDeviceNotFoundError
 
-        data = json.loads(resp.text)
-        messages = DeviceMessagesResponse(**data)
-
-        return messages
+        return response_json(resp)
 
     def get_device_message_number(self, dev_id) -> DeviceMessageStats:
         """
-        Returns message metrics for the specified device.
+        Returns message metrics for the specified device, served from the response cache when one is configured.
+        :param dev_id: string containing the Sigfox ID for the selected device.
+        :return: DeviceMessageStats object that shows message transmission metrics.
+        """
+        return self._cached(
+            "device_message_number",
+            dev_id,
+            lambda: self._fetch_device_message_number(dev_id),
+        )
+
+    def _fetch_device_message_number(self, dev_id) -> DeviceMessageStats:
+        """
+        Fetch the message metrics of one device.
         :param dev_id: string containing the Sigfox ID for the selected device.
         :return: DeviceMessageStats object that shows message transmission metrics.
         """
-        metric_url = f"https://api.sigfox.com/v2/devices/{dev_id}/messages/metric"
-        resp = do_get(metric_url, self.auth.encode("utf-8"))
+        metric_url = f"{self.api_url}/devices/{dev_id}/messages/metric"
+        resp = self._get(metric_url)
         if resp.status_code == 403:
             raise SigfoxAuthError
         elif resp.status_code == 404:
             raise SigfoxDeviceNotFoundError
 
-        data = json.loads(resp.text)
+        data = response_json(resp)
         message_stats = DeviceMessageStats(**data)
 
         return message_stats
@@ -211,7 +1166,7 @@ class SigfoxManager:
         :param automatic_renewal: bool value that determines if the device has automatic renewal.
         :return: BaseDevice object containing the information for the newly created device.
         """
-        dev_create_url = "https://api.sigfox.com/v2/devices/"
+        dev_create_url = f"{self.api_url}/devices/"
         payload = {
             "id": dev_id,
             "name": name,
@@ -230,34 +1185,149 @@ class SigfoxManager:
 
         headers = {"Content-Type": "application/json"}
 
-        resp = do_post(
-            dev_create_url, payload, self.auth.encode("utf-8"), headers=headers
-        )
+        resp = self._post(dev_create_url, payload, headers)
 
         if resp.status_code == 403:
             raise SigfoxAuthError
         elif resp.status_code == 409:
             raise SigfoxDeviceCreateConflictException
 
-        data = json.loads(resp.text)
+        self._invalidate_device_writes([dev_id])
+
+        data = response_json(resp)
 
         base_device = BaseDevice(**data)
 
         return base_device
 
-    def get_device_types(self, fetch_all_pages: bool = True) -> DeviceTypesResponse:
+    def get_device_types(
+        self,
+        fetch_all_pages: bool = True,
+        deadline: Optional[float] = None,
+        checkpoint: Optional[Union[str, PaginationCheckpoint]] = None,
+        parse_mode: Optional[str] = None,
+    ) -> DeviceTypesResponse:
         """
         GET /v2/devicetypes
         - When fetch_all_pages=True, follow paging.next and merge all pages,
           returning a DeviceTypesResponse with paging.next=None and full data list.
         - Map 403 -> SigfoxAuthError; re-raise other HTTP errors consistently with existing style.
         :param fetch_all_pages: if True, fetches all pages automatically; if False, returns only first page
+        :param deadline: seconds allowed for the whole pagination walk; None means no limit
+        :param checkpoint: PaginationCheckpoint or file path recording each fetched page; a later call with the
+        same checkpoint resumes after the last recorded page
+        :param parse_mode: "validate", "trusted", "raw" or "records"; None uses the manager's parse_mode
+        :return: DeviceTypesResponse object containing all device types; concurrent calls without deadline or
+        checkpoint share one walk and one parsed response
+        :raises SigfoxTimeoutError: if a request times out or the deadline expires; carries partial results and cursor
+        """
+        parse_mode = self._parse_mode(parse_mode)
+        if deadline is None and checkpoint is None and parse_mode in MODEL_PARSE_MODES:
+            return self._cached(
+                "device_types",
+                fetch_all_pages,
+                lambda: self._single_flight.do(
+                    ("device_types", fetch_all_pages),
+                    lambda: (
+                        self._stored_listing(
+                            "device_types",
+                            DeviceTypesResponse,
+                            lambda: self.store.get_device_types(),
+                            lambda device_types: self.store.replace_device_types(
+                                device_types
+                            ),
+                            lambda: self._fetch_device_types(
+                                True, parse_mode=parse_mode
+                            ),
+                        )
+                        if fetch_all_pages
+                        else self._fetch_device_types(False, parse_mode=parse_mode)
+                    ),
+                ),
+            )
+
+        return self._fetch_device_types(
+            fetch_all_pages, deadline, checkpoint, parse_mode
+        )
+
+    def _fetch_device_types(
+        self,
+        fetch_all_pages: bool,
+        deadline: Optional[float] = None,
+        checkpoint: Optional[Union[str, PaginationCheckpoint]] = None,
+        parse_mode: str = PARSE_VALIDATE,
+    ) -> DeviceTypesResponse:
+        """
+        Fetch the device types, see get_device_types.
+        :param fetch_all_pages: if True, fetches all pages automatically; if False, returns only first page
+        :param deadline: seconds allowed for the whole pagination walk; None means no limit
+        :param checkpoint: PaginationCheckpoint or file path recording each fetched page
+        :param parse_mode: "validate", "trusted", "raw" or "records", see build_model
         :return: DeviceTypesResponse object containing all device types
         """
-        device_types_url = "https://api.sigfox.com/v2/devicetypes"
+        deadline_at = self._deadline_at(deadline)
+        device_types_url = f"{self.api_url}/devicetypes"
+
+        if not fetch_all_pages:
+            data = self._first_page(
+                self._get_device_types_page, device_types_url, deadline_at
+            )
+            return build_model(DeviceTypesResponse, data, parse_mode)
+
+        # Follow paging.next, prefetching each page while the previous one is parsed;
+        # a 403 on a later page raises SigfoxAuthError
+        device_types_response = self._fetch_listing(
+            device_types_url,
+            self._get_device_types_page,
+            DeviceTypesResponse,
+            raise_on_auth=True,
+            deadline_at=deadline_at,
+            checkpoint=checkpoint,
+            parse_mode=parse_mode,
+        )
+
+        return device_types_response
+
+    def iter_device_types(
+        self,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        deadline: Optional[float] = None,
+        parse_mode: Optional[str] = None,
+    ) -> PageIterator:
+        """
+        Stream the device types page by page, keeping only one page in memory.
+        :param cursor: page URL to resume from (PageIterator.cursor of a previous iteration); defaults to the first page
+        :param skip: number of items of the cursor page already consumed (PageIterator.skip)
+        :param deadline: seconds allowed for the whole iteration; waiting for a page past it raises SigfoxTimeoutError
+        :param parse_mode: "validate", "trusted", "raw" or "records"; None uses the manager's parse_mode
+        :return: PageIterator yielding DeviceType objects
+        """
+        parse_mode = self._parse_mode(parse_mode)
+        deadline_at = self._deadline_at(deadline)
+        url = cursor or f"{self.api_url}/devicetypes"
+        data = self._first_page(self._get_device_types_page, url, deadline_at)
+
+        return PageIterator(
+            self._iter_pages(
+                data,
+                DeviceTypesResponse,
+                raise_on_auth=True,
+                deadline_at=deadline_at,
+                parse_mode=parse_mode,
+            ),
+            url,
+            skip=skip,
+        )
+
+    def _get_device_types_page(self, url: str) -> dict:
+        """
+        Fetch and decode one page of device types.
+        :param url: page URL
+        :return: decoded JSON page
+        """
+        resp = self._get(url)
 
-        resp = do_get(device_types_url, self.auth.encode("utf-8"))
-        
         if resp.status_code == 403:
             raise SigfoxAuthError
         elif resp.status_code != 200:
@@ -265,65 +1335,216 @@ class SigfoxManager:
                 status_code=resp.status_code, message="Failed to fetch device types."
             )
 
-        data = json.loads(resp.text)
-        device_types_response = DeviceTypesResponse(**data)
-        
-        # If pagination is enabled and there are more pages, fetch them all
-        if fetch_all_pages and device_types_response.paging and device_types_response.paging.next:
-            all_device_types = list(device_types_response.data)
-            current_page = device_types_response
-            
-            while current_page.paging and current_page.paging.next:
-                # Extract the next page URL
-                next_url = current_page.paging.next
-                
-                resp = do_get(next_url, self.auth.encode("utf-8"))
-                
-                if resp.status_code == 403:
-                    raise SigfoxAuthError
-                elif resp.status_code != 200:
-                    # If we can't get a page, break and return what we have
-                    break
-                    
-                data = json.loads(resp.text)
-                current_page = DeviceTypesResponse(**data)
-                all_device_types.extend(current_page.data)
-            
-            # Create a new response with all device types and clear pagination
-            from .models.schemas import Paging
-            device_types_response.data = all_device_types
-            device_types_response.paging = Paging(next=None)
+        return response_json(resp)
 
-        return device_types_response
+    def refresh_store(self, max_concurrency: int = DEFAULT_POOL_MAXSIZE) -> int:
+        """
+        Crawl the contracts, device types and every contract's devices from the API into the fleet store.
+        Contract device listings are fetched concurrently; a contract whose listing could not be fetched
+        completely keeps its previous mirror and stays marked stale.
+        :param max_concurrency: maximum number of contract device listings fetched at once
+        :return: number of devices mirrored
+        :raises ValueError: if the manager has no store
+        """
+        if self.store is None:
+            raise ValueError("refresh_store requires a FleetStore")
+
+        contracts = self._fetch_contracts(True)
+        if contracts.complete:
+            self.store.replace_contracts(contracts.data)
+
+        device_types = self._fetch_device_types(True)
+        if device_types.complete:
+            self.store.replace_device_types(device_types.data)
+
+        mirrored = 0
+        for contract_id, devices, error in bounded_map_unordered(
+            lambda contract_id: self._fetch_devices_by_contract(contract_id, True),
+            [c.id for c in contracts.data],
+            max_concurrency,
+            capture=(SigfoxAPIException, requests.RequestException),
+        ):
+            if error is None and devices.complete:
+                self.store.replace_contract_devices(contract_id, devices.data)
+                mirrored += len(devices.data)
+
+        return mirrored
+
+    @staticmethod
+    def _diff_listing(entity, items, known_ids, high_water_mark, contract_id=None):
+        """
+        Compare a complete listing with the mirrored ids and the previous lastEditionTime high-water mark.
+        Unknown ids are added, known ids edited after the high-water mark are changed and mirrored ids
+        missing from the listing are removed.
+        :param entity: "contract" or "device"
+        :param items: every record of the listing
+        :param known_ids: ids mirrored by the previous sync
+        :param high_water_mark: highest lastEditionTime of the previous sync, None if never synced
+        :param contract_id: contract the devices were listed from
+        :return: (events, records to upsert, removed ids, new high-water mark)
+        """
+        events, upserts = [], []
+        seen = set()
+        new_mark = high_water_mark
+        for item in items:
+            seen.add(item.id)
+            if item.id not in known_ids:
+                kind = "added"
+            elif high_water_mark is None or item.lastEditionTime > high_water_mark:
+                kind = "changed"
+            else:
+                continue
+            events.append(
+                SyncEvent(kind, entity, item.id, contract_id=contract_id, record=item)
+            )
+            upserts.append(item)
+            if new_mark is None or item.lastEditionTime > new_mark:
+                new_mark = item.lastEditionTime
+
+        removed = sorted(known_ids - seen)
+        events.extend(
+            SyncEvent("removed", entity, removed_id, contract_id=contract_id)
+            for removed_id in removed
+        )
+
+        return events, upserts, removed, new_mark
+
+    def sync_fleet(
+        self,
+        on_event: Optional[Callable[[SyncEvent], None]] = None,
+        contract_ids: Optional[Iterable[str]] = None,
+        max_concurrency: int = DEFAULT_POOL_MAXSIZE,
+    ) -> SyncReport:
+        """
+        Incrementally sync the fleet store with the API.
+        Each listing keeps a high-water mark of the highest lastEditionTime it mirrored; a cycle only writes
+        and reports the records added, edited after that mark, or no longer listed. The Sigfox device listings
+        expose no lastEditionTime filter, so each contract's listing is still walked, but unchanged records are
+        neither written nor reported. A contract whose listing cannot be read to the end is left untouched and
+        reported as incomplete, so removals are never inferred from a partial walk.
+        :param on_event: optional callback receiving each SyncEvent as it is found
+        :param contract_ids: contracts whose devices are synced; defaults to every listed contract
+        :param max_concurrency: maximum number of contract device listings fetched at once
+        :return: SyncReport with the events, the new high-water marks and the incomplete contracts
+        :raises ValueError: if the manager has no store
+        """
+        if self.store is None:
+            raise ValueError("sync_fleet requires a FleetStore")
+
+        report = SyncReport()
+
+        def emit(events):
+            for event in events:
+                report.events.append(event)
+                if on_event is not None:
+                    on_event(event)
+
+        contracts = self._fetch_contracts(True)
+        if contracts.complete:
+            events, upserts, removed, mark = self._diff_listing(
+                "contract",
+                contracts.data,
+                self.store.contract_ids(),
+                self.store.high_water_mark("contracts"),
+            )
+            self.store.apply_contract_delta(upserts, removed, mark or 0)
+            report.high_water_marks["contracts"] = mark
+            emit(events)
+
+        if contract_ids is None:
+            contract_ids = [c.id for c in contracts.data]
+
+        for contract_id, devices, error in bounded_map_unordered(
+            lambda contract_id: self._fetch_devices_by_contract(contract_id, True),
+            list(contract_ids),
+            max_concurrency,
+            capture=(SigfoxAPIException, requests.RequestException),
+        ):
+            if error is not None:
+                report.errors[contract_id] = error
+            if error is not None or not devices.complete:
+                report.incomplete.append(contract_id)
+                continue
+
+            key = f"devices:{contract_id}"
+            events, upserts, removed, mark = self._diff_listing(
+                "device",
+                devices.data,
+                self.store.device_ids(contract_id),
+                self.store.high_water_mark(key),
+                contract_id=contract_id,
+            )
+            self.store.apply_device_delta(contract_id, upserts, removed, mark or 0)
+            report.high_water_marks[key] = mark
+            emit(events)
+
+        return report
+
+    def get_device_type_catalog(self, refresh: bool = False) -> DeviceTypeCatalog:
+        """
+        Return the cached device-type catalog, loading it with get_device_types(fetch_all_pages=True) when it is
+        missing, older than device_type_cache_ttl, or when refresh is True. Reloading an expired or refreshed
+        catalog first drops the device types held by the response cache and the fleet store, so it reads the API.
+        :param refresh: if True, reload the catalog even if the cached one is still valid
+        :return: DeviceTypeCatalog indexed by id and name
+        """
+        with self._device_type_catalog_lock:
+            catalog = self._device_type_catalog
+            if (
+                refresh
+                or catalog is None
+                or catalog.is_expired(self.device_type_cache_ttl)
+            ):
+                if catalog is not None:
+                    self._invalidate_device_types()
+                device_types_response = self.get_device_types(fetch_all_pages=True)
+                catalog = DeviceTypeCatalog(device_types_response.data)
+                self._device_type_catalog = catalog
+
+            return catalog
+
+    def invalidate_device_type_catalog(self) -> None:
+        """
+        Drop the cached device-type catalog, and the device types held by the response cache and the
+        fleet store, so the next lookup reloads it from the API.
+        """
+        with self._device_type_catalog_lock:
+            self._device_type_catalog = None
+            self._invalidate_device_types()
+
+    def _invalidate_device_types(self) -> None:
+        """
+        Drop the device-type listings held by the response cache and the fleet store.
+        """
+        if self.response_cache is not None:
+            self.response_cache.invalidate("device_types")
+        if self.store is not None:
+            self.store.invalidate("device_types")
 
     def resolve_device_type_id(self, ref: str) -> str:
         """
         Resolve a device type reference to its id.
-        - If `ref` looks like an id (hex-ish / UUID-like), check existence among device types; return it if present.
+        - If `ref` matches a device type id, return it.
         - Else treat `ref` as a name (exact, case-sensitive match) and return the id.
         - Raise SigfoxDeviceTypeNotFoundException if not found.
-        - Uses get_device_types(fetch_all_pages=True) to obtain the catalog.
+        - Uses the TTL-cached device-type catalog; an unknown reference forces one reload before failing, so
+          device types created after the catalog was loaded are still found.
         :param ref: Device type id or name to resolve
         :return: Device type id
         :raises SigfoxDeviceTypeNotFoundException: if device type cannot be resolved
         """
-        device_types_response = self.get_device_types(fetch_all_pages=True)
-        device_types = device_types_response.data
-        
-        # First, try to match by id (exact match)
-        for dt in device_types:
-            if dt.id and dt.id == ref:
-                return dt.id
-        
-        # If not found by id, try to match by name (exact, case-sensitive)
-        for dt in device_types:
-            if dt.name == ref and dt.id:
-                return dt.id
-        
-        # If still not found, raise exception
-        raise SigfoxDeviceTypeNotFoundException(
-            f"Device type not found: {ref}"
-        )
+        cached = self._device_type_catalog
+        catalog = self.get_device_type_catalog()
+        dev_type_id = catalog.resolve(ref)
+
+        if dev_type_id is None and catalog is cached:
+            # The cached snapshot may predate the device type; reload it once
+            dev_type_id = self.get_device_type_catalog(refresh=True).resolve(ref)
+
+        if dev_type_id is None:
+            raise SigfoxDeviceTypeNotFoundException(f"Device type not found: {ref}")
+
+        return dev_type_id
 
     def provision_device(
         self,
@@ -331,7 +1552,7 @@ class SigfoxManager:
         pac: str,
         dev_type_ref: str,
         name: Optional[str] = None,
-        **kwargs
+        **kwargs,
     ) -> BaseDevice:
         """
         Validate inputs, resolve device type, and call create_device.
@@ -350,41 +1571,258 @@ class SigfoxManager:
         :raises ValueError: if dev_id or pac format is invalid
         :raises SigfoxDeviceTypeNotFoundException: if device type cannot be resolved
         """
-        # Validate dev_id: uppercase hex (3..16 chars)
-        dev_id_pattern = re.compile(r'^[0-9A-F]{3,16}$')
-        if not dev_id_pattern.match(dev_id):
-            raise ValueError(
-                f"Invalid dev_id format: {dev_id}. Must be uppercase hex, 3-16 characters."
-            )
-        
-        # Validate pac: 16-char alphanumeric
-        pac_pattern = re.compile(r'^[0-9A-Za-z]{16}$')
-        if not pac_pattern.match(pac):
-            raise ValueError(
-                f"Invalid pac format: {pac}. Must be 16 alphanumeric characters."
-            )
-        
+        validate_provisioning_inputs(dev_id, pac)
+
         # Resolve device type
         dev_type_id = self.resolve_device_type_id(dev_type_ref)
-        
-        # Extract known parameters from kwargs or use defaults
-        activable = kwargs.pop('activable', True)
-        lat = kwargs.pop('lat', 0.0)
-        lng = kwargs.pop('lng', 0.0)
-        product_cert = kwargs.pop('product_cert', None)
-        prototype = kwargs.pop('prototype', False)
-        automatic_renewal = kwargs.pop('automatic_renewal', True)
-        
+
         # Call create_device with resolved parameters
         return self.create_device(
-            dev_id=dev_id,
-            pac=pac,
-            dev_type_id=dev_type_id,
-            name=name if name else dev_id,  # Use dev_id as name if not provided
-            activable=activable,
-            lat=lat,
-            lng=lng,
-            product_cert=product_cert,
-            prototype=prototype,
-            automatic_renewal=automatic_renewal
+            **build_create_device_kwargs(dev_id, pac, dev_type_id, name, kwargs)
+        )
+
+    def provision_devices(
+        self, rows: Iterable[dict], max_concurrency: int = DEFAULT_POOL_MAXSIZE
+    ) -> ProvisioningReport:
+        """
+        Provision a batch of devices, e.g. rows read from a manufacturing CSV.
+        Every row is validated up front, each distinct dev_type_ref is resolved once, and the valid rows are
+        created concurrently. Failures are reported per row instead of aborting the batch.
+        :param rows: iterable of dicts with dev_id, pac, dev_type_ref and optionally name plus any
+        provision_device keyword (activable, lat, lng, product_cert, prototype, automatic_renewal)
+        :param max_concurrency: maximum number of create requests in flight
+        :return: ProvisioningReport with one ProvisioningRowResult per input row, in input order
+        """
+        results = {}
+        pending = []
+        for index, row in enumerate(rows):
+            dev_id = row.get("dev_id")
+            try:
+                for key in ("dev_id", "pac", "dev_type_ref"):
+                    if not isinstance(row.get(key), str):
+                        raise ValueError(f"Missing or invalid {key} in row {index}.")
+                validate_provisioning_inputs(dev_id, row["pac"])
+            except ValueError as exc:
+                results[index] = ProvisioningRowResult(
+                    index, dev_id, "invalid", error=exc
+                )
+            else:
+                pending.append((index, row))
+
+        dev_type_ids = {}
+        for ref in dict.fromkeys(row["dev_type_ref"] for _, row in pending):
+            try:
+                dev_type_ids[ref] = self.resolve_device_type_id(ref)
+            except SigfoxDeviceTypeNotFoundException as exc:
+                dev_type_ids[ref] = exc
+
+        jobs = []
+        for index, row in pending:
+            dev_type_id = dev_type_ids[row["dev_type_ref"]]
+            if isinstance(dev_type_id, Exception):
+                results[index] = ProvisioningRowResult(
+                    index, row["dev_id"], "invalid", error=dev_type_id
+                )
+            else:
+                jobs.append((index, row, dev_type_id))
+
+        def create(job):
+            _, row, dev_type_id = job
+            return self.create_device(
+                **build_create_device_kwargs(
+                    row["dev_id"], row["pac"], dev_type_id, row.get("name"), row
+                )
+            )
+
+        for (index, row, _), device, error in bounded_map_unordered(
+            create,
+            jobs,
+            max_concurrency,
+            capture=(SigfoxAPIException, requests.RequestException, ValueError),
+        ):
+            if error is None:
+                status = "created"
+            elif isinstance(error, SigfoxDeviceCreateConflictException):
+                status = "conflict"
+            else:
+                status = "failed"
+            results[index] = ProvisioningRowResult(
+                index, row["dev_id"], status, device=device, error=error
+            )
+
+        return ProvisioningReport(rows=[results[index] for index in sorted(results)])
+
+    def create_devices_bulk(
+        self,
+        dev_type_id: str,
+        devices: Iterable[dict],
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        activable: bool = True,
+        automatic_renewal: bool = True,
+        product_cert: Optional[dict] = None,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        timeout: float = 600.0,
+    ) -> ProvisioningReport:
+        """
+        Create many devices of one device type through Sigfox bulk creation jobs (POST /devices/bulk).
+        Devices are validated, split into jobs of at most chunk_size devices, submitted, and the jobs are polled
+        (GET /devices/bulk/{jobId}) with exponential backoff until they finish or timeout expires.
+        :param dev_type_id: Sigfox device type ID shared by every device of the batch.
+        :param devices: iterable of dicts with dev_id, pac and optionally name (defaults to dev_id).
+        :param chunk_size: maximum number of devices per bulk job.
+        :param activable: bool value that determines if the devices are activable.
+        :param automatic_renewal: bool value that determines if the devices have automatic renewal.
+        :param product_cert: dictionary containing the product certificate for the devices.
+        :param poll_interval: seconds before the first job status poll.
+        :param max_poll_interval: upper bound of the poll backoff in seconds.
+        :param timeout: seconds to wait for the jobs; devices of unfinished jobs are reported as "pending".
+        :return: ProvisioningReport with one row per input device, in input order.
+        :raises SigfoxBulkAuthError: if a job submission or status poll is answered 403; carries the report of the
+        rows handled so far, the rows never submitted being "failed".
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        results = {}
+        valid_rows = []
+        for index, row in enumerate(devices):
+            dev_id = row.get("dev_id")
+            try:
+                if not isinstance(dev_id, str) or not isinstance(row.get("pac"), str):
+                    raise ValueError(f"Missing or invalid dev_id/pac in row {index}.")
+                validate_provisioning_inputs(dev_id, row["pac"])
+            except ValueError as exc:
+                results[index] = ProvisioningRowResult(
+                    index, dev_id, "invalid", error=exc
+                )
+            else:
+                valid_rows.append((index, row))
+
+        bulk_url = f"{self.api_url}/devices/bulk"
+        jobs = {}
+
+        def build_report() -> ProvisioningReport:
+            # Devices of jobs still running are reported pending
+            for job_id, chunk in jobs.items():
+                for index, row in chunk:
+                    results[index] = ProvisioningRowResult(
+                        index, row["dev_id"], "pending", job_id=job_id
+                    )
+            return ProvisioningReport(
+                rows=[results[index] for index in sorted(results)]
+            )
+
+        def refused() -> SigfoxBulkAuthError:
+            error = SigfoxBulkAuthError()
+            for index, row in valid_rows:
+                if index not in results:
+                    results[index] = ProvisioningRowResult(
+                        index, row["dev_id"], "failed", error=error
+                    )
+            error.report = build_report()
+            self._invalidate_device_writes(
+                row.dev_id
+                for row in error.report.rows
+                if row.status in ("created", "pending")
+            )
+            return error
+
+        for start in range(0, len(valid_rows), chunk_size):
+            chunk = valid_rows[start : start + chunk_size]
+            payload = {
+                "deviceTypeId": dev_type_id,
+                "activable": activable,
+                "automaticRenewal": automatic_renewal,
+                "data": [
+                    {
+                        "id": row["dev_id"],
+                        "pac": row["pac"],
+                        "name": row.get("name") or row["dev_id"],
+                    }
+                    for _, row in chunk
+                ],
+            }
+            if product_cert is not None and isinstance(product_cert, dict):
+                if "key" in product_cert.keys():
+                    payload["productCertificate"] = product_cert
+
+            resp = self._post(bulk_url, payload, {"Content-Type": "application/json"})
+
+            if resp.status_code == 403:
+                raise refused()
+
+            job_id = None
+            if resp.status_code in (200, 201):
+                job_id = response_json(resp).get("jobId")
+            if job_id is None:
+                error = SigfoxAPIException(
+                    status_code=resp.status_code,
+                    message=(
+                        "Bulk device creation job was rejected."
+                        if resp.status_code not in (200, 201)
+                        else "Bulk device creation response has no jobId."
+                    ),
+                )
+                for index, row in chunk:
+                    results[index] = ProvisioningRowResult(
+                        index, row["dev_id"], "failed", error=error
+                    )
+                continue
+
+            jobs[job_id] = chunk
+
+        delay = poll_interval
+        deadline = time.monotonic() + timeout
+        while jobs:
+            time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+            for job_id in list(jobs):
+                resp = self._get(f"{bulk_url}/{job_id}")
+                if resp.status_code == 403:
+                    raise refused()
+                elif resp.status_code != 200:
+                    continue
+
+                job_status = response_json(resp)
+                if not job_status.get("jobDone"):
+                    continue
+
+                failures = {}
+                for failure in (job_status.get("status") or {}).get("failed") or []:
+                    error = SigfoxBulkDeviceError(
+                        failure.get("status"),
+                        failure.get("message")
+                        or "Device rejected by the bulk creation job.",
+                    )
+                    for failed_id in failure.get("ids") or []:
+                        failures[failed_id] = error
+
+                for index, row in jobs.pop(job_id):
+                    dev_id = row["dev_id"]
+                    if dev_id in failures:
+                        results[index] = ProvisioningRowResult(
+                            index,
+                            dev_id,
+                            "failed",
+                            error=failures[dev_id],
+                            job_id=job_id,
+                        )
+                    else:
+                        results[index] = ProvisioningRowResult(
+                            index,
+                            dev_id,
+                            "created",
+                            device=BaseDevice(id=dev_id),
+                            job_id=job_id,
+                        )
+
+            if time.monotonic() >= deadline:
+                break
+            delay = min(delay * 2, max_poll_interval)
+
+        report = build_report()
+        self._invalidate_device_writes(
+            row.dev_id for row in report.rows if row.status in ("created", "pending")
         )
+
+        return report
@@ -31,3 +31,57 @@ class SigfoxDeviceCreateConflictException(SigfoxAPIException):
 
 class SigfoxDeviceTypeNotFoundException(Exception):
     """Raised when a device type cannot be resolved by id or name."""
+
+
+class SigfoxBulkDeviceError(SigfoxAPIException):
+    """Raised (or reported) when a bulk creation job rejects a device."""
+
+    def __init__(self, status, message="Device rejected by the bulk creation job."):
+        super().__init__(status, message)
+
+
+class SigfoxBulkAuthError(SigfoxAuthError):
+    """
+    Raised when a bulk creation job is refused with 403 while submitting or polling.
+    `report` holds the ProvisioningReport of every input row: rows of jobs already
+    submitted are "pending" or final, the rows that were never submitted are "failed".
+    """
+
+    def __init__(
+        self, report=None, message="User Not authorized to create devices in bulk"
+    ):
+        super().__init__(message)
+        self.report = report
+
+
+class SigfoxTimeoutError(SigfoxAPIException):
+    """
+    Raised when a request times out or a paginated walk exceeds its deadline.
+    `partial` holds the items fetched before the timeout and `cursor` the URL of the
+    page to resume from.
+    """
+
+    def __init__(
+        self, message="Sigfox API request timed out.", partial=None, cursor=None
+    ):
+        super().__init__(408, message)
+        self.partial = partial if partial is not None else []
+        self.cursor = cursor
+
+
+class SigfoxIncompleteBackfillError(SigfoxAPIException):
+    """
+    Raised when a time shard of a message backfill could not be read to the end.
+    `partial` holds the merged messages of every shard (complete=False) and `windows`
+    the (since, before) windows to backfill again.
+    """
+
+    def __init__(
+        self,
+        windows,
+        partial=None,
+        message="A backfill shard could not be fetched to the end.",
+    ):
+        super().__init__(502, f"{message} Failed windows: {windows}")
+        self.windows = windows
+        self.partial = partial
@@ -0,0 +1,108 @@
+from typing import Optional
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the async extra
+    httpx = None
+
+from sigfox_manager.utils import json_backend
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+
+
+class AsyncHttpTransport:
+    """
+    Pooled keep-alive asyncio HTTP transport shared by every call of an AsyncSigfoxManager.
+
+    Wraps an httpx.AsyncClient so many concurrent requests issued from one event loop
+    share a bounded connection pool to api.sigfox.com.
+    """
+
+    def __init__(
+        self,
+        auth: bytes,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        client: Optional["httpx.AsyncClient"] = None,
+    ):
+        """
+        :param auth: Authorization header value (base64 encoded user:password)
+        :param max_connections: maximum number of concurrent connections in the pool
+        :param max_keepalive_connections: maximum number of idle connections kept alive
+        :param client: optional pre-configured httpx.AsyncClient to use instead of creating one; it is left open
+        by close(), so it can be shared
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncSigfoxManager requires httpx. "
+                "Install it with: pip install sigfox-manager[async]"
+            )
+        # Only a client created here is closed by close()
+        self._owns_client = client is None
+        if client is None:
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                )
+            )
+        self.client = client
+        self.auth_header = f"Basic {auth.decode('utf-8')}"
+        self.client.headers["Authorization"] = self.auth_header
+
+    async def get(self, url: str) -> "httpx.Response":
+        """
+        Do an HTTP GET Request over the pooled client
+        :param url: URL to perform the GET request to
+        :return: httpx.Response object
+        """
+        return await self.client.get(url)
+
+    async def post(
+        self, url: str, payload: dict, headers: Optional[dict] = None
+    ) -> "httpx.Response":
+        """
+        Do an HTTP POST Request over the pooled client
+        :param url: URL to perform the POST request to
+        :param payload: JSON payload to send
+        :param headers: Additional headers to send
+        :return: httpx.Response object
+        """
+        return await self.client.post(
+            url, content=json_backend.dumps(payload), headers=headers
+        )
+
+    async def close(self) -> None:
+        """
+        Close every pooled connection held by the transport, unless its client was passed in.
+        """
+        if self._owns_client:
+            await self.client.aclose()
+
+
+async def async_do_get(url: str, transport: AsyncHttpTransport) -> "httpx.Response":
+    """
+    Do an asynchronous HTTP GET Request
+    :param url: URL to perform the GET request to
+    :param transport: pooled asyncio transport carrying the auth header
+    :return: httpx.Response object
+    """
+    return await transport.get(url)
+
+
+async def async_do_post(
+    url: str,
+    payload: dict,
+    transport: AsyncHttpTransport,
+    headers: Optional[dict] = None,
+) -> "httpx.Response":
+    """
+    Do an asynchronous HTTP POST Request
+    :param url: URL to perform the POST request to
+    :param payload: JSON payload to send
+    :param transport: pooled asyncio transport carrying the auth header
+    :param headers: Additional headers to send
+    :return: httpx.Response object
+    """
+    return await transport.post(url, payload, headers=headers)
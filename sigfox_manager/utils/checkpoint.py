@@ -0,0 +1,116 @@
+import json
+import os
+from typing import Any, List, Optional
+
+
+def model_to_dict(item: Any) -> dict:
+    """
+    Convert a pydantic model to a plain dict under both pydantic v1 and v2.
+    Plain dicts and Record objects from the "raw" and "records" parse modes are accepted too.
+    :param item: pydantic model instance, dict or Record
+    :return: dict of the model fields
+    """
+    if isinstance(item, dict):
+        return item
+    to_dict = getattr(item, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
+
+    dump = getattr(item, "model_dump", None)
+    if dump is not None:
+        return dump()
+
+    return item.dict()
+
+
+class CheckpointState:
+    """
+    Progress of a paginated walk restored from a checkpoint file.
+    """
+
+    def __init__(self, start_url: str, items: List[dict], cursor: Optional[str]):
+        """
+        :param start_url: URL of the first page of the listing
+        :param items: decoded items of every page already fetched
+        :param cursor: URL of the next page to fetch; None once the listing was read to the end
+        """
+        self.start_url = start_url
+        self.items = items
+        self.cursor = cursor
+
+
+class PaginationCheckpoint:
+    """
+    Append-only on-disk checkpoint of a paginated walk.
+
+    The file holds one JSON line naming the listing's first page, then one line per fetched
+    page with its items and its paging.next cursor. Appending a page costs only that page,
+    and a line truncated by a crash is ignored on load, so the walk resumes from the last
+    page fully written.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: file used to persist the walk
+        """
+        self.path = path
+
+    def load(self, start_url: str) -> Optional[CheckpointState]:
+        """
+        Read the progress recorded for a listing.
+        :param start_url: URL of the first page of the listing being resumed
+        :return: CheckpointState, or None if there is no usable checkpoint for this listing
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return None
+
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                # Torn write of the last page: resume from the page before it
+                break
+
+        if len(records) < 2 or records[0].get("start_url") != start_url:
+            return None
+
+        items: List[dict] = []
+        for page in records[1:]:
+            items.extend(page["items"])
+
+        return CheckpointState(start_url, items, records[-1]["next"])
+
+    def start(self, start_url: str) -> None:
+        """
+        Begin a new walk, discarding any previous progress.
+        :param start_url: URL of the first page of the listing
+        """
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"start_url": start_url}) + "\n")
+
+    def append(self, items: List[Any], next_url: Optional[str]) -> None:
+        """
+        Record a fetched page.
+        :param items: pydantic models of the page
+        :param next_url: paging.next of the page
+        """
+        line = json.dumps(
+            {"items": [model_to_dict(i) for i in items], "next": next_url}
+        )
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def clear(self) -> None:
+        """
+        Remove the checkpoint file, e.g. once the walk completed.
+        """
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,52 @@
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Iterable, Iterator, Tuple, Type, Any, Optional
+
+_EXHAUSTED = object()
+
+
+def bounded_map_unordered(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_concurrency: int,
+    capture: Tuple[Type[BaseException], ...] = (Exception,),
+) -> Iterator[Tuple[Any, Any, Optional[BaseException]]]:
+    """
+    Run fn over items on a bounded thread pool and yield results as they complete.
+
+    At most max_concurrency calls are in flight at any time and items are pulled lazily,
+    so huge inputs never materialize as futures up front and breaking out of the loop
+    stops submitting new work.
+    :param fn: callable applied to every item
+    :param items: iterable of inputs
+    :param max_concurrency: maximum number of concurrent calls
+    :param capture: exception types reported per item instead of being raised
+    :return: iterator of (item, result, error) tuples in completion order
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    iterator = iter(items)
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        pending = {}
+        try:
+            for item in iterator:
+                pending[executor.submit(fn, item)] = item
+                if len(pending) >= max_concurrency:
+                    break
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = pending.pop(future)
+                    try:
+                        result, error = future.result(), None
+                    except capture as exc:
+                        result, error = None, exc
+                    yield item, result, error
+
+                    next_item = next(iterator, _EXHAUSTED)
+                    if next_item is not _EXHAUSTED:
+                        pending[executor.submit(fn, next_item)] = next_item
+        finally:
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,289 @@
+from array import array
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from sigfox_manager.models.records import get_field
+
+# Value stored in a numeric column when the device has no value, e.g. a device that never communicated
+MISSING = -1
+
+# Column name -> array typecode of the numeric columns
+NUMERIC_COLUMNS = {
+    "lqi": "h",
+    "state": "h",
+    "comState": "h",
+    "lastCom": "q",
+    "sequenceNumber": "q",
+}
+# Column name -> device field of the dictionary-encoded columns holding an id (and name when present)
+ENCODED_COLUMNS = {
+    "deviceType": "deviceType",
+    "contract": "contract",
+    "group": "group",
+    "createdBy": "createdBy",
+}
+
+
+class EncodedColumn:
+    """
+    Dictionary-encoded string column: each distinct value is stored once, rows hold its code.
+    """
+
+    def __init__(self):
+        self.values: List[Optional[str]] = []
+        self.names: List[Optional[str]] = []
+        self.codes = array("I")
+        self._index: Dict[Optional[str], int] = {}
+
+    def code(self, value: Optional[str], name: Optional[str] = None) -> int:
+        """
+        :param value: string to encode, None included
+        :param name: display name of the value, e.g. the device type name of its id
+        :return: code of value, added to the dictionary if new
+        """
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+            self.names.append(name)
+        elif name is not None and self.names[code] is None:
+            self.names[code] = name
+
+        return code
+
+    def lookup(self, value: Optional[str]) -> Optional[int]:
+        """
+        :param value: string to look up
+        :return: its code, or None if no row holds it
+        """
+        return self._index.get(value)
+
+    def append(self, value: Optional[str], name: Optional[str] = None) -> None:
+        self.codes.append(self.code(value, name))
+
+    def take(self, rows: Sequence[int]) -> "EncodedColumn":
+        """
+        :param rows: row indices to keep
+        :return: column holding only those rows, sharing this column's dictionary
+        """
+        column = EncodedColumn()
+        column.values, column.names, column._index = (
+            self.values,
+            self.names,
+            self._index,
+        )
+        codes = self.codes
+        column.codes = array("I", [codes[i] for i in rows])
+
+        return column
+
+    def __getitem__(self, row: int) -> Optional[str]:
+        return self.values[self.codes[row]]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+class DeviceTable:
+    """
+    Columnar, memory-compact view of a device inventory.
+
+    Numeric fields (lqi, state, comState, lastCom, sequenceNumber) are stored in typed
+    arrays, with MISSING for absent values. The device type, contract, group and createdBy
+    ids are dictionary-encoded: each distinct id is stored once and every row holds a
+    4-byte code. Device ids and names are kept in plain lists. Rows can be appended from
+    decoded JSON dicts (parse_mode="raw"), Record objects or Device models.
+    """
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.names: List[Optional[str]] = []
+        self.numeric: Dict[str, array] = {
+            name: array(code) for name, code in NUMERIC_COLUMNS.items()
+        }
+        self.encoded: Dict[str, EncodedColumn] = {
+            name: EncodedColumn() for name in ENCODED_COLUMNS
+        }
+        # False when a device listing the table was built from could not be read to the end
+        self.complete = True
+
+    @classmethod
+    def from_devices(cls, devices: Iterable[Any]) -> "DeviceTable":
+        """
+        :param devices: iterable of device dicts, Records or Device models
+        :return: DeviceTable holding them
+        """
+        table = cls()
+        table.extend(devices)
+
+        return table
+
+    def append(self, device: Any) -> None:
+        """
+        :param device: device dict, Record or Device model
+        """
+        self.ids.append(get_field(device, "id"))
+        self.names.append(get_field(device, "name"))
+        for name, column in self.numeric.items():
+            value = get_field(device, name)
+            column.append(MISSING if value is None else value)
+        for name, field in ENCODED_COLUMNS.items():
+            value = get_field(device, field)
+            if value is None or isinstance(value, str):
+                self.encoded[name].append(value)
+            else:
+                self.encoded[name].append(
+                    get_field(value, "id"), get_field(value, "name")
+                )
+
+    def extend(self, devices: Iterable[Any]) -> None:
+        """
+        :param devices: iterable of device dicts, Records or Device models
+        """
+        for device in devices:
+            self.append(device)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def columns(self) -> List[str]:
+        """Names of every column."""
+        return ["id", "name", *self.numeric, *self.encoded]
+
+    def column(self, name: str) -> Sequence:
+        """
+        :param name: column name, see columns
+        :return: the array of a numeric column, or the decoded values of any other column
+        :raises KeyError: if the column does not exist
+        """
+        if name == "id":
+            return self.ids
+        if name == "name":
+            return self.names
+        if name in self.numeric:
+            return self.numeric[name]
+        column = self.encoded[name]
+        values = column.values
+
+        return [values[code] for code in column.codes]
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """
+        :param index: row index
+        :return: dict of every column of the row; numeric columns hold MISSING when absent
+        """
+        row = {"id": self.ids[index], "name": self.names[index]}
+        for name, column in self.numeric.items():
+            row[name] = column[index]
+        for name, column in self.encoded.items():
+            row[name] = column[index]
+
+        return row
+
+    def __iter__(self):
+        return (self.row(i) for i in range(len(self)))
+
+    def _matches(self, name: str, condition: Any) -> Callable[[int], bool]:
+        """
+        Compile one filter condition into a row predicate.
+        :param name: column name
+        :param condition: value, set/list/tuple of values, or callable receiving the value
+        :return: callable receiving a row index
+        """
+        if name in self.encoded:
+            column = self.encoded[name]
+            codes = column.codes
+            if callable(condition):
+                accepted = {
+                    c for c, value in enumerate(column.values) if condition(value)
+                }
+            else:
+                values = (
+                    condition
+                    if isinstance(condition, (set, frozenset, list, tuple))
+                    else (condition,)
+                )
+                accepted = {column.lookup(v) for v in values} - {None}
+            return lambda i: codes[i] in accepted
+
+        values = self.column(name)
+        if callable(condition):
+            return lambda i: condition(values[i])
+        if isinstance(condition, (set, frozenset, list, tuple)):
+            accepted = set(condition)
+            return lambda i: values[i] in accepted
+
+        return lambda i: values[i] == condition
+
+    def where(self, **conditions: Any) -> array:
+        """
+        Indices of the rows matching every condition.
+        Dictionary-encoded columns are matched on their codes, so each distinct value is compared once.
+        :param conditions: column name -> value, set/list/tuple of accepted values, or callable receiving the value
+        and returning whether it matches, e.g. lastCom=lambda t: t < cutoff
+        :return: array of matching row indices
+        """
+        rows = range(len(self))
+        for name, condition in conditions.items():
+            matches = self._matches(name, condition)
+            rows = [i for i in rows if matches(i)]
+
+        return array("L", rows)
+
+    def take(self, rows: Sequence[int]) -> "DeviceTable":
+        """
+        :param rows: row indices to keep
+        :return: DeviceTable holding only those rows; dictionaries are shared
+        """
+        table = DeviceTable()
+        ids, names = self.ids, self.names
+        table.ids = [ids[i] for i in rows]
+        table.names = [names[i] for i in rows]
+        for name, column in self.numeric.items():
+            table.numeric[name] = array(column.typecode, [column[i] for i in rows])
+        for name, column in self.encoded.items():
+            table.encoded[name] = column.take(rows)
+        table.complete = self.complete
+
+        return table
+
+    def filter(self, **conditions: Any) -> "DeviceTable":
+        """
+        :param conditions: see where
+        :return: DeviceTable holding the rows matching every condition
+        """
+        return self.take(self.where(**conditions))
+
+    def count_by(self, name: str) -> Dict[Any, int]:
+        """
+        Group-by count of one column.
+        :param name: column name
+        :return: value -> number of rows holding it
+        """
+        if name in self.encoded:
+            column = self.encoded[name]
+            return {
+                column.values[code]: count
+                for code, count in Counter(column.codes).items()
+            }
+
+        return dict(Counter(self.column(name)))
+
+    def label(self, name: str, value: Optional[str]) -> Optional[str]:
+        """
+        :param name: dictionary-encoded column name
+        :param value: id held by the column
+        :return: display name recorded for that id, e.g. the device type name, or None
+        """
+        column = self.encoded[name]
+        code = column.lookup(value)
+
+        return None if code is None else column.names[code]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the numeric arrays and encoded codes, excluding strings."""
+        arrays = [*self.numeric.values(), *(c.codes for c in self.encoded.values())]
+
+        return sum(a.itemsize * len(a) for a in arrays)
@@ -0,0 +1,48 @@
+import time
+from typing import Dict, Iterable, Optional
+
+from sigfox_manager.models.schemas import DeviceType
+
+
+class DeviceTypeCatalog:
+    """
+    Snapshot of the device types visible to the user, indexed by id and by name.
+
+    Lookups are O(1). When several device types share a name, the first one returned
+    by the API wins, matching the linear scan it replaces.
+    """
+
+    def __init__(
+        self, device_types: Iterable[DeviceType], loaded_at: Optional[float] = None
+    ):
+        """
+        :param device_types: device types as returned by get_device_types
+        :param loaded_at: time.monotonic() timestamp of the snapshot; defaults to now
+        """
+        self.device_types = list(device_types)
+        self.loaded_at = time.monotonic() if loaded_at is None else loaded_at
+        self.by_id: Dict[str, DeviceType] = {}
+        self.by_name: Dict[str, DeviceType] = {}
+        for dt in self.device_types:
+            if not dt.id:
+                continue
+            self.by_id.setdefault(dt.id, dt)
+            if dt.name is not None:
+                self.by_name.setdefault(dt.name, dt)
+
+    def is_expired(self, ttl: Optional[float]) -> bool:
+        """
+        :param ttl: time-to-live in seconds; None never expires
+        :return: True if the snapshot is older than ttl
+        """
+        return ttl is not None and time.monotonic() - self.loaded_at >= ttl
+
+    def resolve(self, ref: str) -> Optional[str]:
+        """
+        Resolve a device type reference, trying the id first and then the exact (case-sensitive) name.
+        :param ref: Device type id or name
+        :return: Device type id, or None if the reference is unknown
+        """
+        dt = self.by_id.get(ref) or self.by_name.get(ref)
+
+        return dt.id if dt is not None else None
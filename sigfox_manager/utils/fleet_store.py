@@ -0,0 +1,481 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import Iterable, List, Optional, Set
+
+from sigfox_manager.models.schemas import ContractDetail, Device, DeviceType
+from sigfox_manager.utils.checkpoint import model_to_dict
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS contracts (
+    id TEXT PRIMARY KEY,
+    contract_id TEXT,
+    name TEXT,
+    last_edition_time INTEGER,
+    synced_at REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_contracts_contract_id ON contracts (contract_id);
+
+CREATE TABLE IF NOT EXISTS devices (
+    id TEXT PRIMARY KEY,
+    contract_id TEXT,
+    device_type_id TEXT,
+    state INTEGER,
+    com_state INTEGER,
+    last_com INTEGER,
+    last_edition_time INTEGER,
+    synced_at REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_devices_contract_id ON devices (contract_id);
+CREATE INDEX IF NOT EXISTS idx_devices_device_type_id ON devices (device_type_id);
+CREATE INDEX IF NOT EXISTS idx_devices_state ON devices (state);
+
+CREATE TABLE IF NOT EXISTS device_types (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    synced_at REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_device_types_name ON device_types (name);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    synced_at REAL NOT NULL,
+    value TEXT
+);
+
+-- State stored with the sync marks (lastEditionTime high-water marks); kept apart from
+-- sync_state so that invalidating a listing's freshness does not force a full resync
+CREATE TABLE IF NOT EXISTS sync_values (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class FleetStore:
+    """
+    Local SQLite mirror of the contracts, devices and device types of an account.
+
+    The database runs in WAL mode so several processes can read it while one of them
+    refreshes it. Each record keeps its full JSON payload next to indexed columns (id,
+    contract, device type, state) used for queries. Every thread gets its own connection.
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        """
+        :param path: SQLite database file; created if missing
+        :param timeout: seconds to wait for a lock held by another writer
+        """
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        with self._conn as conn:
+            conn.executescript(_SCHEMA)
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """
+        :return: this thread's connection; used as a context manager it commits on success and rolls back on error
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=self.timeout, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        """
+        Close every connection opened by the store.
+        """
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections = []
+        self._local = threading.local()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # Writes
+
+    @staticmethod
+    def _contract_row(contract: ContractDetail, now: float) -> tuple:
+        return (
+            contract.id,
+            contract.contractId,
+            contract.name,
+            contract.lastEditionTime,
+            now,
+            json.dumps(model_to_dict(contract)),
+        )
+
+    @staticmethod
+    def _device_row(device: Device, contract_id: Optional[str], now: float) -> tuple:
+        if contract_id is None and device.contract is not None:
+            contract_id = device.contract.id
+        return (
+            device.id,
+            contract_id,
+            device.deviceType.id if device.deviceType is not None else None,
+            device.state,
+            device.comState,
+            device.lastCom,
+            device.lastEditionTime,
+            now,
+            json.dumps(model_to_dict(device)),
+        )
+
+    @staticmethod
+    def _device_type_row(device_type: DeviceType, now: float) -> tuple:
+        return (
+            device_type.id,
+            device_type.name,
+            now,
+            json.dumps(model_to_dict(device_type)),
+        )
+
+    def upsert_contracts(self, contracts: Iterable[ContractDetail]) -> None:
+        """
+        Insert or update contracts.
+        :param contracts: contracts as returned by get_contracts
+        """
+        now = time.time()
+        with self._conn as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO contracts VALUES (?, ?, ?, ?, ?, ?)",
+                [self._contract_row(c, now) for c in contracts],
+            )
+
+    def upsert_devices(
+        self, devices: Iterable[Device], contract_id: Optional[str] = None
+    ) -> None:
+        """
+        Insert or update devices.
+        :param devices: devices as returned by get_devices_by_contract or get_device_info
+        :param contract_id: contract the devices were listed from; defaults to Device.contract.id
+        """
+        now = time.time()
+        with self._conn as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO devices VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [self._device_row(d, contract_id, now) for d in devices],
+            )
+
+    def upsert_device_types(self, device_types: Iterable[DeviceType]) -> None:
+        """
+        Insert or update device types.
+        :param device_types: device types as returned by get_device_types
+        """
+        now = time.time()
+        with self._conn as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO device_types VALUES (?, ?, ?, ?)",
+                [self._device_type_row(dt, now) for dt in device_types if dt.id],
+            )
+
+    def replace_contracts(self, contracts: Iterable[ContractDetail]) -> None:
+        """
+        Mirror a complete contracts listing: upsert it, drop contracts no longer listed and mark it synced.
+        :param contracts: every contract visible to the user
+        """
+        now = time.time()
+        rows = [self._contract_row(c, now) for c in contracts]
+        with self._conn as conn:
+            conn.execute("DELETE FROM contracts")
+            conn.executemany(
+                "INSERT OR REPLACE INTO contracts VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+            self._mark_synced(conn, "contracts", now, self._high_water_mark(rows, 3))
+
+    def replace_contract_devices(
+        self, contract_id: str, devices: Iterable[Device]
+    ) -> None:
+        """
+        Mirror a complete device listing of a contract: upsert it, drop the contract's devices no longer
+        listed and mark it synced.
+        :param contract_id: contract the devices were listed from
+        :param devices: every device of the contract
+        """
+        now = time.time()
+        rows = [self._device_row(d, contract_id, now) for d in devices]
+        with self._conn as conn:
+            conn.execute("DELETE FROM devices WHERE contract_id = ?", (contract_id,))
+            conn.executemany(
+                "INSERT OR REPLACE INTO devices VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._mark_synced(
+                conn, f"devices:{contract_id}", now, self._high_water_mark(rows, 6)
+            )
+
+    def replace_device_types(self, device_types: Iterable[DeviceType]) -> None:
+        """
+        Mirror a complete device types listing and mark it synced.
+        :param device_types: every device type visible to the user
+        """
+        now = time.time()
+        rows = [self._device_type_row(dt, now) for dt in device_types if dt.id]
+        with self._conn as conn:
+            conn.execute("DELETE FROM device_types")
+            conn.executemany(
+                "INSERT OR REPLACE INTO device_types VALUES (?, ?, ?, ?)", rows
+            )
+            self._mark_synced(conn, "device_types", now)
+
+    def apply_contract_delta(
+        self,
+        upserts: Iterable[ContractDetail],
+        removed_ids: Iterable[str],
+        high_water_mark: int,
+    ) -> None:
+        """
+        Apply the changes found by an incremental sync of the contracts listing in one transaction.
+        :param upserts: added and changed contracts
+        :param removed_ids: ids of the contracts no longer listed
+        :param high_water_mark: highest lastEditionTime of the listing
+        """
+        now = time.time()
+        with self._conn as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO contracts VALUES (?, ?, ?, ?, ?, ?)",
+                [self._contract_row(c, now) for c in upserts],
+            )
+            conn.executemany(
+                "DELETE FROM contracts WHERE id = ?", [(i,) for i in removed_ids]
+            )
+            self._mark_synced(conn, "contracts", now, str(high_water_mark))
+
+    def apply_device_delta(
+        self,
+        contract_id: str,
+        upserts: Iterable[Device],
+        removed_ids: Iterable[str],
+        high_water_mark: int,
+    ) -> None:
+        """
+        Apply the changes found by an incremental sync of a contract's devices in one transaction.
+        :param contract_id: contract the devices were listed from
+        :param upserts: added and changed devices
+        :param removed_ids: ids of the devices no longer listed
+        :param high_water_mark: highest lastEditionTime of the listing
+        """
+        now = time.time()
+        with self._conn as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO devices VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [self._device_row(d, contract_id, now) for d in upserts],
+            )
+            # A device that moved to another contract keeps the row written by that contract
+            conn.executemany(
+                "DELETE FROM devices WHERE id = ? AND contract_id = ?",
+                [(i, contract_id) for i in removed_ids],
+            )
+            self._mark_synced(conn, f"devices:{contract_id}", now, str(high_water_mark))
+
+    @staticmethod
+    def _high_water_mark(rows: List[tuple], column: int) -> Optional[str]:
+        editions = [r[column] for r in rows if r[column] is not None]
+        return str(max(editions)) if editions else None
+
+    def high_water_mark(self, key: str) -> Optional[int]:
+        """
+        :param key: listing name, e.g. "contracts" or "devices:<contract id>"
+        :return: highest lastEditionTime recorded by the last complete sync of the listing, or None
+        """
+        value = self.sync_value(key)
+        return int(value) if value is not None else None
+
+    def delete_devices(self, dev_ids: Iterable[str]) -> None:
+        """
+        :param dev_ids: ids of the devices to remove from the mirror
+        """
+        with self._conn as conn:
+            conn.executemany(
+                "DELETE FROM devices WHERE id = ?", [(i,) for i in dev_ids]
+            )
+
+    # Sync bookkeeping
+
+    @staticmethod
+    def _mark_synced(
+        conn: sqlite3.Connection, key: str, now: float, value: Optional[str] = None
+    ) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO sync_state VALUES (?, ?, NULL)", (key, now)
+        )
+        if value is None:
+            conn.execute("DELETE FROM sync_values WHERE key = ?", (key,))
+        else:
+            conn.execute(
+                "INSERT OR REPLACE INTO sync_values VALUES (?, ?)", (key, value)
+            )
+
+    def mark_synced(self, key: str, value: Optional[str] = None) -> None:
+        """
+        Record that a listing was mirrored completely.
+        :param key: listing name, e.g. "contracts", "device_types" or "devices:<contract id>"
+        :param value: optional state stored with the mark
+        """
+        with self._conn as conn:
+            self._mark_synced(conn, key, time.time(), value)
+
+    def synced_at(self, key: str) -> Optional[float]:
+        """
+        :param key: listing name, see mark_synced
+        :return: epoch seconds of the last complete sync, or None if it was never synced
+        """
+        row = self._conn.execute(
+            "SELECT synced_at FROM sync_state WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def sync_value(self, key: str) -> Optional[str]:
+        """
+        :param key: listing name, see mark_synced
+        :return: state stored with the last sync mark, or None; kept when the mark is invalidated
+        """
+        row = self._conn.execute(
+            "SELECT value FROM sync_values WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def invalidate(self, key_prefix: str = "") -> None:
+        """
+        Forget sync marks so the matching listings are fetched again; mirrored records and the state stored
+        with the marks (see sync_value) are kept, so incremental syncs resume from their high-water marks.
+        :param key_prefix: prefix of the listing names to invalidate, e.g. "devices:"; empty invalidates all
+        """
+        with self._conn as conn:
+            conn.execute(
+                "DELETE FROM sync_state WHERE substr(key, 1, ?) = ?",
+                (len(key_prefix), key_prefix),
+            )
+
+    def is_fresh(self, key: str, max_age: Optional[float]) -> bool:
+        """
+        :param key: listing name, see mark_synced
+        :param max_age: seconds a sync stays valid; None keeps it valid forever
+        :return: True if the listing was synced and is not older than max_age
+        """
+        synced_at = self.synced_at(key)
+        if synced_at is None:
+            return False
+
+        return max_age is None or time.time() - synced_at <= max_age
+
+    # Reads
+
+    def get_contracts(self) -> List[ContractDetail]:
+        """
+        :return: mirrored contracts
+        """
+        rows = self._conn.execute(
+            "SELECT payload FROM contracts ORDER BY rowid"
+        ).fetchall()
+        return [ContractDetail(**json.loads(r[0])) for r in rows]
+
+    def contract_ids(self) -> Set[str]:
+        """
+        :return: ids of the mirrored contracts
+        """
+        return {r[0] for r in self._conn.execute("SELECT id FROM contracts")}
+
+    def device_ids(self, contract_id: str) -> Set[str]:
+        """
+        :param contract_id: contract the devices were listed from
+        :return: ids of the mirrored devices of the contract
+        """
+        rows = self._conn.execute(
+            "SELECT id FROM devices WHERE contract_id = ?", (contract_id,)
+        )
+        return {r[0] for r in rows}
+
+    def get_device(
+        self, dev_id: str, max_age: Optional[float] = None
+    ) -> Optional[Device]:
+        """
+        :param dev_id: Sigfox ID of the device
+        :param max_age: ignore the record if it was stored more than max_age seconds ago; None accepts any age
+        :return: mirrored Device, or None if it is not in the store
+        """
+        row = self._conn.execute(
+            "SELECT payload, synced_at FROM devices WHERE id = ?", (dev_id,)
+        ).fetchone()
+        if row is None or (max_age is not None and time.time() - row[1] > max_age):
+            return None
+
+        return Device(**json.loads(row[0]))
+
+    def get_devices(
+        self,
+        contract_id: Optional[str] = None,
+        device_type_id: Optional[str] = None,
+        state: Optional[int] = None,
+    ) -> List[Device]:
+        """
+        Query mirrored devices through the indexed columns.
+        :param contract_id: only devices listed from this contract
+        :param device_type_id: only devices of this device type
+        :param state: only devices in this state
+        :return: matching devices
+        """
+        clauses, params = self._device_filters(contract_id, device_type_id, state)
+        rows = self._conn.execute(
+            f"SELECT payload FROM devices{clauses} ORDER BY rowid", params
+        ).fetchall()
+        return [Device(**json.loads(r[0])) for r in rows]
+
+    def count_devices(
+        self,
+        contract_id: Optional[str] = None,
+        device_type_id: Optional[str] = None,
+        state: Optional[int] = None,
+    ) -> int:
+        """
+        :param contract_id: only devices listed from this contract
+        :param device_type_id: only devices of this device type
+        :param state: only devices in this state
+        :return: number of matching devices
+        """
+        clauses, params = self._device_filters(contract_id, device_type_id, state)
+        return self._conn.execute(
+            f"SELECT COUNT(*) FROM devices{clauses}", params
+        ).fetchone()[0]
+
+    @staticmethod
+    def _device_filters(contract_id, device_type_id, state):
+        conditions, params = [], []
+        for column, value in (
+            ("contract_id", contract_id),
+            ("device_type_id", device_type_id),
+            ("state", state),
+        ):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        clauses = " WHERE " + " AND ".join(conditions) if conditions else ""
+        return clauses, params
+
+    def get_device_types(self) -> List[DeviceType]:
+        """
+        :return: mirrored device types
+        """
+        rows = self._conn.execute(
+            "SELECT payload FROM device_types ORDER BY rowid"
+        ).fetchall()
+        return [DeviceType(**json.loads(r[0])) for r in rows]
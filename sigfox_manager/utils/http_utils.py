@@ -1,24 +1,174 @@
-import json
+import time
+from typing import Callable, Optional, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from sigfox_manager.utils import json_backend
+from sigfox_manager.utils.rate_limit import RetryPolicy, TokenBucket
+from sigfox_manager.utils.single_flight import SingleFlight
 
-def do_get(url: str, auth: bytes) -> requests.Response:
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+# (connect, read) timeouts in seconds applied to every request
+DEFAULT_TIMEOUT = (10.0, 60.0)
+
+Timeout = Optional[Union[float, Tuple[float, float]]]
+
+
+class HttpTransport:
+    """
+    Pooled keep-alive HTTP transport shared by every call of a SigfoxManager.
+
+    Wraps a requests.Session with a mounted HTTPAdapter so consecutive requests to
+    api.sigfox.com reuse the same TCP/TLS connection instead of opening a new one.
+    An optional TokenBucket paces every request sharing the transport, and throttled
+    (429) or failing (5xx) responses are retried following the RetryPolicy. Concurrent GETs
+    of the same URL are coalesced into one upstream request whose response every caller shares.
+    """
+
+    def __init__(
+        self,
+        auth: bytes,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        session: Optional[requests.Session] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        coalesce_gets: bool = True,
+    ):
+        """
+        :param auth: Authorization header value (base64 encoded user:password)
+        :param pool_connections: number of per-host connection pools to keep cached
+        :param pool_maxsize: maximum number of connections kept alive per host
+        :param pool_block: if True, block when all connections of a host are busy instead of opening extra ones
+        :param session: optional pre-configured requests.Session to use instead of creating one; it is left open
+        by close(), so it can be shared
+        :param rate_limiter: optional token bucket shared by every request of the transport
+        :param retry_policy: retry schedule for 429/5xx responses; defaults to RetryPolicy()
+        :param timeout: (connect, read) timeouts in seconds, or one value for both; None waits forever
+        :param coalesce_gets: if True, identical GETs in flight at the same time share one upstream request
+        """
+        # Only a session created here is closed by close()
+        self._owns_session = session is None
+        self.session = session if session is not None else requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.auth_header = f"Basic {auth.decode('utf-8')}"
+        self.session.headers["Authorization"] = self.auth_header
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.timeout = timeout
+        self.single_flight = SingleFlight() if coalesce_gets else None
+
+    def _send(
+        self, send: Callable[[], requests.Response], idempotent: bool
+    ) -> requests.Response:
+        """
+        Send a request through the rate limiter, retrying throttled and failing responses.
+        :param send: callable performing one attempt of the request
+        :param idempotent: whether 5xx responses may be retried as well as 429
+        :return: requests.Response object of the last attempt
+        """
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+
+            response = send()
+
+            if not self.retry_policy.should_retry(
+                response.status_code, attempt, idempotent=idempotent
+            ):
+                return response
+
+            delay = self.retry_policy.delay(
+                attempt, response.headers.get("Retry-After")
+            )
+            if response.status_code == 429 and self.rate_limiter is not None:
+                # Quota exhausted: pause every caller sharing the bucket, not just this one
+                self.rate_limiter.penalize(delay)
+            else:
+                time.sleep(delay)
+            attempt += 1
+
+    def get(self, url: str) -> requests.Response:
+        """
+        Do an HTTP GET Request over the pooled session
+        :param url: URL to perform the GET request to
+        :return: requests.Response object, shared with concurrent callers of the same URL
+        """
+
+        def send():
+            return self._send(
+                lambda: self.session.get(url, timeout=self.timeout), idempotent=True
+            )
+
+        if self.single_flight is None:
+            return send()
+
+        return self.single_flight.do(url, send)
+
+    def post(
+        self, url: str, payload: dict, headers: Optional[dict] = None
+    ) -> requests.Response:
+        """
+        Do an HTTP POST Request over the pooled session
+        :param url: URL to perform the POST request to
+        :param payload: JSON payload to send
+        :param headers: Additional headers to send
+        :return: requests.Response object
+        """
+        data = json_backend.dumps(payload)
+
+        return self._send(
+            lambda: self.session.post(
+                url, data=data, headers=headers, timeout=self.timeout
+            ),
+            idempotent=False,
+        )
+
+    def close(self) -> None:
+        """
+        Close every pooled connection held by the transport, unless its session was passed in.
+        """
+        if self._owns_session:
+            self.session.close()
+
+
+def do_get(
+    url: str, auth: bytes, transport: Optional[HttpTransport] = None
+) -> requests.Response:
     """
     Do an HTTP GET Request
     :param url: URL to perform the GET request to
     :param auth: Authorization header value
+    :param transport: optional pooled transport; when given, the request reuses its connections and auth header
     :return: requests.Response object
     """
+    if transport is not None:
+        return transport.get(url)
+
     payload = {}
     headers = {"Authorization": f"Basic {auth.decode('utf-8')}"}
-    response = requests.get(url, headers=headers, data=payload)
+    response = requests.get(url, headers=headers, data=payload, timeout=DEFAULT_TIMEOUT)
 
     return response
 
 
 def do_post(
-    url: str, payload: dict, auth: bytes, headers: dict = dict()
+    url: str,
+    payload: dict,
+    auth: bytes,
+    headers: dict = dict(),
+    transport: Optional[HttpTransport] = None,
 ) -> requests.Response:
     """
     Do an HTTP POST Request
@@ -26,15 +176,21 @@ def do_post(
     :param payload: JSON payload to send
     :param auth: Authorization header value
     :param headers: Additional headers to send
+    :param transport: optional pooled transport; when given, the request reuses its connections and auth header
     :return: requests.Response object
     """
+    if transport is not None:
+        return transport.post(url, payload, headers=headers)
+
     if headers is None:
         headers = {"Authorization": f"Basic {auth.decode('utf-8')}"}
     else:
         headers["Authorization"] = f"Basic {auth.decode('utf-8')}"
 
-    payload_dict = json.dumps(payload)
+    payload_dict = json_backend.dumps(payload)
 
-    response = requests.post(url, data=payload_dict, headers=headers)
+    response = requests.post(
+        url, data=payload_dict, headers=headers, timeout=DEFAULT_TIMEOUT
+    )
 
     return response
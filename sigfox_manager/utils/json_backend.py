@@ -0,0 +1,105 @@
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the fast extra
+    orjson = None
+
+
+class JsonBackend:
+    """
+    Pair of JSON decode/encode functions used for every API response and request body.
+
+    loads must accept bytes as well as str so responses can be parsed straight from the
+    raw body, without decoding it to a Python str first. dumps may return bytes or str;
+    both are valid request bodies for requests and httpx.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loads: Callable[[Union[bytes, str]], Any],
+        dumps: Callable[[Any], Union[bytes, str]],
+    ):
+        """
+        :param name: backend name, for display only
+        :param loads: callable decoding a JSON document from bytes or str
+        :param dumps: callable encoding an object to a JSON document
+        """
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self) -> str:
+        return f"JsonBackend({self.name!r})"
+
+
+STDLIB_BACKEND = JsonBackend("json", json.loads, json.dumps)
+ORJSON_BACKEND = (
+    JsonBackend("orjson", orjson.loads, orjson.dumps) if orjson is not None else None
+)
+
+_backend = ORJSON_BACKEND if ORJSON_BACKEND is not None else STDLIB_BACKEND
+
+
+def get_json_backend() -> JsonBackend:
+    """
+    :return: JSON backend currently in use
+    """
+    return _backend
+
+
+def set_json_backend(backend: Optional[Union[str, JsonBackend]] = None) -> JsonBackend:
+    """
+    Select the JSON backend used by every manager.
+    :param backend: "orjson", "json", a JsonBackend instance, or None for the fastest one installed
+    :return: the backend now in use
+    :raises ValueError: if the named backend is unknown or not installed
+    """
+    global _backend
+
+    if backend is None:
+        backend = ORJSON_BACKEND if ORJSON_BACKEND is not None else STDLIB_BACKEND
+    elif backend == "json":
+        backend = STDLIB_BACKEND
+    elif backend == "orjson":
+        if ORJSON_BACKEND is None:
+            raise ValueError("orjson is not installed")
+        backend = ORJSON_BACKEND
+    elif not isinstance(backend, JsonBackend):
+        raise ValueError(f"Unknown JSON backend: {backend!r}")
+
+    _backend = backend
+
+    return _backend
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    :param data: JSON document as bytes or str
+    :return: decoded object
+    """
+    return _backend.loads(data)
+
+
+def dumps(obj: Any) -> Union[bytes, str]:
+    """
+    :param obj: JSON serialisable object
+    :return: encoded JSON document, as bytes or str depending on the backend
+    """
+    return _backend.dumps(obj)
+
+
+def response_json(resp) -> Any:
+    """
+    Decode the JSON body of a requests or httpx response from its raw bytes.
+    Falls back to the decoded text when the response exposes no raw body.
+    :param resp: response object
+    :return: decoded object
+    """
+    content = getattr(resp, "content", None)
+    if isinstance(content, (bytes, bytearray)):
+        return _backend.loads(content)
+
+    return _backend.loads(resp.text)
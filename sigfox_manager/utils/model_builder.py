@@ -0,0 +1,175 @@
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from pydantic import BaseModel
+
+from sigfox_manager.models.records import RecordPage, record_class
+from sigfox_manager.models.schemas import Paging
+
+PARSE_VALIDATE = "validate"
+PARSE_TRUSTED = "trusted"
+PARSE_RAW = "raw"
+PARSE_RECORDS = "records"
+PARSE_MODES = (PARSE_VALIDATE, PARSE_TRUSTED, PARSE_RAW, PARSE_RECORDS)
+# Modes returning pydantic models; the others return plain dicts or Record objects
+MODEL_PARSE_MODES = (PARSE_VALIDATE, PARSE_TRUSTED)
+
+PYDANTIC_V2 = hasattr(BaseModel, "model_construct")
+
+M = TypeVar("M", bound=BaseModel)
+
+_MISSING = object()
+# Per listing response class: model of its items, or None for models that are not listings
+_listing_items: Dict[type, Optional[type]] = {}
+# Per model class: (field names, [(field name, converter building the nested models of its raw value)])
+_plans: Dict[type, Tuple[frozenset, List[Tuple[str, Callable[[Any], Any]]]]] = {}
+
+
+def check_parse_mode(parse_mode: str, allowed: Tuple[str, ...] = PARSE_MODES) -> str:
+    """
+    :param parse_mode: parse mode to check
+    :param allowed: accepted parse modes
+    :return: parse_mode
+    :raises ValueError: if parse_mode is not one of allowed
+    """
+    if parse_mode not in allowed:
+        raise ValueError(
+            f"Invalid parse_mode: {parse_mode!r}. Expected one of {', '.join(allowed)}."
+        )
+
+    return parse_mode
+
+
+def _converter(annotation) -> Optional[Callable[[Any], Any]]:
+    """
+    :param annotation: field type annotation
+    :return: callable building the nested models held by a raw value of that type, or None if it holds none
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return lambda value: (
+            build_trusted(annotation, value) if isinstance(value, dict) else value
+        )
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Union:
+        converters = [_converter(arg) for arg in args if arg is not type(None)]
+        return converters[0] if len(converters) == 1 else None
+    if origin is list and args:
+        item = _converter(args[0])
+        if item is None:
+            return None
+        return lambda value: (
+            [item(v) for v in value] if isinstance(value, list) else value
+        )
+
+    return None
+
+
+def _plan(cls: type):
+    """
+    :param cls: pydantic v1 model class
+    :return: (field names, [(field name, converter)] for the fields holding nested models)
+    """
+    hints = get_type_hints(cls)
+    fields = cls.__fields__
+    nested = [(name, _converter(hints[name])) for name in fields]
+
+    return frozenset(fields), [
+        (name, convert) for name, convert in nested if convert is not None
+    ]
+
+
+def build_trusted(cls: Type[M], data: dict) -> M:
+    """
+    Build a model and its nested models from trusted JSON without validating it.
+    Values are neither checked nor coerced, and keys that are not fields of the model are dropped.
+    The nested model layout of each class is computed once and reused.
+    Under pydantic v2 the model's compiled validator, built once per class, is faster than any
+    instance construction done from Python, so the data is validated by it instead.
+    :param cls: pydantic model class
+    :param data: decoded JSON object
+    :return: cls instance
+    """
+    if PYDANTIC_V2:
+        return cls(**data)
+
+    plan = _plans.get(cls)
+    if plan is None:
+        plan = _plans[cls] = _plan(cls)
+
+    fields, nested = plan
+    values = {name: value for name, value in data.items() if name in fields}
+    for name, convert in nested:
+        value = values.get(name)
+        if value is not None:
+            values[name] = convert(value)
+
+    return cls.construct(**values)
+
+
+def _listing_item(cls: type) -> Optional[type]:
+    """
+    :param cls: pydantic model class
+    :return: item model of a listing response (data: List[Model] and paging fields), None for other models
+    """
+    item = _listing_items.get(cls, _MISSING)
+    if item is _MISSING:
+        item = None
+        hints = get_type_hints(cls)
+        if "paging" in hints and get_origin(hints.get("data")) is list:
+            (item,) = get_args(hints["data"])
+        _listing_items[cls] = item
+
+    return item
+
+
+def build_records(cls: type, data: dict, parse_mode: str):
+    """
+    Build the "raw" or "records" form of a response without creating any pydantic model.
+    :param cls: response model the JSON would be validated against
+    :param data: decoded JSON object
+    :param parse_mode: "raw" keeps items as the decoded dicts, "records" wraps each in a Record
+    :return: RecordPage for listing responses, otherwise the dict or Record of the single item
+    """
+    item = _listing_item(cls)
+    if item is None:
+        return data if parse_mode == PARSE_RAW else record_class(cls).from_dict(data)
+
+    items = data.get("data") or []
+    if parse_mode == PARSE_RECORDS:
+        from_dict = record_class(item).from_dict
+        items = [from_dict(i) for i in items]
+    paging = data.get("paging") or {}
+
+    return RecordPage(
+        items, Paging(next=paging.get("next")), data.get("complete", True)
+    )
+
+
+def build_model(cls: Type[M], data: dict, parse_mode: str = PARSE_VALIDATE) -> M:
+    """
+    :param cls: pydantic model class
+    :param data: decoded JSON object
+    :param parse_mode: "validate" runs full pydantic validation, "trusted" skips it (see build_trusted),
+    "raw" and "records" build no model at all (see build_records)
+    :return: cls instance, or its raw/records form
+    """
+    if parse_mode == PARSE_VALIDATE:
+        return cls(**data)
+    if parse_mode == PARSE_TRUSTED:
+        return build_trusted(cls, data)
+
+    return build_records(cls, data, parse_mode)
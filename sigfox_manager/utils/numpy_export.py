@@ -0,0 +1,156 @@
+from typing import Any, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without the numpy extra
+    np = None
+
+from sigfox_manager.models.records import get_field
+
+# Structured array layouts; "message" is the row index in the messages table and joins the two tables.
+# Integer columns hold -1 and float columns NaN when the API omitted the value.
+MESSAGE_FIELDS = [
+    ("message", "i8"),
+    ("device", "U16"),
+    ("time", "i8"),
+    ("seqNumber", "i8"),
+    ("data", "U24"),
+    ("lqi", "i1"),
+    ("nbFrames", "i1"),
+    ("ackRequired", "?"),
+    ("rinfoCount", "i2"),
+    ("lat", "f8"),
+    ("lng", "f8"),
+    ("radius", "i4"),
+    ("source", "i2"),
+]
+RINFO_FIELDS = [
+    ("message", "i8"),
+    ("baseStation", "U16"),
+    ("rssi", "f4"),
+    ("rssiRepeaters", "f4"),
+    ("lat", "f8"),
+    ("lng", "f8"),
+    ("freq", "f8"),
+    ("freqRepeaters", "f8"),
+    ("rep", "i2"),
+    ("repetitions", "i2"),
+    ("cbStatus", "i2"),
+]
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "messages_to_numpy requires numpy. "
+            "Install it with: pip install sigfox-manager[numpy]"
+        )
+
+
+def _floats(values: List[Any]) -> "np.ndarray":
+    """
+    Convert the numeric strings sent by the API ("-121.00") to float64 in one vectorized pass.
+    :param values: strings, numbers or None
+    :return: float64 array with NaN for missing or empty values
+    """
+    text = np.array(["nan" if v is None or v == "" else v for v in values], dtype=str)
+
+    return text.astype(np.float64)
+
+
+def _ints(values: List[Any], dtype: str) -> "np.ndarray":
+    """
+    :param values: integers or None
+    :param dtype: numpy integer dtype
+    :return: array with -1 for missing values
+    """
+    return np.fromiter(
+        (-1 if v is None else v for v in values), dtype=dtype, count=len(values)
+    )
+
+
+def messages_to_numpy(
+    messages: Iterable[Any], dev_id: Optional[str] = None
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Export device messages to two NumPy structured arrays: one row per message and one row per
+    rinfo reception, joined on the "message" column (the message's row index).
+    Messages may be DeviceMessage models, Records or raw dicts, so any parse mode can be exported;
+    the rssi, lat and lng strings of the rinfos are converted to floats column-wise.
+    The first computed location of each message fills its lat/lng/radius/source columns.
+    :param messages: DeviceMessagesResponse, RecordPage, PageIterator or any iterable of messages
+    :param dev_id: device id used for messages that do not carry their device
+    :return: (messages array with MESSAGE_FIELDS, rinfos array with RINFO_FIELDS)
+    :raises ImportError: if numpy is not installed
+    """
+    _require_numpy()
+
+    items = getattr(messages, "data", messages)
+    msg_cols = {name: [] for name, _ in MESSAGE_FIELDS}
+    rinfo_cols = {name: [] for name, _ in RINFO_FIELDS}
+    location_fields = ("lat", "lng", "radius", "source")
+
+    for index, message in enumerate(items):
+        device = get_field(message, "device")
+        msg_cols["message"].append(index)
+        msg_cols["device"].append(
+            get_field(device, "id") if device is not None else dev_id
+        )
+        for name in ("time", "seqNumber", "data", "lqi", "nbFrames", "ackRequired"):
+            msg_cols[name].append(get_field(message, name))
+
+        locations = get_field(message, "computedLocation") or ()
+        location = locations[0] if locations else None
+        for name in location_fields:
+            msg_cols[name].append(
+                get_field(location, name) if location is not None else None
+            )
+
+        rinfos = get_field(message, "rinfos") or ()
+        msg_cols["rinfoCount"].append(len(rinfos))
+        for rinfo in rinfos:
+            base_station = get_field(rinfo, "baseStation")
+            cb_status = get_field(rinfo, "cbStatus")
+            rinfo_cols["message"].append(index)
+            rinfo_cols["baseStation"].append(
+                get_field(base_station, "id") if base_station is not None else None
+            )
+            for name in (
+                "rssi",
+                "rssiRepeaters",
+                "lat",
+                "lng",
+                "freq",
+                "freqRepeaters",
+                "rep",
+            ):
+                rinfo_cols[name].append(get_field(rinfo, name))
+            rinfo_cols["repetitions"].append(len(get_field(rinfo, "repetitions") or ()))
+            rinfo_cols["cbStatus"].append(
+                get_field(cb_status, "status") if cb_status is not None else None
+            )
+
+    return _table(MESSAGE_FIELDS, msg_cols), _table(RINFO_FIELDS, rinfo_cols)
+
+
+def _table(fields: List[Tuple[str, str]], columns: dict) -> "np.ndarray":
+    """
+    :param fields: (name, dtype) of each column
+    :param columns: column name -> list of Python values
+    :return: structured array
+    """
+    size = len(columns[fields[0][0]])
+    table = np.empty(size, dtype=fields)
+    for name, dtype in fields:
+        values = columns[name]
+        kind = np.dtype(dtype).kind
+        if kind == "f":
+            table[name] = _floats(values)
+        elif kind == "i":
+            table[name] = _ints(values, dtype)
+        elif kind == "b":
+            table[name] = [bool(v) for v in values]
+        else:
+            table[name] = ["" if v is None else v for v in values]
+
+    return table
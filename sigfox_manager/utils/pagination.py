@@ -0,0 +1,96 @@
+from typing import Any, Callable, Iterator, Optional
+
+_END = object()
+
+
+class PageIterator:
+    """
+    Iterator over the items of a paginated Sigfox listing.
+
+    Only the page being consumed is kept in memory. At any point, `cursor` and `skip`
+    describe where to resume: the URL of the first page that was not fully consumed and
+    how many of its items were already yielded. Once the listing is exhausted `cursor`
+    is None, unless a page could not be fetched, in which case `complete` is False and
+    `cursor` points at the page that failed.
+    """
+
+    def __init__(
+        self,
+        pages: Iterator[Any],
+        start_url: str,
+        skip: int = 0,
+        max_items: Optional[int] = None,
+        stop_when: Optional[Callable[[Any], bool]] = None,
+    ):
+        """
+        :param pages: iterator of parsed response pages (objects with data and paging)
+        :param start_url: URL of the first page produced by pages
+        :param skip: number of items of the first page to drop, as recorded by a previous iterator
+        :param max_items: stop after yielding this many items; cursor/skip then point at the next one
+        :param stop_when: predicate marking the first item past the end of an ordered listing;
+        the iteration ends there and is considered complete
+        """
+        self._pages = pages
+        self._items: Iterator[Any] = iter(())
+        self._page_next: Optional[str] = start_url
+        self._to_skip = skip
+        self.cursor: Optional[str] = start_url
+        self.skip = skip
+        self.pages_fetched = 0
+        self.complete = False
+        self.items_yielded = 0
+        self._max_items = max_items
+        self._stop_when = stop_when
+
+    def __iter__(self) -> "PageIterator":
+        return self
+
+    def __next__(self) -> Any:
+        if self._max_items is not None and self.items_yielded >= self._max_items:
+            raise StopIteration
+
+        while True:
+            item = next(self._items, _END)
+            if item is not _END:
+                if self._stop_when is not None and self._stop_when(item):
+                    self._finish()
+                    raise StopIteration
+                self.skip += 1
+                self.items_yielded += 1
+                return item
+
+            # The current page is exhausted; resume from the one after it
+            self.cursor, self.skip = self._page_next, 0
+            if self.cursor is None:
+                self.complete = True
+                raise StopIteration
+
+            page = next(self._pages, _END)
+            if page is _END:
+                # The page at self.cursor could not be fetched
+                raise StopIteration
+
+            self.pages_fetched += 1
+            self._page_next = page.paging.next if page.paging else None
+            self._items = iter(page.data)
+            if self._to_skip:
+                for _ in range(self._to_skip):
+                    next(self._items, None)
+                self.skip, self._to_skip = self._to_skip, 0
+
+    def _finish(self) -> None:
+        """
+        Mark the listing as fully read and drop the remaining pages.
+        """
+        self.cursor, self.skip, self.complete = None, 0, True
+        self._items = iter(())
+        self._page_next = None
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stop the iteration early and release the prefetching worker.
+        """
+        close = getattr(self._pages, "close", None)
+        if close is not None:
+            close()
@@ -0,0 +1,72 @@
+from typing import Dict, Optional
+
+from sigfox_manager.models.schemas import DeviceMessageStats
+
+SECONDS_PER_DAY = 86400.0
+DEFAULT_MIN_INTERVAL = 60.0
+DEFAULT_MAX_INTERVAL = SECONDS_PER_DAY
+# Polls per expected message: 2 polls per message interval keep the average delay under half of it
+DEFAULT_POLLS_PER_MESSAGE = 2.0
+
+
+def message_rate(stats: Optional[DeviceMessageStats]) -> float:
+    """
+    Estimate a device's message rate from its metrics, preferring the most recent window with traffic.
+    :param stats: result of get_device_message_number, or None if unknown
+    :return: expected messages per second
+    """
+    if stats is None:
+        return 0.0
+    for count, days in ((stats.lastDay, 1), (stats.lastWeek, 7), (stats.lastMonth, 30)):
+        if count:
+            return count / (days * SECONDS_PER_DAY)
+
+    return 0.0
+
+
+def base_interval(
+    rate: float,
+    last_com_age: Optional[float] = None,
+    min_interval: float = DEFAULT_MIN_INTERVAL,
+    max_interval: float = DEFAULT_MAX_INTERVAL,
+    polls_per_message: float = DEFAULT_POLLS_PER_MESSAGE,
+) -> float:
+    """
+    Polling interval of one device before the global budget is applied.
+    A device with traffic is polled polls_per_message times per expected message interval. A device without
+    recent traffic is polled at half the time since its last communication, so it backs off the longer it
+    stays silent.
+    :param rate: expected messages per second, see message_rate
+    :param last_com_age: seconds since the device last communicated, or None if unknown
+    :param min_interval: shortest interval in seconds
+    :param max_interval: longest interval in seconds
+    :param polls_per_message: polls per expected message interval
+    :return: interval in seconds within [min_interval, max_interval]
+    """
+    if rate > 0:
+        interval = 1.0 / (rate * polls_per_message)
+    elif last_com_age is not None:
+        interval = last_com_age / polls_per_message
+    else:
+        interval = max_interval
+
+    return min(max(interval, min_interval), max_interval)
+
+
+def fit_budget(
+    intervals: Dict[str, float], requests_per_hour: Optional[float]
+) -> Dict[str, float]:
+    """
+    Stretch every interval by the same factor so the schedule stays within a request budget.
+    Relative priorities are kept: hot devices are still polled more often than dormant ones.
+    :param intervals: polling interval in seconds per device
+    :param requests_per_hour: maximum polls per hour across every device; None disables the budget
+    :return: intervals in seconds per device
+    """
+    if requests_per_hour is None or not intervals:
+        return dict(intervals)
+
+    demand = sum(3600.0 / interval for interval in intervals.values())
+    factor = max(1.0, demand / requests_per_hour)
+
+    return {dev_id: interval * factor for dev_id, interval in intervals.items()}
@@ -0,0 +1,144 @@
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional, Tuple
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting the request rate of every call sharing it.
+
+    Tokens refill continuously at `rate` per second up to `capacity`; acquire() blocks
+    until a token is available, so bursts up to `capacity` go out immediately and the
+    sustained rate never exceeds `rate`.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        :param rate: sustained number of requests per second
+        :param capacity: maximum burst size, at least 1; defaults to max(1, rate)
+        :raises ValueError: if rate is not positive or capacity is below 1, as acquire() could then never succeed
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket, sleeping until enough are available.
+        :param tokens: number of tokens to take
+        :return: seconds spent waiting
+        :raises ValueError: if tokens exceeds the capacity of the bucket, which it could never hold
+        """
+        if tokens > self.capacity:
+            raise ValueError(
+                f"cannot acquire {tokens} tokens from a bucket of capacity {self.capacity}"
+            )
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def penalize(self, seconds: float) -> None:
+        """
+        Drain the bucket so no request is sent for the given number of seconds,
+        e.g. after the server answered 429 with a Retry-After header.
+        :param seconds: pause applied to every caller sharing the bucket
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+class RetryPolicy:
+    """
+    Retry schedule for throttled (429) and failing (5xx) responses.
+
+    A Retry-After header (seconds or HTTP date) takes precedence; otherwise the delay
+    grows exponentially from backoff_factor. Both are capped at max_backoff: a server asking
+    for a longer pause is retried after max_backoff seconds, so raise max_backoff to honour
+    long Retry-After values.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        retry_statuses: Tuple[int, ...] = DEFAULT_RETRY_STATUSES,
+    ):
+        """
+        :param max_retries: maximum number of retries per request
+        :param backoff_factor: delay of the first retry in seconds when no Retry-After is sent
+        :param max_backoff: upper bound of any retry delay in seconds, Retry-After included
+        :param retry_statuses: HTTP status codes that are retried
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = retry_statuses
+
+    def should_retry(
+        self, status_code: int, attempt: int, idempotent: bool = True
+    ) -> bool:
+        """
+        :param status_code: HTTP status of the last response
+        :param attempt: number of retries already made
+        :param idempotent: False for requests that must only be replayed when the server did not process them (429)
+        :return: True if the request should be sent again
+        """
+        if attempt >= self.max_retries or status_code not in self.retry_statuses:
+            return False
+
+        return idempotent or status_code == 429
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        :param attempt: number of retries already made
+        :param retry_after: value of the Retry-After response header, if any
+        :return: seconds to wait before the next attempt, at most max_backoff even when Retry-After asks for more
+        """
+        parsed = parse_retry_after(retry_after)
+        if parsed is None:
+            parsed = self.backoff_factor * (2**attempt)
+
+        return min(parsed, self.max_backoff)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given either as delta-seconds or as an HTTP date.
+    :param value: header value
+    :return: seconds to wait, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,113 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# Seconds each read endpoint stays cached unless overridden
+DEFAULT_CACHE_TTLS = {
+    "device_info": 60.0,
+    "device_message_number": 30.0,
+    "contracts": 300.0,
+    "device_types": 300.0,
+}
+DEFAULT_CACHE_MAX_ENTRIES = 1024
+
+
+class ResponseCache:
+    """
+    Thread-safe, size-bounded LRU cache of parsed API responses with per-endpoint TTLs.
+
+    Entries are keyed by (endpoint, key), e.g. ("device_info", dev_id). When the cache is full
+    the least recently used entry is evicted; expired entries are dropped on access. Cached
+    objects are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        ttls: Optional[Dict[str, float]] = None,
+    ):
+        """
+        :param max_entries: maximum number of cached responses
+        :param ttls: seconds per endpoint overriding DEFAULT_CACHE_TTLS; 0 disables caching of that endpoint
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttls = dict(DEFAULT_CACHE_TTLS)
+        self.ttls.update(ttls or {})
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, Any]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str, key: Hashable) -> Optional[Any]:
+        """
+        :param endpoint: endpoint name, e.g. "device_info"
+        :param key: identity of the request within the endpoint
+        :return: cached response, or None on a miss or an expired entry
+        """
+        with self._lock:
+            entry = self._entries.get((endpoint, key))
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end((endpoint, key))
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[(endpoint, key)]
+            self.misses += 1
+            return None
+
+    def set(self, endpoint: str, key: Hashable, value: Any) -> None:
+        """
+        Store a response for the endpoint's TTL, evicting the least recently used entries if full.
+        :param endpoint: endpoint name, e.g. "device_info"
+        :param key: identity of the request within the endpoint
+        :param value: parsed response
+        """
+        ttl = self.ttls.get(endpoint, 0)
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[(endpoint, key)] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end((endpoint, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(
+        self, endpoint: Optional[str] = None, key: Optional[Hashable] = None
+    ) -> None:
+        """
+        Drop cached entries.
+        :param endpoint: endpoint to invalidate; None drops every entry
+        :param key: single key of the endpoint to invalidate; None drops the whole endpoint
+        """
+        with self._lock:
+            if endpoint is None:
+                self._entries.clear()
+            elif key is not None:
+                self._entries.pop((endpoint, key), None)
+            else:
+                for cache_key in [k for k in self._entries if k[0] == endpoint]:
+                    del self._entries[cache_key]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        :return: hit, miss and eviction counters and the current number of entries
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,66 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    """
+    One in-flight call shared by every caller of the same key.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Thread-safe duplicate call suppression.
+
+    While a call for a key is running, other callers asking for the same key wait for it and
+    receive its result (or its exception) instead of running their own. Once the call
+    completes the key is forgotten, so later calls run again; nothing is cached.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn, or join the identical call already in flight.
+        :param key: identity of the call, e.g. the request URL
+        :param fn: callable performing the call
+        :return: result of the shared call
+        :raises: the exception raised by the shared call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+    def in_flight(self) -> int:
+        """
+        :return: number of distinct calls currently running
+        """
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,71 @@
+import abc
+import queue
+from typing import Any, Callable, List, Optional, Union
+
+from sigfox_manager.models.schemas import DeviceMessage
+
+
+class MessageSink(abc.ABC):
+    """
+    Destination of the new messages found by MessagePoller or received by the callback server.
+    deliver() is always called from one thread at a time.
+    """
+
+    @abc.abstractmethod
+    def deliver(self, dev_id: str, messages: List[DeviceMessage]) -> None:
+        """
+        :param dev_id: Sigfox ID of the device the messages come from
+        :param messages: new messages, oldest first
+        """
+
+
+class CallbackSink(MessageSink):
+    """
+    Sink calling fn(dev_id, messages) once per device and batch.
+    """
+
+    def __init__(self, fn: Callable[[str, List[DeviceMessage]], Any]):
+        """
+        :param fn: callable receiving the device id and its new messages, oldest first
+        """
+        self.fn = fn
+
+    def deliver(self, dev_id: str, messages: List[DeviceMessage]) -> None:
+        self.fn(dev_id, messages)
+
+
+class QueueSink(MessageSink):
+    """
+    Sink putting one (dev_id, DeviceMessage) tuple per message on a queue.Queue.
+    A bounded queue applies back-pressure: deliver() blocks while it is full.
+    """
+
+    def __init__(self, target: queue.Queue, timeout: Optional[float] = None):
+        """
+        :param target: queue receiving (dev_id, message) tuples
+        :param timeout: seconds to wait for room in a full queue before raising queue.Full; None waits forever
+        """
+        self.queue = target
+        self.timeout = timeout
+
+    def deliver(self, dev_id: str, messages: List[DeviceMessage]) -> None:
+        for message in messages:
+            self.queue.put((dev_id, message), timeout=self.timeout)
+
+
+SinkLike = Union[MessageSink, queue.Queue, Callable[[str, List[DeviceMessage]], Any]]
+
+
+def as_sink(target: SinkLike) -> MessageSink:
+    """
+    :param target: MessageSink, queue.Queue, or callable(dev_id, messages)
+    :return: MessageSink delivering to target
+    """
+    if isinstance(target, MessageSink):
+        return target
+    if isinstance(target, queue.Queue):
+        return QueueSink(target)
+    if callable(target):
+        return CallbackSink(target)
+
+    raise TypeError("sink must be a MessageSink, a queue.Queue or a callable")
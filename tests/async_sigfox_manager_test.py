@@ -0,0 +1,142 @@
+import asyncio
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from conftest import device_json
+from sigfox_manager.async_sigfox_manager import AsyncSigfoxManager
+from sigfox_manager.models.schemas import (
+    DevicesResponse,
+    DeviceMessageStats,
+    BaseDevice,
+)
+from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+    SigfoxAuthError,
+    SigfoxDeviceNotFoundError,
+    SigfoxDeviceCreateConflictException,
+)
+from sigfox_manager.utils.async_http_utils import AsyncHttpTransport
+
+DEVICE_JSON = device_json("d1")
+
+
+def make_manager(handler):
+    """Build an AsyncSigfoxManager whose transport is served by an in-process handler."""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    transport = AsyncHttpTransport(b"dXNlcjpwd2Q=", client=client)
+    return AsyncSigfoxManager("user", "pwd", transport=transport)
+
+
+class TestAsyncSigfoxManager:
+    def test_get_devices_by_contract_paginates(self):
+        """Test the async client follows paging.next and merges every page"""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            if "page=2" in str(request.url):
+                body = {"data": [dict(DEVICE_JSON, id="d2")], "paging": {}}
+            else:
+                body = {
+                    "data": [DEVICE_JSON],
+                    "paging": {"next": "https://api.sigfox.com/v2/devices?page=2"},
+                }
+            return httpx.Response(200, json=body)
+
+        async def run():
+            async with make_manager(handler) as sm:
+                return await sm.get_devices_by_contract("c1")
+
+        response = asyncio.run(run())
+
+        assert isinstance(response, DevicesResponse)
+        assert [d.id for d in response.data] == ["d1", "d2"]
+        assert response.paging.next is None
+        assert all(r.headers["Authorization"] == "Basic dXNlcjpwd2Q=" for r in seen)
+
+    def test_concurrent_requests_share_one_client(self):
+        """Test many coroutines can be in flight on the same manager"""
+
+        def handler(request):
+            return httpx.Response(
+                200, json={"lastDay": 1, "lastWeek": 2, "lastMonth": 3}
+            )
+
+        async def run():
+            async with make_manager(handler) as sm:
+                return await asyncio.gather(
+                    *(sm.get_device_message_number(f"d{i}") for i in range(50))
+                )
+
+        results = asyncio.run(run())
+
+        assert len(results) == 50
+        assert all(isinstance(r, DeviceMessageStats) for r in results)
+
+    def test_error_mapping(self):
+        """Test HTTP errors map to the same exceptions as the sync client"""
+        statuses = {"d403": 403, "d404": 404}
+
+        def handler(request):
+            return httpx.Response(statuses[request.url.path.rsplit("/", 1)[-1]])
+
+        async def run():
+            async with make_manager(handler) as sm:
+                with pytest.raises(SigfoxAuthError):
+                    await sm.get_device_info("d403")
+                with pytest.raises(SigfoxDeviceNotFoundError):
+                    await sm.get_device_info("d404")
+
+        asyncio.run(run())
+
+    def test_provision_device_resolves_type_and_posts(self):
+        """Test provision_device resolves a device type name and posts the payload"""
+        posted = []
+
+        def handler(request):
+            if request.method == "POST":
+                posted.append(json.loads(request.content))
+                if len(posted) > 1:
+                    return httpx.Response(409)
+                return httpx.Response(201, json={"id": "19C3B"})
+            return httpx.Response(
+                200, json={"data": [{"id": "dt1", "name": "Type A"}], "paging": {}}
+            )
+
+        async def run():
+            async with make_manager(handler) as sm:
+                device = await sm.provision_device(
+                    "19C3B", "1234567890ABCDEF", "Type A"
+                )
+                with pytest.raises(SigfoxDeviceCreateConflictException):
+                    await sm.provision_device("19C3B", "1234567890ABCDEF", "dt1")
+                with pytest.raises(ValueError):
+                    await sm.provision_device("19c3b", "1234567890ABCDEF", "dt1")
+                return device
+
+        device = asyncio.run(run())
+
+        assert isinstance(device, BaseDevice)
+        assert posted[0]["deviceTypeId"] == "dt1"
+        assert posted[0]["name"] == "19C3B"
+
+    def test_close_leaves_injected_client_open(self):
+        """Test closing a manager or transport keeps a shared httpx client usable"""
+
+        async def scenario():
+            client = httpx.AsyncClient(
+                transport=httpx.MockTransport(lambda request: httpx.Response(200))
+            )
+            shared = AsyncHttpTransport(b"dXNlcjpwd2Q=", client=client)
+            async with AsyncSigfoxManager("user", "pwd", transport=shared):
+                pass
+            await shared.close()
+            closed = client.is_closed
+            owned = AsyncHttpTransport(b"dXNlcjpwd2Q=")
+            await owned.close()
+            await client.aclose()
+            return closed, owned.client.is_closed
+
+        assert asyncio.run(scenario()) == (False, True)
@@ -0,0 +1,199 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from sigfox_manager.sigfox_manager import SigfoxManager
+from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+    SigfoxAuthError,
+    SigfoxBulkAuthError,
+    SigfoxBulkDeviceError,
+)
+
+
+class FakeBulkApi(BaseHTTPRequestHandler):
+    """Local stand-in for the Sigfox bulk device creation endpoints."""
+
+    jobs = {}
+    submitted = []
+    polls = 0
+    forbidden = False
+    forbidden_polls = False
+    no_job_id = False
+    rejected_ids = {"C0FFEE"}
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body=None):
+        payload = json.dumps(body).encode("utf-8") if body is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self):
+        if self.forbidden:
+            return self._reply(403)
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if self.no_job_id:
+            return self._reply(201, {"total": len(body["data"])})
+        job_id = f"job-{len(self.submitted)}"
+        type(self).submitted.append(body)
+        self.jobs[job_id] = {"ids": [d["id"] for d in body["data"]], "polls_left": 1}
+        self._reply(201, {"total": len(body["data"]), "jobId": job_id})
+
+    def do_GET(self):
+        type(self).polls += 1
+        if self.forbidden_polls:
+            return self._reply(403)
+        job = self.jobs[self.path.rsplit("/", 1)[-1]]
+        if job["polls_left"] > 0:
+            job["polls_left"] -= 1
+            return self._reply(200, {"jobDone": False, "total": len(job["ids"])})
+        failed = [i for i in job["ids"] if i in self.rejected_ids]
+        self._reply(
+            200,
+            {
+                "jobDone": True,
+                "total": len(job["ids"]),
+                "status": {
+                    "success": len(job["ids"]) - len(failed),
+                    "failed": (
+                        [
+                            {
+                                "status": "ALREADY_EXISTS",
+                                "message": "Device exists",
+                                "ids": failed,
+                            }
+                        ]
+                        if failed
+                        else []
+                    ),
+                },
+            },
+        )
+
+
+@pytest.fixture
+def bulk_api():
+    FakeBulkApi.jobs = {}
+    FakeBulkApi.submitted = []
+    FakeBulkApi.polls = 0
+    FakeBulkApi.forbidden = False
+    FakeBulkApi.forbidden_polls = False
+    FakeBulkApi.no_job_id = False
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeBulkApi)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v2"
+    server.shutdown()
+    server.server_close()
+
+
+class TestCreateDevicesBulk:
+    def test_chunks_submits_and_polls_jobs(self, bulk_api):
+        """Test devices are split into jobs, polled to completion and reported per device"""
+        devices = [
+            {"dev_id": f"ABC{i:03X}", "pac": "1234567890ABCDEF"} for i in range(5)
+        ]
+        devices.insert(
+            2, {"dev_id": "C0FFEE", "pac": "1234567890ABCDEF", "name": "dup"}
+        )
+        devices.append({"dev_id": "nothex", "pac": "1234567890ABCDEF"})
+
+        with SigfoxManager("user", "pwd", api_url=bulk_api) as sm:
+            report = sm.create_devices_bulk(
+                "dt1", devices, chunk_size=2, poll_interval=0.01, timeout=5
+            )
+
+        assert len(FakeBulkApi.submitted) == 3
+        assert all(len(job["data"]) <= 2 for job in FakeBulkApi.submitted)
+        assert FakeBulkApi.submitted[0]["deviceTypeId"] == "dt1"
+        assert FakeBulkApi.submitted[1]["data"][0]["name"] == "dup"
+
+        assert [r.status for r in report.rows] == [
+            "created",
+            "created",
+            "failed",
+            "created",
+            "created",
+            "created",
+            "invalid",
+        ]
+        rejected = report.failed[0]
+        assert rejected.dev_id == "C0FFEE"
+        assert isinstance(rejected.error, SigfoxBulkDeviceError)
+        assert rejected.error.status_code == "ALREADY_EXISTS"
+        assert report.created[0].device.id == "ABC000"
+        assert report.created[0].job_id == "job-0"
+
+    def test_unfinished_jobs_are_reported_pending(self, bulk_api):
+        """Test devices of jobs still running at the timeout are reported as pending"""
+        with SigfoxManager("user", "pwd", api_url=bulk_api) as sm:
+            report = sm.create_devices_bulk(
+                "dt1",
+                [{"dev_id": "ABC001", "pac": "1234567890ABCDEF"}],
+                poll_interval=0.01,
+                timeout=0,
+            )
+
+        assert [r.status for r in report.rows] == ["pending"]
+        assert report.pending[0].job_id == "job-0"
+
+    def test_forbidden_submission_raises_auth_error(self, bulk_api):
+        """Test a 403 on job submission raises SigfoxAuthError"""
+        FakeBulkApi.forbidden = True
+
+        with SigfoxManager("user", "pwd", api_url=bulk_api) as sm:
+            with pytest.raises(SigfoxAuthError):
+                sm.create_devices_bulk(
+                    "dt1", [{"dev_id": "ABC001", "pac": "1234567890ABCDEF"}]
+                )
+
+    def test_forbidden_submission_carries_partial_report(self, bulk_api):
+        """Test a 403 raises with a report of every row, unsubmitted rows being failed"""
+        FakeBulkApi.forbidden = True
+        devices = [
+            {"dev_id": "ABC001", "pac": "1234567890ABCDEF"},
+            {"dev_id": "nothex", "pac": "1234567890ABCDEF"},
+        ]
+
+        with SigfoxManager("user", "pwd", api_url=bulk_api) as sm:
+            with pytest.raises(SigfoxBulkAuthError) as exc_info:
+                sm.create_devices_bulk("dt1", devices)
+
+        assert [r.status for r in exc_info.value.report.rows] == ["failed", "invalid"]
+        assert exc_info.value.report.failed[0].error is exc_info.value
+
+    def test_forbidden_poll_reports_submitted_jobs_pending(self, bulk_api):
+        """Test a 403 while polling keeps the submitted jobs in the report as pending"""
+        FakeBulkApi.forbidden_polls = True
+
+        with SigfoxManager("user", "pwd", api_url=bulk_api) as sm:
+            with pytest.raises(SigfoxBulkAuthError) as exc_info:
+                sm.create_devices_bulk(
+                    "dt1",
+                    [{"dev_id": "ABC001", "pac": "1234567890ABCDEF"}],
+                    poll_interval=0.01,
+                )
+
+        assert [(r.status, r.job_id) for r in exc_info.value.report.rows] == [
+            ("pending", "job-0")
+        ]
+
+    def test_missing_job_id_fails_the_chunk(self, bulk_api):
+        """Test a 2xx submission without jobId marks its devices failed instead of raising"""
+        FakeBulkApi.no_job_id = True
+
+        with SigfoxManager("user", "pwd", api_url=bulk_api) as sm:
+            report = sm.create_devices_bulk(
+                "dt1",
+                [{"dev_id": "ABC001", "pac": "1234567890ABCDEF"}],
+                poll_interval=0.01,
+            )
+
+        assert [r.status for r in report.rows] == ["failed"]
+        assert report.failed[0].error.status_code == 201
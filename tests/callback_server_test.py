@@ -0,0 +1,227 @@
+import asyncio
+import json
+import queue
+import threading
+
+import pytest
+
+from sigfox_manager.callback_server import CallbackServer, parse_callback_message
+
+
+def callback(dev_id="ABC", t=1700000000, seq=1, lqi="Good"):
+    return {"device": dev_id, "time": t, "data": "0102", "seqNumber": seq, "lqi": lqi}
+
+
+async def post(port, body, path="/sigfox/uplink", headers=None):
+    """Minimal HTTP/1.1 client returning (status, headers) of one POST"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    payload = body if isinstance(body, bytes) else json.dumps(body).encode()
+    lines = [
+        f"POST {path} HTTP/1.1",
+        "Host: localhost",
+        f"Content-Length: {len(payload)}",
+        "Connection: close",
+    ]
+    lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + payload)
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    head = raw.decode().split("\r\n\r\n", 1)[0].split("\r\n")
+    response_headers = dict(line.split(": ", 1) for line in head[1:])
+    return int(head[0].split(" ")[1]), response_headers
+
+
+class TestParseCallbackMessage:
+    def test_converts_callback_fields(self):
+        """Test seconds timestamps, LQI names and missing list fields are normalised"""
+        dev_id, message = parse_callback_message(callback(lqi="Excellent"))
+
+        assert dev_id == "ABC"
+        assert message.device.id == "ABC"
+        assert message.time == 1700000000000
+        assert message.lqi == 3
+        assert message.nbFrames == 1
+        assert message.rinfos == []
+
+    def test_keeps_millisecond_timestamps(self):
+        """Test a timestamp already in milliseconds is left untouched"""
+        _, message = parse_callback_message(callback(t=1700000000123, lqi=2))
+
+        assert message.time == 1700000000123
+        assert message.lqi == 2
+
+    def test_rejects_payload_without_device(self):
+        """Test a payload without device id is invalid"""
+        with pytest.raises(ValueError):
+            parse_callback_message({"time": 1, "data": "", "seqNumber": 1})
+
+    @pytest.mark.parametrize("t", [None, "soon", 1.5, True])
+    def test_rejects_payload_without_integer_time(self, t):
+        """Test a payload with a missing or non-integer time is invalid instead of dated epoch 0"""
+        payload = callback()
+        if t is None:
+            del payload["time"]
+        else:
+            payload["time"] = t
+
+        with pytest.raises(ValueError):
+            parse_callback_message(payload)
+
+    def test_accepts_string_timestamps(self):
+        """Test a quoted {time} is read as an integer"""
+        _, message = parse_callback_message(callback(t="1700000000"))
+
+        assert message.time == 1700000000000
+
+
+class TestCallbackServer:
+    def test_delivers_messages_grouped_per_device(self):
+        """Test single and batched bodies reach the sink per device, oldest first"""
+        delivered = {}
+
+        async def scenario():
+            async with CallbackServer(
+                lambda dev_id, msgs: delivered.setdefault(dev_id, []).extend(msgs)
+            ) as server:
+                assert (await post(server.port, callback("B")))[0] == 202
+                assert (
+                    await post(
+                        server.port,
+                        [callback("A", t=200, seq=2), callback("A", t=100, seq=1)],
+                    )
+                )[0] == 202
+            return server.stats
+
+        stats = asyncio.run(scenario())
+
+        assert sorted(delivered) == ["A", "B"]
+        assert [m.seqNumber for m in delivered["A"]] == [1, 2]
+        assert stats["received"] == 3
+        assert stats["delivered"] == 3
+
+    def test_counts_invalid_messages(self):
+        """Test records failing validation are dropped and counted without affecting the rest"""
+        out = queue.Queue()
+
+        async def scenario():
+            async with CallbackServer(out) as server:
+                await post(server.port, [callback("A"), {"device": "B", "time": 1}])
+            return server.stats
+
+        stats = asyncio.run(scenario())
+
+        assert stats["invalid"] == 1
+        assert out.get_nowait()[0] == "A"
+        assert out.empty()
+
+    def test_rejects_bad_requests(self):
+        """Test malformed JSON, wrong path, missing token and oversized bodies are refused"""
+
+        async def scenario():
+            async with CallbackServer(
+                lambda *_: None, auth_token="secret", max_body=1000
+            ) as server:
+                auth = {"Authorization": "secret"}
+                return [
+                    (await post(server.port, b"{not json", headers=auth))[0],
+                    (await post(server.port, callback(), path="/other", headers=auth))[
+                        0
+                    ],
+                    (await post(server.port, callback()))[0],
+                    (await post(server.port, [callback()] * 50, headers=auth))[0],
+                    (await post(server.port, callback(), headers=auth))[0],
+                ]
+
+        assert asyncio.run(scenario()) == [400, 404, 401, 413, 202]
+
+    def test_rejects_bodies_without_time(self):
+        """Test a body holding a callback without integer time is answered 400 and nothing is delivered"""
+        out = queue.Queue()
+        untimed = callback("B")
+        del untimed["time"]
+
+        async def scenario():
+            async with CallbackServer(out) as server:
+                statuses = [
+                    (await post(server.port, [callback("A"), untimed]))[0],
+                    (await post(server.port, callback("C", t="later")))[0],
+                ]
+            return statuses, server.stats
+
+        statuses, stats = asyncio.run(scenario())
+
+        assert statuses == [400, 400]
+        assert stats["invalid"] == 3
+        assert stats["received"] == 0
+        assert out.empty()
+
+    def test_full_queue_answers_503(self):
+        """Test back-pressure: requests are refused with Retry-After while the queue stays full"""
+        release = threading.Event()
+
+        async def scenario():
+            server = CallbackServer(
+                lambda *_: release.wait(5), max_queue=1, enqueue_timeout=0.05
+            )
+            async with server:
+                statuses = []
+                for seq in range(4):
+                    statuses.append(await post(server.port, callback(seq=seq)))
+                release.set()
+            return statuses, server.stats
+
+        statuses, stats = asyncio.run(scenario())
+
+        rejected = [headers for status, headers in statuses if status == 503]
+        assert rejected and all(headers["Retry-After"] == "1" for headers in rejected)
+        assert stats["rejected"] == len(rejected)
+        assert stats["delivered"] == stats["received"] == 4 - len(rejected)
+
+    def test_failed_delivery_is_retried(self):
+        """Test a sink failing transiently still receives the batch"""
+        delivered = []
+        failures = [RuntimeError("down"), RuntimeError("down")]
+
+        def flaky_sink(dev_id, messages):
+            if failures:
+                raise failures.pop()
+            delivered.extend(messages)
+
+        async def scenario():
+            async with CallbackServer(flaky_sink, retry_delay=0.01) as server:
+                await post(server.port, callback("A"))
+            return server
+
+        server = asyncio.run(scenario())
+
+        assert len(delivered) == 1
+        assert server.stats["retried"] == 2
+        assert server.stats["delivered"] == 1
+        assert [dev_id for dev_id, _ in server.errors] == ["A", "A"]
+
+    def test_exhausted_retries_go_to_dead_letter(self):
+        """Test a batch failing every attempt reaches the dead-letter sink and errors stay bounded"""
+        dead = queue.Queue()
+
+        def failing_sink(dev_id, messages):
+            raise RuntimeError("down")
+
+        async def scenario():
+            server = CallbackServer(
+                failing_sink,
+                max_retries=2,
+                retry_delay=0.01,
+                dead_letter=dead,
+                max_errors=2,
+            )
+            async with server:
+                await post(server.port, callback("A"))
+            return server
+
+        server = asyncio.run(scenario())
+
+        assert dead.get_nowait()[0] == "A"
+        assert server.stats["dead_lettered"] == 1
+        assert server.stats["delivered"] == server.stats["failed"] == 0
+        assert len(server.errors) == 2
@@ -0,0 +1,40 @@
+from sigfox_manager.models.schemas import DeviceType
+from sigfox_manager.utils.checkpoint import PaginationCheckpoint
+
+
+class TestPaginationCheckpoint:
+    def test_load_restores_items_and_cursor(self, tmp_path):
+        """Test recorded pages are restored in order with the cursor of the last one"""
+        checkpoint = PaginationCheckpoint(str(tmp_path / "walk.ckpt"))
+        checkpoint.start("https://api.sigfox.com/v2/devicetypes")
+        checkpoint.append(
+            [DeviceType(id="dt1"), DeviceType(id="dt2")],
+            "https://api.sigfox.com/v2/devicetypes?page=2",
+        )
+        checkpoint.append(
+            [DeviceType(id="dt3")], "https://api.sigfox.com/v2/devicetypes?page=3"
+        )
+
+        state = checkpoint.load("https://api.sigfox.com/v2/devicetypes")
+
+        assert [i["id"] for i in state.items] == ["dt1", "dt2", "dt3"]
+        assert state.cursor == "https://api.sigfox.com/v2/devicetypes?page=3"
+
+    def test_load_ignores_other_listing_and_torn_write(self, tmp_path):
+        """Test a checkpoint of another listing is ignored and a truncated last line is dropped"""
+        path = tmp_path / "walk.ckpt"
+        checkpoint = PaginationCheckpoint(str(path))
+        checkpoint.start("https://api.sigfox.com/v2/devicetypes")
+        checkpoint.append(
+            [DeviceType(id="dt1")], "https://api.sigfox.com/v2/devicetypes?page=2"
+        )
+        with open(path, "a") as f:
+            f.write('{"items": [{"id": "dt2"')
+
+        assert checkpoint.load("https://api.sigfox.com/v2/contract-infos/") is None
+        state = checkpoint.load("https://api.sigfox.com/v2/devicetypes")
+        assert [i["id"] for i in state.items] == ["dt1"]
+        assert state.cursor == "https://api.sigfox.com/v2/devicetypes?page=2"
+
+        checkpoint.clear()
+        assert checkpoint.load("https://api.sigfox.com/v2/devicetypes") is None
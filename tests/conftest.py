@@ -1,4 +1,62 @@
+import json
 import os
 import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+
+def device_json(dev_id, **fields):
+    """Build a minimal valid Device JSON object; keyword arguments override or add fields"""
+    device = {
+        "id": dev_id,
+        "name": f"Device {dev_id}",
+        "satelliteCapable": False,
+        "repeater": False,
+        "messageModulo": 0,
+        "group": {"id": "g1"},
+        "prototype": False,
+        "location": {"lat": 0.0, "lng": 0.0},
+        "pac": "0000000000000000",
+        "lqi": 0,
+        "creationTime": 0,
+        "state": 0,
+        "comState": 0,
+        "createdBy": "user",
+        "lastEditionTime": 0,
+        "lastEditedBy": "user",
+        "automaticRenewal": False,
+        "automaticRenewalStatus": 0,
+        "activable": False,
+    }
+    device.update(fields)
+    return device
+
+
+def message_json(t, seq=None, **fields):
+    """Build a minimal valid DeviceMessage JSON object sent at t; seqNumber defaults to t"""
+    message = {
+        "time": t,
+        "data": "abc",
+        "lqi": 1,
+        "seqNumber": t if seq is None else seq,
+        "nbFrames": 1,
+        "computedLocation": [],
+        "rinfos": [],
+    }
+    message.update(fields)
+    return message
+
+
+def page_text(items, next_url=None):
+    """Build the JSON body of one listing page"""
+    return json.dumps({"data": items, "paging": {"next": next_url}})
+
+
+def device_text(dev_id, **fields):
+    """Build a Device JSON body, see device_json"""
+    return json.dumps(device_json(dev_id, **fields))
+
+
+def messages_text(times, next_url=None):
+    """Build a device messages page JSON body with one message per timestamp"""
+    return page_text([message_json(t) for t in times], next_url)
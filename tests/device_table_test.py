@@ -0,0 +1,121 @@
+import json
+from unittest.mock import patch, MagicMock
+
+from conftest import device_json
+from sigfox_manager.models.schemas import Device
+from sigfox_manager.sigfox_manager import SigfoxManager
+from sigfox_manager.utils.device_table import MISSING, DeviceTable
+
+
+def device(
+    dev_id, contract="c1", device_type="dt1", state=0, lqi=2, last_com=None, seq=None
+):
+    return device_json(
+        dev_id,
+        deviceType={"id": device_type, "name": f"Type {device_type}"},
+        contract={"id": contract, "name": f"Contract {contract}"},
+        group={"id": "g1", "name": "Group"},
+        sequenceNumber=seq,
+        lastCom=last_com,
+        lqi=lqi,
+        state=state,
+        comState=1,
+    )
+
+
+class TestDeviceTable:
+    def test_columns_are_typed_and_encoded(self):
+        """Test numeric columns are arrays with MISSING for absent values and strings are dictionary-encoded"""
+        table = DeviceTable.from_devices(
+            [
+                device("A", last_com=100, seq=5),
+                device("B"),
+                device("C", device_type="dt2"),
+            ]
+        )
+
+        assert len(table) == 3
+        assert table.column("lastCom").tolist() == [100, MISSING, MISSING]
+        assert table.column("deviceType") == ["dt1", "dt1", "dt2"]
+        assert table.encoded["deviceType"].values == ["dt1", "dt2"]
+        assert table.label("deviceType", "dt2") == "Type dt2"
+        assert table.row(0)["sequenceNumber"] == 5
+
+    def test_accepts_models_and_dicts(self):
+        """Test rows built from Device models match rows built from raw dicts"""
+        raw = device("A", last_com=100)
+
+        assert DeviceTable.from_devices([Device(**raw)]).row(
+            0
+        ) == DeviceTable.from_devices([raw]).row(0)
+
+    def test_filter_and_count_by(self):
+        """Test filters combine equality, membership and predicates, and group-by counts decode values"""
+        table = DeviceTable.from_devices(
+            [
+                device("A", contract="c1", state=0, last_com=100),
+                device("B", contract="c1", state=1, last_com=300),
+                device("C", contract="c2", state=0, last_com=200),
+                device("D", contract="c3", state=0),
+            ]
+        )
+
+        active = table.filter(
+            state=0, contract={"c1", "c2", "unknown"}, lastCom=lambda t: t >= 100
+        )
+
+        assert active.ids == ["A", "C"]
+        assert list(table.where(contract="c3")) == [3]
+        assert table.count_by("contract") == {"c1": 2, "c2": 1, "c3": 1}
+        assert active.count_by("state") == {0: 2}
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_manager_streams_raw_pages_into_table(self, mock_get):
+        """Test get_device_table loads every page of the requested contracts without building models"""
+        mock_get.side_effect = [
+            MagicMock(
+                status_code=200,
+                text=json.dumps(
+                    {"data": [device("A")], "paging": {"next": "https://next"}}
+                ),
+            ),
+            MagicMock(
+                status_code=200,
+                text=json.dumps({"data": [device("B")], "paging": {"next": None}}),
+            ),
+        ]
+
+        with patch(
+            "sigfox_manager.utils.model_builder.build_trusted"
+        ) as trusted, patch.object(Device, "__init__") as init:
+            table = SigfoxManager("user", "pwd").get_device_table(["c1"])
+
+        assert table.ids == ["A", "B"]
+        assert table.complete is True
+        trusted.assert_not_called()
+        init.assert_not_called()
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_incomplete_contracts_listing_marks_table_incomplete(self, mock_get):
+        """Test a contracts listing that stops early leaves the table flagged incomplete"""
+        contracts_page = {
+            "data": [{"id": "c1", "name": "Contract c1"}],
+            "paging": {"next": "https://contracts?page=2"},
+        }
+
+        def fake_get(url, auth, transport=None):
+            if url == "https://contracts?page=2":
+                return MagicMock(status_code=500, text="")
+            if url.endswith("/contract-infos/"):
+                return MagicMock(status_code=200, text=json.dumps(contracts_page))
+            return MagicMock(
+                status_code=200,
+                text=json.dumps({"data": [device("A")], "paging": {"next": None}}),
+            )
+
+        mock_get.side_effect = fake_get
+
+        table = SigfoxManager("user", "pwd").get_device_table()
+
+        assert table.ids == ["A"]
+        assert table.complete is False
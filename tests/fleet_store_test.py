@@ -0,0 +1,213 @@
+import json
+import sqlite3
+from unittest.mock import patch, MagicMock
+
+from conftest import device_json
+from sigfox_manager.models.schemas import Device, DeviceType
+from sigfox_manager.sigfox_manager import SigfoxManager
+from sigfox_manager.utils.fleet_store import FleetStore
+
+
+def fleet_device(dev_id, contract_id="c1", device_type_id="dt1", state=0):
+    return device_json(
+        dev_id,
+        state=state,
+        deviceType={"id": device_type_id},
+        contract={"id": contract_id},
+    )
+
+
+CONTRACT_JSON = json.loads(
+    '{"id": "c1", "name": "Contract 1", "activationEndTime": 0, "communicationEndTime": 0, "bidir": false, "highPriorityDownlink": false, "maxUplinkFrames": 0, "maxDownlinkFrames": 0, "maxTokens": 0, "automaticRenewal": false, "renewalDuration": 0, "contractId": "c1", "userId": "u1", "createdBy": "user", "lastEditionTime": 0, "creationTime": 0, "lastEditedBy": "user", "startTime": 0, "timezone": "UTC", "tokenDuration": 0, "tokensInUse": 0, "tokensUsed": 0}'
+)
+
+
+def page(items, next_url=None):
+    return MagicMock(
+        status_code=200, text=json.dumps({"data": items, "paging": {"next": next_url}})
+    )
+
+
+class TestFleetStore:
+    def test_store_uses_wal_and_indexed_queries(self, tmp_path):
+        """Test the mirror runs in WAL mode and filters devices by contract, device type and state"""
+        path = str(tmp_path / "fleet.db")
+        with FleetStore(path) as store:
+            store.replace_contract_devices(
+                "c1",
+                [
+                    Device(**fleet_device("d1", state=0)),
+                    Device(**fleet_device("d2", device_type_id="dt2", state=1)),
+                ],
+            )
+            store.upsert_devices([Device(**fleet_device("d3", contract_id="c2"))])
+
+            assert [d.id for d in store.get_devices(contract_id="c1")] == ["d1", "d2"]
+            assert [d.id for d in store.get_devices(device_type_id="dt2")] == ["d2"]
+            assert store.count_devices(state=0) == 2
+            assert store.get_device("d3").name == "Device d3"
+            assert store.is_fresh("devices:c1", None)
+            assert not store.is_fresh("devices:c2", None)
+
+        conn = sqlite3.connect(path)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        indexes = {r[1] for r in conn.execute("PRAGMA index_list(devices)")}
+        assert {
+            "idx_devices_contract_id",
+            "idx_devices_device_type_id",
+            "idx_devices_state",
+        } <= indexes
+        conn.close()
+
+    def test_replace_drops_devices_no_longer_listed(self, tmp_path):
+        """Test mirroring a contract listing removes devices that left the contract"""
+        with FleetStore(str(tmp_path / "fleet.db")) as store:
+            store.replace_contract_devices(
+                "c1", [Device(**fleet_device("d1")), Device(**fleet_device("d2"))]
+            )
+            store.replace_contract_devices("c1", [Device(**fleet_device("d2"))])
+            store.replace_device_types([DeviceType(id="dt1", name="Type A")])
+
+            assert [d.id for d in store.get_devices()] == ["d2"]
+            assert store.get_device_types()[0].name == "Type A"
+
+            store.invalidate("devices:")
+            assert not store.is_fresh("devices:c1", None)
+            assert store.is_fresh("device_types", None)
+
+
+class TestManagerStore:
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_second_process_reads_inventory_from_store(self, mock_get, tmp_path):
+        """Test a manager sharing the store file answers listings and device reads without the API"""
+        path = str(tmp_path / "fleet.db")
+        mock_get.side_effect = [
+            page(
+                [fleet_device("d1"), fleet_device("d2")],
+                "https://api.sigfox.com/v2/devices?page=2",
+            ),
+            page([fleet_device("d3")]),
+        ]
+        first = SigfoxManager("user", "pwd", store=FleetStore(path))
+        assert len(first.get_devices_by_contract("c1").data) == 3
+
+        mock_get.reset_mock()
+        second = SigfoxManager("user", "pwd", store=FleetStore(path))
+        devices = second.get_devices_by_contract("c1")
+        device = second.get_device_info("d2")
+
+        assert [d.id for d in devices.data] == ["d1", "d2", "d3"]
+        assert device.name == "Device d2"
+        mock_get.assert_not_called()
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_refresh_store_crawls_every_contract(self, mock_get, tmp_path):
+        """Test refresh_store mirrors contracts, device types and each contract's devices"""
+        contract = CONTRACT_JSON
+        responses = {
+            "https://api.sigfox.com/v2/contract-infos/": page([contract]),
+            "https://api.sigfox.com/v2/devicetypes": page(
+                [{"id": "dt1", "name": "Type A"}]
+            ),
+            "https://api.sigfox.com/v2/contract-infos/c1/devices": page(
+                [fleet_device("d1"), fleet_device("d2")]
+            ),
+        }
+        mock_get.side_effect = lambda url, auth, transport=None: responses[url]
+
+        store = FleetStore(str(tmp_path / "fleet.db"))
+        sm = SigfoxManager("user", "pwd", store=store)
+
+        assert sm.refresh_store() == 2
+        assert [c.id for c in store.get_contracts()] == ["c1"]
+        assert store.count_devices(contract_id="c1") == 2
+        assert store.is_fresh("device_types", None)
+
+
+class TestSyncFleet:
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_sync_reports_only_the_delta(self, mock_get, tmp_path):
+        """Test a sync cycle emits added/changed/removed events and advances the high-water mark"""
+        contract = json.loads(
+            '{"id": "c1", "name": "Contract 1", "activationEndTime": 0, "communicationEndTime": 0, "bidir": false, "highPriorityDownlink": false, "maxUplinkFrames": 0, "maxDownlinkFrames": 0, "maxTokens": 0, "automaticRenewal": false, "renewalDuration": 0, "contractId": "c1", "userId": "u1", "createdBy": "user", "lastEditionTime": 5, "creationTime": 0, "lastEditedBy": "user", "startTime": 0, "timezone": "UTC", "tokenDuration": 0, "tokensInUse": 0, "tokensUsed": 0}'
+        )
+
+        def device(dev_id, edited):
+            return dict(fleet_device(dev_id), lastEditionTime=edited)
+
+        listing = [device("d1", 100), device("d2", 100), device("d3", 100)]
+
+        def fake_get(url, auth, transport=None):
+            if url.endswith("/contract-infos/"):
+                return page([contract])
+            return page(listing)
+
+        mock_get.side_effect = fake_get
+        store = FleetStore(str(tmp_path / "fleet.db"))
+        sm = SigfoxManager("user", "pwd", store=store)
+
+        first = sm.sync_fleet()
+        assert sorted(e.id for e in first.added) == ["c1", "d1", "d2", "d3"]
+        assert first.high_water_marks["devices:c1"] == 100
+
+        listing[:] = [device("d1", 100), device("d2", 250), device("d4", 120)]
+        seen = []
+        second = sm.sync_fleet(on_event=seen.append)
+
+        assert [(e.kind, e.id) for e in second.events] == [
+            ("changed", "d2"),
+            ("added", "d4"),
+            ("removed", "d3"),
+        ]
+        assert seen == second.events
+        assert second.high_water_marks["devices:c1"] == 250
+        assert store.high_water_mark("devices:c1") == 250
+        assert sorted(d.id for d in store.get_devices(contract_id="c1")) == [
+            "d1",
+            "d2",
+            "d4",
+        ]
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_invalidation_keeps_high_water_marks(self, mock_get, tmp_path):
+        """Test invalidating the mirror after a write does not turn the next sync into a full rewrite"""
+        contract = CONTRACT_JSON
+        listing = [
+            dict(fleet_device("d1"), lastEditionTime=100),
+            dict(fleet_device("d2"), lastEditionTime=100),
+        ]
+
+        def fake_get(url, auth, transport=None):
+            return page([contract] if url.endswith("/contract-infos/") else listing)
+
+        mock_get.side_effect = fake_get
+        store = FleetStore(str(tmp_path / "fleet.db"))
+        sm = SigfoxManager("user", "pwd", store=store)
+        sm.sync_fleet()
+
+        sm._invalidate_device_writes(["d3"])
+        listing.append(dict(fleet_device("d3"), lastEditionTime=150))
+        second = sm.sync_fleet()
+
+        assert store.high_water_mark("devices:c1") == 150
+        assert [(e.kind, e.id) for e in second.events] == [("added", "d3")]
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_incomplete_listing_is_left_untouched(self, mock_get, tmp_path):
+        """Test removals are not inferred from a device listing that failed midway"""
+        store = FleetStore(str(tmp_path / "fleet.db"))
+        store.replace_contract_devices(
+            "c1", [Device(**fleet_device("d1")), Device(**fleet_device("d2"))]
+        )
+        mock_get.side_effect = [
+            page([], None),
+            page([fleet_device("d1")], "https://api.sigfox.com/v2/devices?page=2"),
+            MagicMock(status_code=500),
+        ]
+        sm = SigfoxManager("user", "pwd", store=store)
+
+        report = sm.sync_fleet(contract_ids=["c1"])
+
+        assert report.incomplete == ["c1"]
+        assert report.removed == []
+        assert store.count_devices(contract_id="c1") == 2
@@ -0,0 +1,105 @@
+import json
+from unittest.mock import patch, MagicMock
+
+from sigfox_manager.sigfox_manager import SigfoxManager
+from sigfox_manager.utils.http_utils import (
+    DEFAULT_TIMEOUT,
+    HttpTransport,
+    do_get,
+    do_post,
+)
+
+
+class TestHttpTransport:
+    def test_requests_carry_connect_and_read_timeouts(self):
+        """Test every request sent by the transport and the fallback helpers has a timeout"""
+        transport = HttpTransport(b"dXNlcjpwd2Q=", timeout=(2.0, 5.0))
+        with patch.object(transport.session, "get") as mock_session_get, patch(
+            "sigfox_manager.utils.http_utils.requests.get"
+        ) as mock_requests_get:
+            mock_session_get.return_value = MagicMock(status_code=200)
+            transport.get("https://api.sigfox.com/v2/devices/1")
+            do_get("https://api.sigfox.com/v2/devices/2", b"dXNlcjpwd2Q=")
+
+        assert mock_session_get.call_args[1]["timeout"] == (2.0, 5.0)
+        assert mock_requests_get.call_args[1]["timeout"] == DEFAULT_TIMEOUT
+        assert SigfoxManager("user", "pwd", timeout=3).transport.timeout == 3
+
+    def test_transport_mounts_pooled_adapter_and_auth_header(self):
+        """Test the transport configures pool sizes and prebuilds the auth header"""
+        transport = HttpTransport(b"dXNlcjpwd2Q=", pool_connections=3, pool_maxsize=25)
+
+        adapter = transport.session.get_adapter("https://api.sigfox.com/v2/devices")
+        assert adapter._pool_connections == 3
+        assert adapter._pool_maxsize == 25
+        assert transport.session.headers["Authorization"] == "Basic dXNlcjpwd2Q="
+
+    def test_do_get_delegates_to_transport(self):
+        """Test do_get reuses the transport session instead of module-level requests"""
+        transport = HttpTransport(b"dXNlcjpwd2Q=")
+        with patch.object(transport.session, "get") as mock_session_get, patch(
+            "sigfox_manager.utils.http_utils.requests.get"
+        ) as mock_requests_get:
+            mock_session_get.return_value = MagicMock(status_code=200)
+            do_get(
+                "https://api.sigfox.com/v2/devices/1", b"ignored", transport=transport
+            )
+            do_get(
+                "https://api.sigfox.com/v2/devices/2", b"ignored", transport=transport
+            )
+
+        assert mock_session_get.call_count == 2
+        mock_requests_get.assert_not_called()
+
+    def test_do_post_delegates_to_transport(self):
+        """Test do_post serializes the payload and sends it over the transport session"""
+        transport = HttpTransport(b"dXNlcjpwd2Q=")
+        with patch.object(transport.session, "post") as mock_session_post:
+            mock_session_post.return_value = MagicMock(status_code=201)
+            do_post(
+                "https://api.sigfox.com/v2/devices/",
+                {"id": "ABC"},
+                b"ignored",
+                headers={"Content-Type": "application/json"},
+                transport=transport,
+            )
+
+        args, kwargs = mock_session_post.call_args
+        assert args[0] == "https://api.sigfox.com/v2/devices/"
+        assert json.loads(kwargs["data"]) == {"id": "ABC"}
+
+    def test_manager_shares_one_transport_across_calls(self):
+        """Test every SigfoxManager call goes through the same pooled session"""
+        sm = SigfoxManager("user", "pwd", pool_maxsize=4)
+        with patch.object(sm.transport.session, "get") as mock_session_get:
+            mock_session_get.return_value = MagicMock(
+                status_code=200, text='{"lastDay": 1, "lastWeek": 2, "lastMonth": 3}'
+            )
+            sm.get_device_message_number("d1")
+            sm.get_device_message_number("d2")
+
+        assert mock_session_get.call_count == 2
+        adapter = sm.transport.session.get_adapter("https://api.sigfox.com")
+        assert adapter._pool_maxsize == 4
+
+    def test_manager_context_manager_closes_transport(self):
+        """Test leaving the context manager closes the pooled session"""
+        with patch.object(HttpTransport, "close") as mock_close:
+            with SigfoxManager("user", "pwd"):
+                pass
+        mock_close.assert_called_once()
+
+    def test_close_leaves_injected_session_and_transport_open(self):
+        """Test managers and transports only close the session and transport they created"""
+        import requests
+
+        session = requests.Session()
+        shared = HttpTransport(b"dXNlcjpwd2Q=", session=session)
+        with patch.object(session, "close") as session_close, patch.object(
+            shared, "close"
+        ) as shared_close:
+            with SigfoxManager("user", "pwd", transport=shared):
+                pass
+            shared_close.assert_not_called()
+            HttpTransport.close(shared)
+        session_close.assert_not_called()
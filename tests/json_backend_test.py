@@ -0,0 +1,75 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sigfox_manager.sigfox_manager import SigfoxManager
+from sigfox_manager.utils import json_backend
+from sigfox_manager.utils.json_backend import (
+    JsonBackend,
+    response_json,
+    set_json_backend,
+)
+
+
+@pytest.fixture
+def restore_backend():
+    backend = json_backend.get_json_backend()
+    yield
+    set_json_backend(backend)
+
+
+class TestJsonBackend:
+    def test_parses_raw_bytes(self, restore_backend):
+        """Test responses are decoded from their bytes body without touching .text"""
+        calls = []
+        set_json_backend(
+            JsonBackend(
+                "spy", lambda data: calls.append(data) or json.loads(data), json.dumps
+            )
+        )
+        resp = MagicMock(content=b'{"a": 1}')
+        type(resp).text = property(lambda _: pytest.fail("text should not be decoded"))
+
+        assert response_json(resp) == {"a": 1}
+        assert calls == [b'{"a": 1}']
+
+    def test_falls_back_to_text(self):
+        """Test responses without a bytes body are decoded from their text"""
+        assert response_json(MagicMock(text='{"a": [1, 2]}')) == {"a": [1, 2]}
+
+    def test_stdlib_and_orjson_agree(self, restore_backend):
+        """Test every installed backend round-trips the same document"""
+        document = {
+            "data": [{"id": "ABC", "lqi": 2, "rssi": "-120.00", "lat": 1.5}],
+            "paging": {},
+        }
+        for name in ("json", "orjson"):
+            try:
+                set_json_backend(name)
+            except ValueError:
+                continue
+            assert json_backend.loads(json_backend.dumps(document)) == document
+
+    def test_unknown_backend_is_rejected(self, restore_backend):
+        """Test selecting an unknown backend raises ValueError"""
+        with pytest.raises(ValueError):
+            set_json_backend("yaml")
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_manager_uses_selected_backend(self, mock_get, restore_backend):
+        """Test manager methods parse responses through the selected backend"""
+        decoded = []
+        set_json_backend(
+            JsonBackend(
+                "spy", lambda data: decoded.append(data) or json.loads(data), json.dumps
+            )
+        )
+        mock_get.return_value = MagicMock(
+            status_code=200, content=b'{"lastDay": 1, "lastWeek": 2, "lastMonth": 3}'
+        )
+
+        stats = SigfoxManager("user", "pwd").get_device_message_number("ABC")
+
+        assert stats.lastMonth == 3
+        assert decoded == [b'{"lastDay": 1, "lastWeek": 2, "lastMonth": 3}']
@@ -0,0 +1,147 @@
+import json
+import queue
+from unittest.mock import patch, MagicMock
+from urllib.parse import parse_qs, urlparse
+
+from conftest import message_json
+from sigfox_manager.message_poller import MessagePoller
+from sigfox_manager.sigfox_manager import SigfoxManager
+
+
+def message(t, seq):
+    return message_json(t, seq)
+
+
+class FakeMessagesApi:
+    """Serves per-device message histories newest first, honouring the since filter"""
+
+    def __init__(self):
+        self.history = {}
+        self.calls = []
+
+    def __call__(self, url, auth, transport=None):
+        parsed = urlparse(url)
+        dev_id = parsed.path.split("/")[-2]
+        since = int(parse_qs(parsed.query).get("since", ["0"])[0])
+        self.calls.append((dev_id, since))
+        data = sorted(
+            (m for m in self.history.get(dev_id, []) if m["time"] >= since),
+            key=lambda m: -m["time"],
+        )
+        return MagicMock(
+            status_code=200, text=json.dumps({"data": data, "paging": {"next": None}})
+        )
+
+
+class TestMessagePoller:
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_delivers_only_new_messages_per_device(self, mock_get):
+        """Test each poll delivers messages past the device's high-water mark, oldest first"""
+        api = FakeMessagesApi()
+        api.history = {
+            "d1": [message(100, 1), message(200, 2)],
+            "d2": [message(150, 7)],
+        }
+        mock_get.side_effect = api
+        delivered = []
+
+        poller = MessagePoller(
+            SigfoxManager("user", "pwd"),
+            ["d1", "d2"],
+            lambda dev_id, messages: delivered.append(
+                (dev_id, [m.seqNumber for m in messages])
+            ),
+            initial_since=0,
+        )
+
+        first = poller.poll_once()
+        assert sorted(delivered) == [("d1", [1, 2]), ("d2", [7])]
+        assert first.results == {"d1": 2, "d2": 1}
+        assert poller.high_water_mark("d1") == (200, 2)
+
+        delivered.clear()
+        api.history["d1"].append(message(300, 3))
+        # Replay of an already delivered seqNumber under a new timestamp
+        api.history["d2"].append(message(400, 7))
+        second = poller.poll_once()
+
+        assert delivered == [("d1", [3])]
+        assert second.results == {"d1": 1, "d2": 0}
+        assert ("d1", 200) in api.calls
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_state_survives_restart_and_feeds_queue(self, mock_get, tmp_path):
+        """Test marks persisted to disk stop a restarted poller from redelivering messages"""
+        api = FakeMessagesApi()
+        api.history = {"d1": [message(100, 1), message(200, 2)]}
+        mock_get.side_effect = api
+        state_path = str(tmp_path / "poller.json")
+        sink = queue.Queue()
+
+        MessagePoller(
+            SigfoxManager("user", "pwd"),
+            ["d1"],
+            sink,
+            state_path=state_path,
+            initial_since=0,
+        ).poll_once()
+        assert [sink.get_nowait()[1].seqNumber for _ in range(2)] == [1, 2]
+
+        api.history["d1"].append(message(250, 3))
+        restarted = MessagePoller(
+            SigfoxManager("user", "pwd"),
+            ["d1"],
+            sink,
+            state_path=state_path,
+            initial_since=0,
+        )
+        restarted.poll_once()
+
+        dev_id, msg = sink.get_nowait()
+        assert (dev_id, msg.seqNumber) == ("d1", 3)
+        assert sink.empty()
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_failed_delivery_keeps_mark(self, mock_get):
+        """Test a sink error leaves the mark untouched so the messages are polled again"""
+        api = FakeMessagesApi()
+        api.history = {"d1": [message(100, 1)]}
+        mock_get.side_effect = api
+
+        def failing_sink(dev_id, messages):
+            raise RuntimeError("downstream unavailable")
+
+        poller = MessagePoller(
+            SigfoxManager("user", "pwd"), ["d1"], failing_sink, initial_since=0
+        )
+        batch = poller.poll_once()
+
+        assert isinstance(batch.errors["d1"], RuntimeError)
+        assert poller.high_water_mark("d1") == (0, None)
+
+    def test_message_sink_requires_deliver(self):
+        """Test a MessageSink subclass without deliver cannot be instantiated"""
+        import pytest
+        from sigfox_manager.utils.sinks import MessageSink
+
+        class IncompleteSink(MessageSink):
+            pass
+
+        with pytest.raises(TypeError):
+            IncompleteSink()
+
+    def test_large_fleet_membership(self):
+        """Test adding and removing many devices keeps one entry per device without quadratic scans"""
+        manager = SigfoxManager("user", "pwd")
+        dev_ids = [f"{i:05X}" for i in range(30000)]
+
+        poller = MessagePoller(
+            manager, dev_ids + dev_ids[:100], sink=queue.Queue(), initial_since=0
+        )
+        poller.add_devices(dev_ids[-100:])
+        poller.remove_devices(dev_ids[:10])
+        poller.add_devices(dev_ids[:1])
+
+        assert len(poller.dev_ids) == 29991
+        assert poller.dev_ids[-1] == dev_ids[0]
+        assert len(set(poller.dev_ids)) == len(poller.dev_ids)
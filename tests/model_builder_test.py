@@ -0,0 +1,257 @@
+import json
+from typing import List, Optional
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from conftest import device_json, page_text
+from sigfox_manager.models.schemas import DeviceMessagesResponse
+from sigfox_manager.sigfox_manager import SigfoxManager
+from sigfox_manager.utils import model_builder
+from sigfox_manager.utils.model_builder import build_model, check_parse_mode
+
+MESSAGES_PAGE = {
+    "data": [
+        {
+            "device": {"id": "ABC"},
+            "time": 1700000000000,
+            "data": "0102",
+            "lqi": 2,
+            "seqNumber": 7,
+            "nbFrames": 3,
+            "computedLocation": [{"lat": 1.5, "lng": 2.5, "radius": 100, "source": 2}],
+            "rinfos": [
+                {
+                    "baseStation": {"id": "3D00"},
+                    "rssi": "-121.00",
+                    "rssiRepeaters": "-121.00",
+                    "lat": "43.0",
+                    "lng": "1.0",
+                    "freq": 868130000.0,
+                    "freqRepeaters": "868130000",
+                    "rep": 0,
+                    "repetitions": [
+                        {
+                            "nseq": 0,
+                            "rssi": "-122.00",
+                            "freq": 868130000.0,
+                            "repeated": False,
+                        }
+                    ],
+                    "cbStatus": {
+                        "status": 200,
+                        "cbDef": "https://example.com",
+                        "time": 1,
+                        "attempts": 1,
+                    },
+                    "unknownField": 1,
+                }
+            ],
+        }
+    ],
+    "paging": {"next": None},
+}
+
+
+class TestBuildModel:
+    def test_trusted_matches_validated(self):
+        """Test trusted parsing builds the same nested models as validation"""
+        validated = build_model(DeviceMessagesResponse, MESSAGES_PAGE, "validate")
+        trusted = build_model(DeviceMessagesResponse, MESSAGES_PAGE, "trusted")
+
+        assert trusted == validated
+        assert trusted.data[0].rinfos[0].repetitions[0].rssi == "-122.00"
+        assert trusted.complete is True
+
+    def test_pydantic_v1_models_are_constructed_without_validation(self, monkeypatch):
+        """Test under pydantic v1 nested models are built recursively with construct()"""
+        v1 = pytest.importorskip("pydantic.v1")
+
+        class Inner(v1.BaseModel):
+            value: int
+
+        class Outer(v1.BaseModel):
+            inner: Inner
+            items: List[Inner]
+            maybe: Optional[Inner] = None
+            flag: bool = True
+
+        # Behave as if pydantic v1 were installed
+        monkeypatch.setattr(model_builder, "BaseModel", v1.BaseModel)
+        monkeypatch.setattr(model_builder, "PYDANTIC_V2", False)
+        outer = build_model(
+            Outer,
+            {"inner": {"value": "not an int"}, "items": [{"value": 2}], "extra": 1},
+            "trusted",
+        )
+
+        assert isinstance(outer.inner, Inner)
+        # Values are taken as-is, not coerced nor checked
+        assert outer.inner.value == "not an int"
+        assert [item.value for item in outer.items] == [2]
+        assert outer.maybe is None
+        assert outer.flag is True
+        assert not hasattr(outer, "extra")
+
+    def test_unknown_parse_mode_is_rejected(self):
+        """Test an unknown parse mode raises ValueError"""
+        with pytest.raises(ValueError):
+            check_parse_mode("fast")
+        with pytest.raises(ValueError):
+            SigfoxManager("user", "pwd", parse_mode="fast")
+
+
+class TestManagerParseMode:
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_per_call_parse_mode_overrides_manager(self, mock_get):
+        """Test a per-call parse_mode is used instead of the manager's"""
+        mock_get.return_value = MagicMock(
+            status_code=200, text=json.dumps(MESSAGES_PAGE)
+        )
+        sm = SigfoxManager("user", "pwd", parse_mode="trusted")
+
+        with patch(
+            "sigfox_manager.sigfox_manager.build_model", wraps=build_model
+        ) as spy:
+            sm.get_device_messages("ABC")
+            sm.get_device_messages("ABC", parse_mode="validate")
+
+        assert [c.args[2] for c in spy.call_args_list] == ["trusted", "validate"]
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_paginated_listing_uses_parse_mode_for_every_page(self, mock_get):
+        """Test every page of a walk is parsed in the requested mode"""
+        first = dict(
+            MESSAGES_PAGE,
+            paging={"next": "https://api.sigfox.com/v2/devices/ABC/messages?page=2"},
+        )
+        mock_get.side_effect = [
+            MagicMock(status_code=200, text=json.dumps(first)),
+            MagicMock(status_code=200, text=json.dumps(MESSAGES_PAGE)),
+        ]
+        sm = SigfoxManager("user", "pwd", parse_mode="trusted")
+
+        with patch(
+            "sigfox_manager.sigfox_manager.build_model", wraps=build_model
+        ) as spy:
+            response = sm.get_device_messages("ABC", fetch_all_pages=True)
+
+        assert len(response.data) == 2
+        assert {c.args[2] for c in spy.call_args_list} == {"trusted"}
+
+
+def devices_text(ids, next_url=None):
+    return page_text([device_json(i, lqi=2, lastCom=100) for i in ids], next_url)
+
+
+class TestRecordModes:
+    def test_record_class_has_one_slot_per_field(self):
+        """Test records expose the model's top-level fields and keep nested values as plain JSON"""
+        record = build_model(DeviceMessagesResponse, MESSAGES_PAGE, "records").data[0]
+
+        assert type(record).__name__ == "DeviceMessageRecord"
+        assert not hasattr(record, "__dict__")
+        assert record.seqNumber == 7
+        assert record.rinfos[0]["baseStation"]["id"] == "3D00"
+        assert record.ackRequired is None
+        with pytest.raises(AttributeError):
+            record.lqi = 3
+
+    def test_record_round_trips(self):
+        """Test records convert back to dicts, compare by value and pickle"""
+        import pickle
+
+        record = build_model(DeviceMessagesResponse, MESSAGES_PAGE, "records").data[0]
+
+        assert record.to_dict()["time"] == 1700000000000
+        assert pickle.loads(pickle.dumps(record)) == record
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_raw_listing_merges_pages_of_dicts(self, mock_get):
+        """Test raw mode walks every page and returns the decoded dicts"""
+        mock_get.side_effect = [
+            MagicMock(
+                status_code=200,
+                text=devices_text(["A", "B"], "https://api.sigfox.com/v2/next"),
+            ),
+            MagicMock(status_code=200, text=devices_text(["C"])),
+        ]
+
+        response = SigfoxManager("user", "pwd").get_devices_by_contract(
+            "c1", parse_mode="raw"
+        )
+
+        assert [d["id"] for d in response.data] == ["A", "B", "C"]
+        assert response.complete is True
+        assert response.paging.next is None
+
+    @pytest.mark.parametrize("parse_mode", ["raw", "records"])
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_finished_checkpoint_resumes_in_parse_mode(
+        self, mock_get, parse_mode, tmp_path
+    ):
+        """Test a checkpoint whose walk already ended returns its items in the requested parse mode"""
+        from sigfox_manager.models.records import RecordPage
+        from sigfox_manager.utils.checkpoint import PaginationCheckpoint
+
+        path = str(tmp_path / "devices.ckpt")
+        checkpoint = PaginationCheckpoint(path)
+        checkpoint.start("https://api.sigfox.com/v2/contract-infos/c1/devices")
+        checkpoint.append(json.loads(devices_text(["A", "B"]))["data"], None)
+
+        response = SigfoxManager("user", "pwd").get_devices_by_contract(
+            "c1", checkpoint=path, parse_mode=parse_mode
+        )
+
+        assert isinstance(response, RecordPage)
+        assert response.complete is True
+        assert response.paging.next is None
+        if parse_mode == "raw":
+            assert [d["id"] for d in response.data] == ["A", "B"]
+        else:
+            assert [d.id for d in response.data] == ["A", "B"]
+            assert type(response.data[0]).__name__ == "DeviceRecord"
+        mock_get.assert_not_called()
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_records_bypass_the_response_cache(self, mock_get):
+        """Test records are never cached nor served to model callers"""
+        from sigfox_manager.models.schemas import DeviceType
+        from sigfox_manager.utils.response_cache import ResponseCache
+
+        mock_get.return_value = MagicMock(
+            status_code=200,
+            text=json.dumps(
+                {"data": [{"id": "dt1", "name": "Type"}], "paging": {"next": None}}
+            ),
+        )
+        sm = SigfoxManager("user", "pwd", response_cache=ResponseCache())
+
+        records = sm.get_device_types(parse_mode="records")
+        models = sm.get_device_types()
+
+        assert type(records.data[0]).__name__ == "DeviceTypeRecord"
+        assert isinstance(models.data[0], DeviceType)
+        assert mock_get.call_count == 2
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_raw_messages_stop_at_since(self, mock_get):
+        """Test the since window also ends a raw message iteration"""
+        page = {
+            "data": [{"time": t, "seqNumber": t} for t in (300, 200, 100)],
+            "paging": {"next": None},
+        }
+        mock_get.return_value = MagicMock(status_code=200, text=json.dumps(page))
+
+        messages = list(
+            SigfoxManager("user", "pwd").iter_device_messages(
+                "ABC", since=200, parse_mode="raw"
+            )
+        )
+
+        assert [m["time"] for m in messages] == [300, 200]
+
+    def test_manager_parse_mode_only_accepts_model_modes(self):
+        """Test raw and records are per-call modes only"""
+        with pytest.raises(ValueError):
+            SigfoxManager("user", "pwd", parse_mode="raw")
@@ -0,0 +1,120 @@
+import math
+
+import pytest
+
+from conftest import message_json
+from sigfox_manager.models.records import RecordPage, record_class
+from sigfox_manager.models.schemas import DeviceMessage, DeviceMessagesResponse
+from sigfox_manager.utils import numpy_export
+from sigfox_manager.utils.numpy_export import (
+    MESSAGE_FIELDS,
+    RINFO_FIELDS,
+    messages_to_numpy,
+)
+
+np = pytest.importorskip("numpy")
+
+
+def rinfo(station, rssi="-121.50", lat="43.5", lng="1.25"):
+    return {
+        "baseStation": {"id": station, "name": f"Station {station}"},
+        "rssi": rssi,
+        "rssiRepeaters": "",
+        "lat": lat,
+        "lng": lng,
+        "freq": 868130000.0,
+        "freqRepeaters": "868130000",
+        "rep": 0,
+        "repetitions": [
+            {"nseq": 0, "rssi": "-122.00", "freq": 868130000.0, "repeated": False}
+        ],
+        "cbStatus": {
+            "status": 200,
+            "cbDef": "https://example.com/uplink",
+            "time": 1700000000000,
+            "attempts": 1,
+        },
+    }
+
+
+def message(seq, rinfos, location=True):
+    return message_json(
+        1700000000000 + seq,
+        seq,
+        device={"id": "1A2B"},
+        data="0a1b2c",
+        ackRequired=True,
+        lqi=3,
+        nbFrames=3,
+        computedLocation=(
+            [{"lat": 43.0, "lng": 1.0, "radius": 500, "source": 2}] if location else []
+        ),
+        rinfos=rinfos,
+    )
+
+
+PAGE = {
+    "data": [
+        message(1, [rinfo("3D00"), rinfo("3D01", rssi="-90")]),
+        message(2, [rinfo("3D02")], location=False),
+    ],
+    "paging": {},
+}
+
+
+class TestMessagesToNumpy:
+    def test_message_table(self):
+        """Test one typed row per message, with the first computed location or missing values"""
+        messages, _ = messages_to_numpy(DeviceMessagesResponse(**PAGE))
+
+        assert messages.dtype == np.dtype(MESSAGE_FIELDS)
+        assert messages["message"].tolist() == [0, 1]
+        assert messages["device"].tolist() == ["1A2B", "1A2B"]
+        assert messages["seqNumber"].tolist() == [1, 2]
+        assert messages["rinfoCount"].tolist() == [2, 1]
+        assert messages["ackRequired"].all()
+        assert messages["lat"][0] == 43.0 and messages["radius"][0] == 500
+        assert math.isnan(messages["lat"][1]) and messages["radius"][1] == -1
+
+    def test_rinfo_table_parses_strings_and_joins(self):
+        """Test rinfo strings are parsed to floats and the message column joins rinfos to their message"""
+        messages, rinfos = messages_to_numpy(DeviceMessagesResponse(**PAGE))
+
+        assert rinfos.dtype == np.dtype(RINFO_FIELDS)
+        assert rinfos["baseStation"].tolist() == ["3D00", "3D01", "3D02"]
+        assert rinfos["rssi"].tolist() == [-121.5, -90.0, -121.5]
+        assert rinfos["lat"][0] == 43.5 and rinfos["lng"][0] == 1.25
+        assert np.isnan(rinfos["rssiRepeaters"]).all()
+        assert rinfos["repetitions"].tolist() == [1, 1, 1]
+        assert rinfos["cbStatus"].tolist() == [200, 200, 200]
+        assert messages["seqNumber"][rinfos["message"]].tolist() == [1, 1, 2]
+
+    def test_raw_records_and_iterators_match_models(self):
+        """Test dicts, Records and plain iterators export the same tables as models"""
+        expected = messages_to_numpy(DeviceMessagesResponse(**PAGE))
+        from_dict = record_class(DeviceMessage).from_dict
+
+        for source in (
+            RecordPage(PAGE["data"]),
+            RecordPage([from_dict(m) for m in PAGE["data"]]),
+            iter(PAGE["data"]),
+        ):
+            messages, rinfos = messages_to_numpy(source)
+            assert messages.tobytes() == expected[0].tobytes()
+            assert rinfos.tobytes() == expected[1].tobytes()
+
+    def test_dev_id_fills_messages_without_device(self):
+        """Test dev_id is used for messages that do not carry their device"""
+        data = dict(message(1, []), device=None)
+
+        messages, rinfos = messages_to_numpy([data], dev_id="FFFF")
+
+        assert messages["device"].tolist() == ["FFFF"]
+        assert len(rinfos) == 0
+
+    def test_missing_numpy(self, monkeypatch):
+        """Test a helpful ImportError is raised without numpy"""
+        monkeypatch.setattr(numpy_export, "np", None)
+
+        with pytest.raises(ImportError, match=r"sigfox-manager\[numpy\]"):
+            messages_to_numpy([])
@@ -0,0 +1,59 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from sigfox_manager.message_poller import AdaptivePollScheduler, MessagePoller
+from sigfox_manager.models.results import BatchResult
+from sigfox_manager.models.schemas import DeviceMessageStats
+from sigfox_manager.utils.poll_schedule import base_interval, fit_budget, message_rate
+
+
+class TestPollSchedule:
+    def test_interval_scales_with_traffic(self):
+        """Test hot devices get short intervals and silent ones back off with their last communication"""
+        hot = message_rate(
+            DeviceMessageStats(lastDay=144, lastWeek=1008, lastMonth=4320)
+        )
+        weekly = message_rate(DeviceMessageStats(lastDay=0, lastWeek=7, lastMonth=30))
+
+        assert base_interval(hot) == pytest.approx(300)
+        assert base_interval(weekly) == pytest.approx(43200)
+        assert base_interval(0.0, last_com_age=7200) == 3600
+        assert base_interval(0.0) == 86400
+        assert base_interval(1.0) == 60
+
+    def test_budget_stretches_every_interval(self):
+        """Test a schedule over budget is slowed down uniformly"""
+        intervals = fit_budget({"hot": 60.0, "cold": 3600.0}, requests_per_hour=30.5)
+
+        assert intervals["hot"] == pytest.approx(120)
+        assert intervals["cold"] == pytest.approx(7200)
+        assert fit_budget({"hot": 60.0}, None) == {"hot": 60.0}
+
+
+class TestAdaptivePollScheduler:
+    def test_hot_devices_polled_more_often(self):
+        """Test only the devices that are due are polled, at rates following their traffic"""
+        manager = MagicMock()
+        stats = {
+            "hot": DeviceMessageStats(lastDay=144, lastWeek=1008, lastMonth=4320),
+            "cold": DeviceMessageStats(lastDay=0, lastWeek=0, lastMonth=1),
+        }
+        manager.get_device_message_number.side_effect = lambda dev_id: stats[dev_id]
+        poller = MessagePoller(
+            manager, ["hot", "cold"], lambda dev_id, messages: None, initial_since=0
+        )
+        polled = []
+        poller.poll_once = lambda dev_ids: polled.append(list(dev_ids)) or BatchResult(
+            results={d: 0 for d in dev_ids}
+        )
+
+        scheduler = AdaptivePollScheduler(poller, stats_max_age=10**9)
+        now = 1_000_000.0
+        for minute in range(0, 60, 5):
+            scheduler.run_once(now + minute * 60)
+
+        assert polled[0] == ["hot", "cold"]
+        assert sum("hot" in p for p in polled) == 12
+        assert sum("cold" in p for p in polled) == 1
+        assert manager.get_device_message_number.call_count == 2
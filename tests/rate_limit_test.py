@@ -0,0 +1,124 @@
+import time
+from unittest.mock import patch, MagicMock
+
+from sigfox_manager.sigfox_manager import SigfoxManager
+from sigfox_manager.utils.http_utils import HttpTransport
+from sigfox_manager.utils.rate_limit import RetryPolicy, TokenBucket, parse_retry_after
+
+
+def response(status_code, retry_after=None):
+    return MagicMock(
+        status_code=status_code,
+        headers={"Retry-After": retry_after} if retry_after is not None else {},
+    )
+
+
+class TestTokenBucket:
+    def test_bucket_allows_burst_then_paces(self):
+        """Test the bucket lets a burst through and then enforces the sustained rate"""
+        bucket = TokenBucket(rate=50, capacity=2)
+
+        start = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+        elapsed = time.monotonic() - start
+
+        # 2 tokens are free, the remaining 4 need 4 / 50 s of refill
+        assert elapsed >= 0.07
+
+    def test_penalize_pauses_every_caller(self):
+        """Test a penalty drains the bucket for the requested duration"""
+        bucket = TokenBucket(rate=100, capacity=10)
+        bucket.penalize(0.05)
+
+        assert bucket.acquire() >= 0.05
+
+    def test_rejects_buckets_that_never_grant(self):
+        """Test a non-positive rate, a capacity below 1 or an oversized acquire raise instead of blocking"""
+        import pytest
+
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=-1)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=10, capacity=0.5)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=10, capacity=2).acquire(3)
+
+
+class TestRetryPolicy:
+    def test_retry_after_header_takes_precedence(self):
+        """Test Retry-After seconds and HTTP dates are honoured and capped"""
+        policy = RetryPolicy(backoff_factor=0.5, max_backoff=10)
+
+        assert policy.delay(0, "3") == 3
+        assert policy.delay(0, "120") == 10
+        assert policy.delay(2) == 2.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+
+    def test_post_only_retried_on_429(self):
+        """Test non-idempotent requests are only replayed when the server throttled them"""
+        policy = RetryPolicy(max_retries=2)
+
+        assert policy.should_retry(429, 0, idempotent=False)
+        assert not policy.should_retry(503, 0, idempotent=False)
+        assert policy.should_retry(503, 1, idempotent=True)
+        assert not policy.should_retry(503, 2, idempotent=True)
+        assert not policy.should_retry(404, 0)
+
+
+class TestTransportRetries:
+    def test_get_retries_throttled_and_failing_responses(self):
+        """Test the transport retries 429/5xx GETs before returning the final response"""
+        transport = HttpTransport(
+            b"dXNlcjpwd2Q=", retry_policy=RetryPolicy(max_retries=3, backoff_factor=0)
+        )
+        with patch.object(transport.session, "get") as mock_session_get:
+            mock_session_get.side_effect = [
+                response(429, "0"),
+                response(503),
+                response(200),
+            ]
+            resp = transport.get("https://api.sigfox.com/v2/devices/d1")
+
+        assert resp.status_code == 200
+        assert mock_session_get.call_count == 3
+
+    def test_get_gives_up_after_max_retries(self):
+        """Test the last throttled response is returned once retries are exhausted"""
+        transport = HttpTransport(
+            b"dXNlcjpwd2Q=", retry_policy=RetryPolicy(max_retries=1, backoff_factor=0)
+        )
+        with patch.object(transport.session, "get") as mock_session_get:
+            mock_session_get.return_value = response(429, "0")
+            resp = transport.get("https://api.sigfox.com/v2/devices/d1")
+
+        assert resp.status_code == 429
+        assert mock_session_get.call_count == 2
+
+    def test_post_not_retried_on_server_error(self):
+        """Test a 500 on POST is returned immediately to avoid duplicate creations"""
+        transport = HttpTransport(b"dXNlcjpwd2Q=")
+        with patch.object(transport.session, "post") as mock_session_post:
+            mock_session_post.return_value = response(500)
+            resp = transport.post("https://api.sigfox.com/v2/devices/", {"id": "A"})
+
+        assert resp.status_code == 500
+        assert mock_session_post.call_count == 1
+
+    def test_manager_shares_rate_limiter_across_calls(self):
+        """Test a manager rate limit paces every call through one bucket"""
+        sm = SigfoxManager("user", "pwd", rate_limit=40, rate_burst=1)
+        with patch.object(sm.transport.session, "get") as mock_session_get:
+            mock_session_get.return_value = MagicMock(
+                status_code=200, text='{"lastDay": 1, "lastWeek": 2, "lastMonth": 3}'
+            )
+            start = time.monotonic()
+            for i in range(5):
+                sm.get_device_message_number(f"d{i}")
+            elapsed = time.monotonic() - start
+
+        assert sm.transport.rate_limiter.rate == 40
+        assert elapsed >= 0.09
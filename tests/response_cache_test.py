@@ -0,0 +1,116 @@
+import time
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from conftest import device_text
+from sigfox_manager.sigfox_manager import SigfoxManager
+from sigfox_manager.utils.response_cache import ResponseCache
+
+DEVICE_TEXT = device_text("d1")
+
+
+class TestResponseCache:
+    def test_lru_eviction_and_counters(self):
+        """Test the least recently used entry is evicted and hits/misses are counted"""
+        cache = ResponseCache(max_entries=2)
+        cache.set("device_info", "a", 1)
+        cache.set("device_info", "b", 2)
+        assert cache.get("device_info", "a") == 1
+        cache.set("device_info", "c", 3)
+
+        assert cache.get("device_info", "b") is None
+        assert cache.get("device_info", "a") == 1
+        assert cache.stats() == {"hits": 2, "misses": 1, "evictions": 1, "size": 2}
+
+    def test_per_endpoint_ttl_and_invalidation(self):
+        """Test entries expire after their endpoint TTL and can be dropped explicitly"""
+        cache = ResponseCache(ttls={"device_message_number": 0.05, "contracts": 0})
+        cache.set("device_message_number", "d1", "stats")
+        cache.set("contracts", True, "never stored")
+        cache.set("device_info", "d1", "device")
+        cache.set("device_info", "d2", "device")
+
+        assert cache.get("contracts", True) is None
+        time.sleep(0.06)
+        assert cache.get("device_message_number", "d1") is None
+
+        cache.invalidate("device_info", "d1")
+        assert cache.get("device_info", "d1") is None
+        assert cache.get("device_info", "d2") == "device"
+        cache.invalidate()
+        assert len(cache) == 0
+
+
+class TestManagerResponseCache:
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_get_device_info_served_from_cache(self, mock_get):
+        """Test repeated reads hit the cache and are not sent upstream"""
+        mock_get.return_value = MagicMock(status_code=200, text=DEVICE_TEXT)
+        sm = SigfoxManager("user", "pwd", response_cache=ResponseCache())
+
+        first = sm.get_device_info("d1")
+        second = sm.get_device_info("d1")
+
+        assert first is second
+        assert mock_get.call_count == 1
+        assert sm.response_cache.hits == 1
+
+    @patch("sigfox_manager.sigfox_manager.do_post")
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_create_device_invalidates_affected_entries(self, mock_get, mock_post):
+        """Test creating a device drops its cached reads and the contracts listing"""
+        mock_post.return_value = MagicMock(status_code=201, text='{"id": "d1"}')
+        cache = ResponseCache()
+        cache.set("device_info", "d1", "stale")
+        cache.set("device_info", "d2", "kept")
+        cache.set("contracts", True, "stale")
+        sm = SigfoxManager("user", "pwd", response_cache=cache)
+
+        sm.create_device("d1", "1234567890ABCDEF", "dt1", "Device 1")
+
+        assert cache.get("device_info", "d1") is None
+        assert cache.get("contracts", True) is None
+        assert cache.get("device_info", "d2") == "kept"
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_partial_listing_not_cached(self, mock_get):
+        """Test a listing interrupted by a failed page is not cached"""
+        mock_get.side_effect = [
+            MagicMock(
+                status_code=200,
+                text='{"data": [{"id": "dt1", "name": "Type A"}], "paging": {"next": "https://api.sigfox.com/v2/devicetypes?page=2"}}',
+            ),
+            MagicMock(status_code=500),
+        ]
+        sm = SigfoxManager("user", "pwd", response_cache=ResponseCache())
+
+        response = sm.get_device_types()
+
+        assert not response.complete
+        assert len(sm.response_cache) == 0
+
+    @pytest.mark.parametrize("use_store", [False, True])
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_catalog_reload_bypasses_cached_device_types(
+        self, mock_get, use_store, tmp_path
+    ):
+        """Test a device type created after the catalog was cached is resolved through the cache and store"""
+        from sigfox_manager.utils.fleet_store import FleetStore
+
+        listings = [
+            '{"data": [{"id": "dt1", "name": "Type A"}], "paging": {"next": null}}',
+            '{"data": [{"id": "dt1", "name": "Type A"}, {"id": "dt2", "name": "Type B"}], "paging": {"next": null}}',
+        ]
+        mock_get.side_effect = lambda url, auth, transport=None: MagicMock(
+            status_code=200, text=listings.pop(0)
+        )
+        store = FleetStore(str(tmp_path / "fleet.db")) if use_store else None
+        sm = SigfoxManager("user", "pwd", response_cache=ResponseCache(), store=store)
+
+        assert sm.resolve_device_type_id("Type A") == "dt1"
+        assert sm.resolve_device_type_id("Type B") == "dt2"
+        assert mock_get.call_count == 2
+
+        sm.invalidate_device_type_catalog()
+        assert sm.response_cache.get("device_types", True) is None
@@ -1,8 +1,18 @@
 from unittest.mock import patch, MagicMock
 import pytest
 from sigfox_manager.sigfox_manager import SigfoxManager
-from sigfox_manager.models.schemas import ContractsResponse, DevicesResponse, DeviceTypesResponse, DeviceType, Paging
-from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import SigfoxDeviceTypeNotFoundException
+from sigfox_manager.models.schemas import (
+    ContractsResponse,
+    DevicesResponse,
+    DeviceTypesResponse,
+    DeviceType,
+    Paging,
+)
+from conftest import device_text, messages_text
+from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+    SigfoxDeviceTypeNotFoundException,
+    SigfoxIncompleteBackfillError,
+)
 
 
 class TestSigfoxManager:
@@ -10,8 +20,8 @@ class TestSigfoxManager:
     def test_get_contracts(self, mock_get):
         # Mock the API response with minimal required fields
         mock_get.return_value = MagicMock(
-            status_code=200, 
-            text='{"data": [{"id": "1", "name": "Contract 1", "activationEndTime": 0, "communicationEndTime": 0, "bidir": false, "highPriorityDownlink": false, "maxUplinkFrames": 0, "maxDownlinkFrames": 0, "maxTokens": 0, "automaticRenewal": false, "renewalDuration": 0, "contractId": "c1", "userId": "u1", "createdBy": "user", "lastEditionTime": 0, "creationTime": 0, "lastEditedBy": "user", "startTime": 0, "timezone": "UTC", "tokenDuration": 0, "tokensInUse": 0, "tokensUsed": 0}], "paging": {"next": null}}'
+            status_code=200,
+            text='{"data": [{"id": "1", "name": "Contract 1", "activationEndTime": 0, "communicationEndTime": 0, "bidir": false, "highPriorityDownlink": false, "maxUplinkFrames": 0, "maxDownlinkFrames": 0, "maxTokens": 0, "automaticRenewal": false, "renewalDuration": 0, "contractId": "c1", "userId": "u1", "createdBy": "user", "lastEditionTime": 0, "creationTime": 0, "lastEditedBy": "user", "startTime": 0, "timezone": "UTC", "tokenDuration": 0, "tokensInUse": 0, "tokensUsed": 0}], "paging": {"next": null}}',
         )
 
         # Initialize SigfoxManager
@@ -29,8 +39,8 @@ class TestSigfoxManager:
     def test_get_devices_by_contract(self, mock_get):
         # Mock the API response with minimal required fields
         mock_get.return_value = MagicMock(
-            status_code=200, 
-            text='{"data": [{"id": "1", "name": "Device 1", "satelliteCapable": false, "repeater": false, "messageModulo": 0, "group": {"id": "g1"}, "prototype": false, "location": {"lat": 0.0, "lng": 0.0}, "pac": "0000000000000000", "lqi": 0, "creationTime": 0, "state": 0, "comState": 0, "createdBy": "user", "lastEditionTime": 0, "lastEditedBy": "user", "automaticRenewal": false, "automaticRenewalStatus": 0, "activable": false}], "paging": {"next": null}}'
+            status_code=200,
+            text='{"data": [{"id": "1", "name": "Device 1", "satelliteCapable": false, "repeater": false, "messageModulo": 0, "group": {"id": "g1"}, "prototype": false, "location": {"lat": 0.0, "lng": 0.0}, "pac": "0000000000000000", "lqi": 0, "creationTime": 0, "state": 0, "comState": 0, "createdBy": "user", "lastEditionTime": 0, "lastEditedBy": "user", "automaticRenewal": false, "automaticRenewalStatus": 0, "activable": false}], "paging": {"next": null}}',
         )
 
         # Initialize SigfoxManager
@@ -50,22 +60,22 @@ class TestSigfoxManager:
         # Mock two pages of device types
         page1_response = MagicMock(
             status_code=200,
-            text='{"data": [{"id": "dt1", "name": "Type A"}], "paging": {"next": "https://api.sigfox.com/v2/devicetypes?page=2"}}'
+            text='{"data": [{"id": "dt1", "name": "Type A"}], "paging": {"next": "https://api.sigfox.com/v2/devicetypes?page=2"}}',
         )
         page2_response = MagicMock(
             status_code=200,
-            text='{"data": [{"id": "dt2", "name": "Type B"}], "paging": {"next": null}}'
+            text='{"data": [{"id": "dt2", "name": "Type B"}], "paging": {"next": null}}',
         )
-        
+
         # Configure mock to return different responses for each call
         mock_get.side_effect = [page1_response, page2_response]
-        
+
         # Initialize SigfoxManager
         sm = SigfoxManager("user", "pwd")
-        
+
         # Call the method with fetch_all_pages=True
         response = sm.get_device_types(fetch_all_pages=True)
-        
+
         # Assert the response contains both items
         assert isinstance(response, DeviceTypesResponse)
         assert len(response.data) == 2
@@ -74,7 +84,7 @@ class TestSigfoxManager:
         assert response.data[1].id == "dt2"
         assert response.data[1].name == "Type B"
         assert response.paging.next is None
-        
+
         # Verify do_get was called twice
         assert mock_get.call_count == 2
 
@@ -84,12 +94,12 @@ class TestSigfoxManager:
         # Mock single page response
         mock_get.return_value = MagicMock(
             status_code=200,
-            text='{"data": [{"id": "dt1", "name": "Type A"}], "paging": {"next": "https://api.sigfox.com/v2/devicetypes?page=2"}}'
+            text='{"data": [{"id": "dt1", "name": "Type A"}], "paging": {"next": "https://api.sigfox.com/v2/devicetypes?page=2"}}',
         )
-        
+
         sm = SigfoxManager("user", "pwd")
         response = sm.get_device_types(fetch_all_pages=False)
-        
+
         assert isinstance(response, DeviceTypesResponse)
         assert len(response.data) == 1
         assert response.paging.next is not None
@@ -101,16 +111,13 @@ class TestSigfoxManager:
         # Use real Pydantic objects
         dt1 = DeviceType(id="dt1", name="Type A")
         dt2 = DeviceType(id="dt2", name="Type B")
-        
-        mock_response = DeviceTypesResponse(
-            data=[dt1, dt2],
-            paging=Paging(next=None)
-        )
+
+        mock_response = DeviceTypesResponse(data=[dt1, dt2], paging=Paging(next=None))
         mock_get_device_types.return_value = mock_response
-        
+
         sm = SigfoxManager("user", "pwd")
         result = sm.resolve_device_type_id("dt1")
-        
+
         assert result == "dt1"
         mock_get_device_types.assert_called_once_with(fetch_all_pages=True)
 
@@ -120,16 +127,13 @@ class TestSigfoxManager:
         # Use real Pydantic objects instead of MagicMock for proper equality checks
         dt1 = DeviceType(id="dt1", name="Type A")
         dt2 = DeviceType(id="dt2", name="Type B")
-        
-        mock_response = DeviceTypesResponse(
-            data=[dt1, dt2],
-            paging=Paging(next=None)
-        )
+
+        mock_response = DeviceTypesResponse(data=[dt1, dt2], paging=Paging(next=None))
         mock_get_device_types.return_value = mock_response
-        
+
         sm = SigfoxManager("user", "pwd")
         result = sm.resolve_device_type_id("Type A")
-        
+
         assert result == "dt1"
         mock_get_device_types.assert_called_once_with(fetch_all_pages=True)
 
@@ -139,45 +143,44 @@ class TestSigfoxManager:
         # Use real Pydantic objects
         dt1 = DeviceType(id="dt1", name="Type A")
         dt2 = DeviceType(id="dt2", name="Type B")
-        
-        mock_response = DeviceTypesResponse(
-            data=[dt1, dt2],
-            paging=Paging(next=None)
-        )
+
+        mock_response = DeviceTypesResponse(data=[dt1, dt2], paging=Paging(next=None))
         mock_get_device_types.return_value = mock_response
-        
+
         sm = SigfoxManager("user", "pwd")
-        
+
         with pytest.raises(SigfoxDeviceTypeNotFoundException) as exc_info:
             sm.resolve_device_type_id("NonExistent")
-        
+
         assert "Device type not found: NonExistent" in str(exc_info.value)
 
     @patch.object(SigfoxManager, "create_device")
     @patch.object(SigfoxManager, "resolve_device_type_id")
-    def test_provision_device_validates_and_calls_create(self, mock_resolve, mock_create):
+    def test_provision_device_validates_and_calls_create(
+        self, mock_resolve, mock_create
+    ):
         """Test provision_device validates inputs and calls create_device"""
         # Mock resolve_device_type_id to return a device type id
         mock_resolve.return_value = "dt1"
-        
+
         # Mock create_device to return a BaseDevice
         mock_device = MagicMock(id="19C3B", name="field-node-42")
         mock_create.return_value = mock_device
-        
+
         sm = SigfoxManager("user", "pwd")
-        
+
         # Call provision_device with valid inputs
         result = sm.provision_device(
             dev_id="19C3B",
             pac="1234567890ABCDEF",
             dev_type_ref="Type A",
             name="field-node-42",
-            automatic_renewal=True
+            automatic_renewal=True,
         )
-        
+
         # Verify resolve_device_type_id was called
         mock_resolve.assert_called_once_with("Type A")
-        
+
         # Verify create_device was called with correct parameters
         mock_create.assert_called_once_with(
             dev_id="19C3B",
@@ -189,123 +192,113 @@ class TestSigfoxManager:
             lng=0.0,
             product_cert=None,
             prototype=False,
-            automatic_renewal=True
+            automatic_renewal=True,
         )
-        
+
         assert result == mock_device
 
     def test_provision_device_invalid_dev_id(self):
         """Test provision_device raises ValueError for invalid dev_id"""
         sm = SigfoxManager("user", "pwd")
-        
+
         # Test lowercase
         with pytest.raises(ValueError) as exc_info:
             sm.provision_device(
-                dev_id="19c3b",
-                pac="1234567890ABCDEF",
-                dev_type_ref="Type A"
+                dev_id="19c3b", pac="1234567890ABCDEF", dev_type_ref="Type A"
             )
         assert "Invalid dev_id format" in str(exc_info.value)
-        
+
         # Test too short
         with pytest.raises(ValueError) as exc_info:
             sm.provision_device(
-                dev_id="AB",
-                pac="1234567890ABCDEF",
-                dev_type_ref="Type A"
+                dev_id="AB", pac="1234567890ABCDEF", dev_type_ref="Type A"
             )
         assert "Invalid dev_id format" in str(exc_info.value)
-        
+
         # Test too long
         with pytest.raises(ValueError) as exc_info:
             sm.provision_device(
                 dev_id="12345678901234567",
                 pac="1234567890ABCDEF",
-                dev_type_ref="Type A"
+                dev_type_ref="Type A",
             )
         assert "Invalid dev_id format" in str(exc_info.value)
-        
+
         # Test non-hex characters
         with pytest.raises(ValueError) as exc_info:
             sm.provision_device(
-                dev_id="ZZZZZ",
-                pac="1234567890ABCDEF",
-                dev_type_ref="Type A"
+                dev_id="ZZZZZ", pac="1234567890ABCDEF", dev_type_ref="Type A"
             )
         assert "Invalid dev_id format" in str(exc_info.value)
 
     def test_provision_device_invalid_pac(self):
         """Test provision_device raises ValueError for invalid pac"""
         sm = SigfoxManager("user", "pwd")
-        
+
         # Test too short
         with pytest.raises(ValueError) as exc_info:
-            sm.provision_device(
-                dev_id="19C3B",
-                pac="123456789",
-                dev_type_ref="Type A"
-            )
+            sm.provision_device(dev_id="19C3B", pac="123456789", dev_type_ref="Type A")
         assert "Invalid pac format" in str(exc_info.value)
-        
+
         # Test too long
         with pytest.raises(ValueError) as exc_info:
             sm.provision_device(
-                dev_id="19C3B",
-                pac="1234567890ABCDEF123",
-                dev_type_ref="Type A"
+                dev_id="19C3B", pac="1234567890ABCDEF123", dev_type_ref="Type A"
             )
         assert "Invalid pac format" in str(exc_info.value)
-        
+
         # Test special characters
         with pytest.raises(ValueError) as exc_info:
             sm.provision_device(
-                dev_id="19C3B",
-                pac="123456789@ABCDEF",
-                dev_type_ref="Type A"
+                dev_id="19C3B", pac="123456789@ABCDEF", dev_type_ref="Type A"
             )
         assert "Invalid pac format" in str(exc_info.value)
 
     @patch.object(SigfoxManager, "create_device")
     @patch.object(SigfoxManager, "resolve_device_type_id")
-    def test_provision_device_uses_dev_id_as_default_name(self, mock_resolve, mock_create):
+    def test_provision_device_uses_dev_id_as_default_name(
+        self, mock_resolve, mock_create
+    ):
         """Test provision_device uses dev_id as name when name not provided"""
         mock_resolve.return_value = "dt1"
         mock_device = MagicMock(id="ABC123")
         mock_create.return_value = mock_device
-        
+
         sm = SigfoxManager("user", "pwd")
         sm.provision_device(
-            dev_id="ABC123",
-            pac="1234567890ABCDEF",
-            dev_type_ref="Type A"
+            dev_id="ABC123", pac="1234567890ABCDEF", dev_type_ref="Type A"
         )
-        
+
         # Verify create_device was called with dev_id as name
         call_args = mock_create.call_args
-        assert call_args[1]['name'] == "ABC123"
+        assert call_args[1]["name"] == "ABC123"
 
     @patch("sigfox_manager.sigfox_manager.do_get")
     def test_get_device_types_handles_403_auth_error(self, mock_get):
         """Test that get_device_types raises SigfoxAuthError on 403"""
-        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import SigfoxAuthError
-        
+        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+            SigfoxAuthError,
+        )
+
         mock_get.return_value = MagicMock(status_code=403)
         sm = SigfoxManager("user", "pwd")
-        
+
         with pytest.raises(SigfoxAuthError):
             sm.get_device_types()
 
     @patch("sigfox_manager.sigfox_manager.do_get")
     def test_get_device_types_handles_non_200_error(self, mock_get):
         """Test that get_device_types raises SigfoxAPIException on non-200 status"""
-        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import SigfoxAPIException
-        
+        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+            SigfoxAPIException,
+        )
+
         mock_get.return_value = MagicMock(status_code=500, text="Internal Server Error")
         sm = SigfoxManager("user", "pwd")
-        
+
         with pytest.raises(SigfoxAPIException) as exc_info:
             sm.get_device_types()
-        
+
         assert exc_info.value.status_code == 500
 
     @patch("sigfox_manager.sigfox_manager.do_get")
@@ -314,16 +307,16 @@ class TestSigfoxManager:
         # First page succeeds, second page fails
         page1_response = MagicMock(
             status_code=200,
-            text='{"data": [{"id": "dt1", "name": "Type A"}], "paging": {"next": "https://api.sigfox.com/v2/devicetypes?page=2"}}'
+            text='{"data": [{"id": "dt1", "name": "Type A"}], "paging": {"next": "https://api.sigfox.com/v2/devicetypes?page=2"}}',
         )
         page2_response = MagicMock(status_code=500)
-        
+
         mock_get.side_effect = [page1_response, page2_response]
         sm = SigfoxManager("user", "pwd")
-        
+
         # Should return what we got before the error
         response = sm.get_device_types(fetch_all_pages=True)
-        
+
         assert len(response.data) == 1
         assert response.data[0].id == "dt1"
 
@@ -332,12 +325,12 @@ class TestSigfoxManager:
         """Test get_device_types with no pagination in response"""
         mock_get.return_value = MagicMock(
             status_code=200,
-            text='{"data": [{"id": "dt1", "name": "Type A"}], "paging": {"next": null}}'
+            text='{"data": [{"id": "dt1", "name": "Type A"}], "paging": {"next": null}}',
         )
-        
+
         sm = SigfoxManager("user", "pwd")
         response = sm.get_device_types(fetch_all_pages=True)
-        
+
         assert len(response.data) == 1
         assert response.paging.next is None
         assert mock_get.call_count == 1
@@ -349,19 +342,18 @@ class TestSigfoxManager:
         dt1 = DeviceType(id=None, name="Type A")
         dt2 = DeviceType(id="dt2", name=None)
         dt3 = DeviceType(id="dt3", name="Type C")
-        
+
         mock_response = DeviceTypesResponse(
-            data=[dt1, dt2, dt3],
-            paging=Paging(next=None)
+            data=[dt1, dt2, dt3], paging=Paging(next=None)
         )
         mock_get_device_types.return_value = mock_response
-        
+
         sm = SigfoxManager("user", "pwd")
-        
+
         # Should find dt3
         result = sm.resolve_device_type_id("dt3")
         assert result == "dt3"
-        
+
         # Should find by name even if previous entries have None
         result = sm.resolve_device_type_id("Type C")
         assert result == "dt3"
@@ -370,26 +362,26 @@ class TestSigfoxManager:
     def test_provision_device_propagates_resolve_exception(self, mock_resolve):
         """Test provision_device propagates SigfoxDeviceTypeNotFoundException"""
         mock_resolve.side_effect = SigfoxDeviceTypeNotFoundException("Not found")
-        
+
         sm = SigfoxManager("user", "pwd")
-        
+
         with pytest.raises(SigfoxDeviceTypeNotFoundException):
             sm.provision_device(
-                dev_id="ABC123",
-                pac="1234567890ABCDEF",
-                dev_type_ref="NonExistent"
+                dev_id="ABC123", pac="1234567890ABCDEF", dev_type_ref="NonExistent"
             )
 
     @patch.object(SigfoxManager, "create_device")
     @patch.object(SigfoxManager, "resolve_device_type_id")
     def test_provision_device_with_all_kwargs(self, mock_resolve, mock_create):
         """Test provision_device passes through all optional kwargs"""
-        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import SigfoxDeviceCreateConflictException
-        
+        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+            SigfoxDeviceCreateConflictException,
+        )
+
         mock_resolve.return_value = "dt1"
         mock_device = MagicMock(id="ABC123")
         mock_create.return_value = mock_device
-        
+
         sm = SigfoxManager("user", "pwd")
         sm.provision_device(
             dev_id="ABC123",
@@ -401,71 +393,71 @@ class TestSigfoxManager:
             lat=45.5,
             lng=-73.6,
             activable=False,
-            product_cert={"key": "test"}
+            product_cert={"key": "test"},
         )
-        
+
         # Verify all parameters were passed
         call_kwargs = mock_create.call_args[1]
-        assert call_kwargs['name'] == "custom-name"
-        assert call_kwargs['prototype'] is True
-        assert call_kwargs['automatic_renewal'] is False
-        assert call_kwargs['lat'] == 45.5
-        assert call_kwargs['lng'] == -73.6
-        assert call_kwargs['activable'] is False
-        assert call_kwargs['product_cert'] == {"key": "test"}
+        assert call_kwargs["name"] == "custom-name"
+        assert call_kwargs["prototype"] is True
+        assert call_kwargs["automatic_renewal"] is False
+        assert call_kwargs["lat"] == 45.5
+        assert call_kwargs["lng"] == -73.6
+        assert call_kwargs["activable"] is False
+        assert call_kwargs["product_cert"] == {"key": "test"}
 
     @patch.object(SigfoxManager, "create_device")
     @patch.object(SigfoxManager, "resolve_device_type_id")
-    def test_provision_device_propagates_create_exceptions(self, mock_resolve, mock_create):
+    def test_provision_device_propagates_create_exceptions(
+        self, mock_resolve, mock_create
+    ):
         """Test provision_device propagates exceptions from create_device"""
-        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import SigfoxDeviceCreateConflictException
-        
+        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+            SigfoxDeviceCreateConflictException,
+        )
+
         mock_resolve.return_value = "dt1"
         mock_create.side_effect = SigfoxDeviceCreateConflictException()
-        
+
         sm = SigfoxManager("user", "pwd")
-        
+
         with pytest.raises(SigfoxDeviceCreateConflictException):
             sm.provision_device(
-                dev_id="ABC123",
-                pac="1234567890ABCDEF",
-                dev_type_ref="Type A"
+                dev_id="ABC123", pac="1234567890ABCDEF", dev_type_ref="Type A"
             )
 
     def test_provision_device_edge_case_dev_id_length(self):
         """Test provision_device accepts edge case lengths for dev_id"""
         sm = SigfoxManager("user", "pwd")
-        
+
         # Test minimum valid length (3 chars)
-        with patch.object(SigfoxManager, "resolve_device_type_id") as mock_resolve, \
-             patch.object(SigfoxManager, "create_device") as mock_create:
+        with patch.object(
+            SigfoxManager, "resolve_device_type_id"
+        ) as mock_resolve, patch.object(SigfoxManager, "create_device") as mock_create:
             mock_resolve.return_value = "dt1"
             mock_create.return_value = MagicMock(id="ABC")
-            
+
             result = sm.provision_device(
-                dev_id="ABC",
-                pac="1234567890ABCDEF",
-                dev_type_ref="Type A"
+                dev_id="ABC", pac="1234567890ABCDEF", dev_type_ref="Type A"
             )
             assert result is not None
-        
+
         # Test maximum valid length (16 chars)
-        with patch.object(SigfoxManager, "resolve_device_type_id") as mock_resolve, \
-             patch.object(SigfoxManager, "create_device") as mock_create:
+        with patch.object(
+            SigfoxManager, "resolve_device_type_id"
+        ) as mock_resolve, patch.object(SigfoxManager, "create_device") as mock_create:
             mock_resolve.return_value = "dt1"
             mock_create.return_value = MagicMock(id="1234567890ABCDEF")
-            
+
             result = sm.provision_device(
-                dev_id="1234567890ABCDEF",
-                pac="1234567890ABCDEF",
-                dev_type_ref="Type A"
+                dev_id="1234567890ABCDEF", pac="1234567890ABCDEF", dev_type_ref="Type A"
             )
             assert result is not None
 
     def test_provision_device_valid_pac_formats(self):
         """Test provision_device accepts various valid PAC formats"""
         sm = SigfoxManager("user", "pwd")
-        
+
         valid_pacs = [
             "1234567890ABCDEF",  # uppercase hex
             "1234567890abcdef",  # lowercase hex
@@ -473,17 +465,18 @@ class TestSigfoxManager:
             "0000000000000000",  # all zeros
             "FFFFFFFFFFFFFFFF",  # all F
         ]
-        
+
         for pac in valid_pacs:
-            with patch.object(SigfoxManager, "resolve_device_type_id") as mock_resolve, \
-                 patch.object(SigfoxManager, "create_device") as mock_create:
+            with patch.object(
+                SigfoxManager, "resolve_device_type_id"
+            ) as mock_resolve, patch.object(
+                SigfoxManager, "create_device"
+            ) as mock_create:
                 mock_resolve.return_value = "dt1"
                 mock_create.return_value = MagicMock(id="ABC123")
-                
+
                 result = sm.provision_device(
-                    dev_id="ABC123",
-                    pac=pac,
-                    dev_type_ref="Type A"
+                    dev_id="ABC123", pac=pac, dev_type_ref="Type A"
                 )
                 assert result is not None
 
@@ -491,13 +484,12 @@ class TestSigfoxManager:
     def test_get_device_types_empty_response(self, mock_get):
         """Test get_device_types handles empty device type list"""
         mock_get.return_value = MagicMock(
-            status_code=200,
-            text='{"data": [], "paging": {"next": null}}'
+            status_code=200, text='{"data": [], "paging": {"next": null}}'
         )
-        
+
         sm = SigfoxManager("user", "pwd")
         response = sm.get_device_types()
-        
+
         assert isinstance(response, DeviceTypesResponse)
         assert len(response.data) == 0
         assert response.paging.next is None
@@ -505,35 +497,32 @@ class TestSigfoxManager:
     @patch.object(SigfoxManager, "get_device_types")
     def test_resolve_device_type_id_empty_list(self, mock_get_device_types):
         """Test resolve_device_type_id raises exception with empty device type list"""
-        mock_response = DeviceTypesResponse(
-            data=[],
-            paging=Paging(next=None)
-        )
+        mock_response = DeviceTypesResponse(data=[], paging=Paging(next=None))
         mock_get_device_types.return_value = mock_response
-        
+
         sm = SigfoxManager("user", "pwd")
-        
+
         with pytest.raises(SigfoxDeviceTypeNotFoundException):
             sm.resolve_device_type_id("AnyType")
 
     # Tests for existing methods not yet covered
-    
+
     @patch("sigfox_manager.sigfox_manager.do_get")
     def test_get_contracts_pagination_merges_multiple_pages(self, mock_get):
         """Test get_contracts with multiple pages of contracts"""
         page1 = MagicMock(
             status_code=200,
-            text='{"data": [{"id": "c1", "name": "Contract 1", "activationEndTime": 0, "communicationEndTime": 0, "bidir": false, "highPriorityDownlink": false, "maxUplinkFrames": 0, "maxDownlinkFrames": 0, "maxTokens": 0, "automaticRenewal": false, "renewalDuration": 0, "contractId": "c1", "userId": "u1", "createdBy": "user", "lastEditionTime": 0, "creationTime": 0, "lastEditedBy": "user", "startTime": 0, "timezone": "UTC", "tokenDuration": 0, "tokensInUse": 0, "tokensUsed": 0}], "paging": {"next": "https://api.sigfox.com/v2/contract-infos?page=2"}}'
+            text='{"data": [{"id": "c1", "name": "Contract 1", "activationEndTime": 0, "communicationEndTime": 0, "bidir": false, "highPriorityDownlink": false, "maxUplinkFrames": 0, "maxDownlinkFrames": 0, "maxTokens": 0, "automaticRenewal": false, "renewalDuration": 0, "contractId": "c1", "userId": "u1", "createdBy": "user", "lastEditionTime": 0, "creationTime": 0, "lastEditedBy": "user", "startTime": 0, "timezone": "UTC", "tokenDuration": 0, "tokensInUse": 0, "tokensUsed": 0}], "paging": {"next": "https://api.sigfox.com/v2/contract-infos?page=2"}}',
         )
         page2 = MagicMock(
             status_code=200,
-            text='{"data": [{"id": "c2", "name": "Contract 2", "activationEndTime": 0, "communicationEndTime": 0, "bidir": false, "highPriorityDownlink": false, "maxUplinkFrames": 0, "maxDownlinkFrames": 0, "maxTokens": 0, "automaticRenewal": false, "renewalDuration": 0, "contractId": "c2", "userId": "u1", "createdBy": "user", "lastEditionTime": 0, "creationTime": 0, "lastEditedBy": "user", "startTime": 0, "timezone": "UTC", "tokenDuration": 0, "tokensInUse": 0, "tokensUsed": 0}], "paging": {"next": null}}'
+            text='{"data": [{"id": "c2", "name": "Contract 2", "activationEndTime": 0, "communicationEndTime": 0, "bidir": false, "highPriorityDownlink": false, "maxUplinkFrames": 0, "maxDownlinkFrames": 0, "maxTokens": 0, "automaticRenewal": false, "renewalDuration": 0, "contractId": "c2", "userId": "u1", "createdBy": "user", "lastEditionTime": 0, "creationTime": 0, "lastEditedBy": "user", "startTime": 0, "timezone": "UTC", "tokenDuration": 0, "tokensInUse": 0, "tokensUsed": 0}], "paging": {"next": null}}',
         )
         mock_get.side_effect = [page1, page2]
-        
+
         sm = SigfoxManager("user", "pwd")
         response = sm.get_contracts(fetch_all_pages=True)
-        
+
         assert len(response.data) == 2
         assert response.data[0].id == "c1"
         assert response.data[1].id == "c2"
@@ -543,14 +532,16 @@ class TestSigfoxManager:
     @patch("sigfox_manager.sigfox_manager.do_get")
     def test_get_contracts_error_handling(self, mock_get):
         """Test get_contracts raises SigfoxAPIException on non-200"""
-        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import SigfoxAPIException
-        
+        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+            SigfoxAPIException,
+        )
+
         mock_get.return_value = MagicMock(status_code=500)
         sm = SigfoxManager("user", "pwd")
-        
+
         with pytest.raises(SigfoxAPIException) as exc_info:
             sm.get_contracts()
-        
+
         assert exc_info.value.status_code == 500
 
     @patch("sigfox_manager.sigfox_manager.do_get")
@@ -558,17 +549,17 @@ class TestSigfoxManager:
         """Test get_devices_by_contract with pagination"""
         page1 = MagicMock(
             status_code=200,
-            text='{"data": [{"id": "d1", "name": "Device 1", "satelliteCapable": false, "repeater": false, "messageModulo": 0, "group": {"id": "g1"}, "prototype": false, "location": {"lat": 0.0, "lng": 0.0}, "pac": "0000000000000000", "lqi": 0, "creationTime": 0, "state": 0, "comState": 0, "createdBy": "user", "lastEditionTime": 0, "lastEditedBy": "user", "automaticRenewal": false, "automaticRenewalStatus": 0, "activable": false}], "paging": {"next": "https://api.sigfox.com/v2/devices?page=2"}}'
+            text='{"data": [{"id": "d1", "name": "Device 1", "satelliteCapable": false, "repeater": false, "messageModulo": 0, "group": {"id": "g1"}, "prototype": false, "location": {"lat": 0.0, "lng": 0.0}, "pac": "0000000000000000", "lqi": 0, "creationTime": 0, "state": 0, "comState": 0, "createdBy": "user", "lastEditionTime": 0, "lastEditedBy": "user", "automaticRenewal": false, "automaticRenewalStatus": 0, "activable": false}], "paging": {"next": "https://api.sigfox.com/v2/devices?page=2"}}',
         )
         page2 = MagicMock(
             status_code=200,
-            text='{"data": [{"id": "d2", "name": "Device 2", "satelliteCapable": false, "repeater": false, "messageModulo": 0, "group": {"id": "g1"}, "prototype": false, "location": {"lat": 0.0, "lng": 0.0}, "pac": "0000000000000000", "lqi": 0, "creationTime": 0, "state": 0, "comState": 0, "createdBy": "user", "lastEditionTime": 0, "lastEditedBy": "user", "automaticRenewal": false, "automaticRenewalStatus": 0, "activable": false}], "paging": {"next": null}}'
+            text='{"data": [{"id": "d2", "name": "Device 2", "satelliteCapable": false, "repeater": false, "messageModulo": 0, "group": {"id": "g1"}, "prototype": false, "location": {"lat": 0.0, "lng": 0.0}, "pac": "0000000000000000", "lqi": 0, "creationTime": 0, "state": 0, "comState": 0, "createdBy": "user", "lastEditionTime": 0, "lastEditedBy": "user", "automaticRenewal": false, "automaticRenewalStatus": 0, "activable": false}], "paging": {"next": null}}',
         )
         mock_get.side_effect = [page1, page2]
-        
+
         sm = SigfoxManager("user", "pwd")
         response = sm.get_devices_by_contract("c1", fetch_all_pages=True)
-        
+
         assert len(response.data) == 2
         assert response.data[0].id == "d1"
         assert response.data[1].id == "d2"
@@ -577,11 +568,13 @@ class TestSigfoxManager:
     @patch("sigfox_manager.sigfox_manager.do_get")
     def test_get_devices_by_contract_error(self, mock_get):
         """Test get_devices_by_contract raises SigfoxDeviceNotFoundError"""
-        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import SigfoxDeviceNotFoundError
-        
+        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+            SigfoxDeviceNotFoundError,
+        )
+
         mock_get.return_value = MagicMock(status_code=404)
         sm = SigfoxManager("user", "pwd")
-        
+
         with pytest.raises(SigfoxDeviceNotFoundError):
             sm.get_devices_by_contract("nonexistent")
 
@@ -589,15 +582,15 @@ class TestSigfoxManager:
     def test_get_device_info_success(self, mock_get):
         """Test get_device_info returns device details"""
         from sigfox_manager.models.schemas import Device
-        
+
         mock_get.return_value = MagicMock(
             status_code=200,
-            text='{"id": "d1", "name": "Device 1", "satelliteCapable": false, "repeater": false, "messageModulo": 0, "group": {"id": "g1"}, "prototype": false, "location": {"lat": 0.0, "lng": 0.0}, "pac": "0000000000000000", "lqi": 0, "creationTime": 0, "state": 0, "comState": 0, "createdBy": "user", "lastEditionTime": 0, "lastEditedBy": "user", "automaticRenewal": false, "automaticRenewalStatus": 0, "activable": false}'
+            text='{"id": "d1", "name": "Device 1", "satelliteCapable": false, "repeater": false, "messageModulo": 0, "group": {"id": "g1"}, "prototype": false, "location": {"lat": 0.0, "lng": 0.0}, "pac": "0000000000000000", "lqi": 0, "creationTime": 0, "state": 0, "comState": 0, "createdBy": "user", "lastEditionTime": 0, "lastEditedBy": "user", "automaticRenewal": false, "automaticRenewalStatus": 0, "activable": false}',
         )
-        
+
         sm = SigfoxManager("user", "pwd")
         device = sm.get_device_info("d1")
-        
+
         assert isinstance(device, Device)
         assert device.id == "d1"
         assert device.name == "Device 1"
@@ -605,22 +598,26 @@ class TestSigfoxManager:
     @patch("sigfox_manager.sigfox_manager.do_get")
     def test_get_device_info_403_error(self, mock_get):
         """Test get_device_info raises SigfoxAuthError on 403"""
-        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import SigfoxAuthError
-        
+        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+            SigfoxAuthError,
+        )
+
         mock_get.return_value = MagicMock(status_code=403)
         sm = SigfoxManager("user", "pwd")
-        
+
         with pytest.raises(SigfoxAuthError):
             sm.get_device_info("d1")
 
     @patch("sigfox_manager.sigfox_manager.do_get")
     def test_get_device_info_404_error(self, mock_get):
         """Test get_device_info raises SigfoxDeviceNotFoundError on 404"""
-        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import SigfoxDeviceNotFoundError
-        
+        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+            SigfoxDeviceNotFoundError,
+        )
+
         mock_get.return_value = MagicMock(status_code=404)
         sm = SigfoxManager("user", "pwd")
-        
+
         with pytest.raises(SigfoxDeviceNotFoundError):
             sm.get_device_info("d1")
 
@@ -628,15 +625,15 @@ class TestSigfoxManager:
     def test_get_device_messages_without_threshold(self, mock_get):
         """Test get_device_messages retrieves all messages"""
         from sigfox_manager.models.schemas import DeviceMessagesResponse
-        
+
         mock_get.return_value = MagicMock(
             status_code=200,
-            text='{"data": [{"time": 1234567890, "data": "abc123", "lqi": 4, "seqNumber": 1, "nbFrames": 1, "computedLocation": [], "rinfos": []}], "paging": {"next": null}}'
+            text='{"data": [{"time": 1234567890, "data": "abc123", "lqi": 4, "seqNumber": 1, "nbFrames": 1, "computedLocation": [], "rinfos": []}], "paging": {"next": null}}',
         )
-        
+
         sm = SigfoxManager("user", "pwd")
         messages = sm.get_device_messages("d1")
-        
+
         assert isinstance(messages, DeviceMessagesResponse)
         assert len(messages.data) == 1
 
@@ -644,15 +641,14 @@ class TestSigfoxManager:
     def test_get_device_messages_with_threshold(self, mock_get):
         """Test get_device_messages with threshold parameter"""
         from sigfox_manager.models.schemas import DeviceMessagesResponse
-        
+
         mock_get.return_value = MagicMock(
-            status_code=200,
-            text='{"data": [], "paging": {"next": null}}'
+            status_code=200, text='{"data": [], "paging": {"next": null}}'
         )
-        
+
         sm = SigfoxManager("user", "pwd")
         messages = sm.get_device_messages("d1", threshold=1234567890)
-        
+
         assert isinstance(messages, DeviceMessagesResponse)
         # Verify the URL includes the threshold
         call_args = mock_get.call_args[0][0]
@@ -661,22 +657,26 @@ class TestSigfoxManager:
     @patch("sigfox_manager.sigfox_manager.do_get")
     def test_get_device_messages_403_error(self, mock_get):
         """Test get_device_messages raises SigfoxAuthError on 403"""
-        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import SigfoxAuthError
-        
+        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+            SigfoxAuthError,
+        )
+
         mock_get.return_value = MagicMock(status_code=403)
         sm = SigfoxManager("user", "pwd")
-        
+
         with pytest.raises(SigfoxAuthError):
             sm.get_device_messages("d1")
 
     @patch("sigfox_manager.sigfox_manager.do_get")
     def test_get_device_messages_404_error(self, mock_get):
         """Test get_device_messages raises SigfoxDeviceNotFoundError on 404"""
-        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import SigfoxDeviceNotFoundError
-        
+        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+            SigfoxDeviceNotFoundError,
+        )
+
         mock_get.return_value = MagicMock(status_code=404)
         sm = SigfoxManager("user", "pwd")
-        
+
         with pytest.raises(SigfoxDeviceNotFoundError):
             sm.get_device_messages("d1")
 
@@ -684,15 +684,14 @@ class TestSigfoxManager:
     def test_get_device_message_number_success(self, mock_get):
         """Test get_device_message_number returns message stats"""
         from sigfox_manager.models.schemas import DeviceMessageStats
-        
+
         mock_get.return_value = MagicMock(
-            status_code=200,
-            text='{"lastDay": 10, "lastWeek": 50, "lastMonth": 200}'
+            status_code=200, text='{"lastDay": 10, "lastWeek": 50, "lastMonth": 200}'
         )
-        
+
         sm = SigfoxManager("user", "pwd")
         stats = sm.get_device_message_number("d1")
-        
+
         assert isinstance(stats, DeviceMessageStats)
         assert stats.lastDay == 10
         assert stats.lastWeek == 50
@@ -701,22 +700,26 @@ class TestSigfoxManager:
     @patch("sigfox_manager.sigfox_manager.do_get")
     def test_get_device_message_number_403_error(self, mock_get):
         """Test get_device_message_number raises SigfoxAuthError on 403"""
-        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import SigfoxAuthError
-        
+        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+            SigfoxAuthError,
+        )
+
         mock_get.return_value = MagicMock(status_code=403)
         sm = SigfoxManager("user", "pwd")
-        
+
         with pytest.raises(SigfoxAuthError):
             sm.get_device_message_number("d1")
 
     @patch("sigfox_manager.sigfox_manager.do_get")
     def test_get_device_message_number_404_error(self, mock_get):
         """Test get_device_message_number raises SigfoxDeviceNotFoundError on 404"""
-        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import SigfoxDeviceNotFoundError
-        
+        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+            SigfoxDeviceNotFoundError,
+        )
+
         mock_get.return_value = MagicMock(status_code=404)
         sm = SigfoxManager("user", "pwd")
-        
+
         with pytest.raises(SigfoxDeviceNotFoundError):
             sm.get_device_message_number("d1")
 
@@ -724,20 +727,17 @@ class TestSigfoxManager:
     def test_create_device_success(self, mock_post):
         """Test create_device creates a device successfully"""
         from sigfox_manager.models.schemas import BaseDevice
-        
-        mock_post.return_value = MagicMock(
-            status_code=201,
-            text='{"id": "ABC123"}'
-        )
-        
+
+        mock_post.return_value = MagicMock(status_code=201, text='{"id": "ABC123"}')
+
         sm = SigfoxManager("user", "pwd")
         device = sm.create_device(
             dev_id="ABC123",
             pac="1234567890ABCDEF",
             dev_type_id="dt1",
-            name="Test Device"
+            name="Test Device",
         )
-        
+
         assert isinstance(device, BaseDevice)
         assert device.id == "ABC123"
 
@@ -745,12 +745,9 @@ class TestSigfoxManager:
     def test_create_device_with_product_cert(self, mock_post):
         """Test create_device with product certificate"""
         from sigfox_manager.models.schemas import BaseDevice
-        
-        mock_post.return_value = MagicMock(
-            status_code=201,
-            text='{"id": "ABC123"}'
-        )
-        
+
+        mock_post.return_value = MagicMock(status_code=201, text='{"id": "ABC123"}')
+
         sm = SigfoxManager("user", "pwd")
         product_cert = {"key": "test_cert_key"}
         device = sm.create_device(
@@ -758,9 +755,9 @@ class TestSigfoxManager:
             pac="1234567890ABCDEF",
             dev_type_id="dt1",
             name="Test Device",
-            product_cert=product_cert
+            product_cert=product_cert,
         )
-        
+
         # Verify product_cert was included in the payload
         call_args = mock_post.call_args[0][1]
         assert "productCertificate" in call_args
@@ -770,12 +767,9 @@ class TestSigfoxManager:
     def test_create_device_with_all_parameters(self, mock_post):
         """Test create_device with all optional parameters"""
         from sigfox_manager.models.schemas import BaseDevice
-        
-        mock_post.return_value = MagicMock(
-            status_code=201,
-            text='{"id": "ABC123"}'
-        )
-        
+
+        mock_post.return_value = MagicMock(status_code=201, text='{"id": "ABC123"}')
+
         sm = SigfoxManager("user", "pwd")
         device = sm.create_device(
             dev_id="ABC123",
@@ -786,9 +780,9 @@ class TestSigfoxManager:
             lat=45.5,
             lng=-73.6,
             prototype=True,
-            automatic_renewal=False
+            automatic_renewal=False,
         )
-        
+
         # Verify all parameters were included
         call_args = mock_post.call_args[0][1]
         assert call_args["activable"] is False
@@ -800,45 +794,46 @@ class TestSigfoxManager:
     @patch("sigfox_manager.sigfox_manager.do_post")
     def test_create_device_403_error(self, mock_post):
         """Test create_device raises SigfoxAuthError on 403"""
-        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import SigfoxAuthError
-        
+        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+            SigfoxAuthError,
+        )
+
         mock_post.return_value = MagicMock(status_code=403)
         sm = SigfoxManager("user", "pwd")
-        
+
         with pytest.raises(SigfoxAuthError):
             sm.create_device(
                 dev_id="ABC123",
                 pac="1234567890ABCDEF",
                 dev_type_id="dt1",
-                name="Test Device"
+                name="Test Device",
             )
 
     @patch("sigfox_manager.sigfox_manager.do_post")
     def test_create_device_409_conflict(self, mock_post):
         """Test create_device raises SigfoxDeviceCreateConflictException on 409"""
-        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import SigfoxDeviceCreateConflictException
-        
+        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+            SigfoxDeviceCreateConflictException,
+        )
+
         mock_post.return_value = MagicMock(status_code=409)
         sm = SigfoxManager("user", "pwd")
-        
+
         with pytest.raises(SigfoxDeviceCreateConflictException):
             sm.create_device(
                 dev_id="ABC123",
                 pac="1234567890ABCDEF",
                 dev_type_id="dt1",
-                name="Test Device"
+                name="Test Device",
             )
 
     @patch("sigfox_manager.sigfox_manager.do_post")
     def test_create_device_invalid_product_cert(self, mock_post):
         """Test create_device ignores product_cert without key"""
         from sigfox_manager.models.schemas import BaseDevice
-        
-        mock_post.return_value = MagicMock(
-            status_code=201,
-            text='{"id": "ABC123"}'
-        )
-        
+
+        mock_post.return_value = MagicMock(status_code=201, text='{"id": "ABC123"}')
+
         sm = SigfoxManager("user", "pwd")
         # Product cert without 'key' should be ignored
         device = sm.create_device(
@@ -846,9 +841,9 @@ class TestSigfoxManager:
             pac="1234567890ABCDEF",
             dev_type_id="dt1",
             name="Test Device",
-            product_cert={"invalid": "cert"}
+            product_cert={"invalid": "cert"},
         )
-        
+
         # Verify product_cert was NOT included
         call_args = mock_post.call_args[0][1]
         assert "productCertificate" not in call_args
@@ -858,15 +853,15 @@ class TestSigfoxManager:
         """Test get_contracts breaks pagination loop on non-200 status"""
         page1 = MagicMock(
             status_code=200,
-            text='{"data": [{"id": "c1", "name": "Contract 1", "activationEndTime": 0, "communicationEndTime": 0, "bidir": false, "highPriorityDownlink": false, "maxUplinkFrames": 0, "maxDownlinkFrames": 0, "maxTokens": 0, "automaticRenewal": false, "renewalDuration": 0, "contractId": "c1", "userId": "u1", "createdBy": "user", "lastEditionTime": 0, "creationTime": 0, "lastEditedBy": "user", "startTime": 0, "timezone": "UTC", "tokenDuration": 0, "tokensInUse": 0, "tokensUsed": 0}], "paging": {"next": "https://api.sigfox.com/v2/contract-infos?page=2"}}'
+            text='{"data": [{"id": "c1", "name": "Contract 1", "activationEndTime": 0, "communicationEndTime": 0, "bidir": false, "highPriorityDownlink": false, "maxUplinkFrames": 0, "maxDownlinkFrames": 0, "maxTokens": 0, "automaticRenewal": false, "renewalDuration": 0, "contractId": "c1", "userId": "u1", "createdBy": "user", "lastEditionTime": 0, "creationTime": 0, "lastEditedBy": "user", "startTime": 0, "timezone": "UTC", "tokenDuration": 0, "tokensInUse": 0, "tokensUsed": 0}], "paging": {"next": "https://api.sigfox.com/v2/contract-infos?page=2"}}',
         )
         page2_error = MagicMock(status_code=500)
-        
+
         mock_get.side_effect = [page1, page2_error]
-        
+
         sm = SigfoxManager("user", "pwd")
         response = sm.get_contracts(fetch_all_pages=True)
-        
+
         # Should return only the first page data
         assert len(response.data) == 1
         assert response.data[0].id == "c1"
@@ -876,33 +871,659 @@ class TestSigfoxManager:
         """Test get_devices_by_contract breaks pagination loop on non-200 status"""
         page1 = MagicMock(
             status_code=200,
-            text='{"data": [{"id": "d1", "name": "Device 1", "satelliteCapable": false, "repeater": false, "messageModulo": 0, "group": {"id": "g1"}, "prototype": false, "location": {"lat": 0.0, "lng": 0.0}, "pac": "0000000000000000", "lqi": 0, "creationTime": 0, "state": 0, "comState": 0, "createdBy": "user", "lastEditionTime": 0, "lastEditedBy": "user", "automaticRenewal": false, "automaticRenewalStatus": 0, "activable": false}], "paging": {"next": "https://api.sigfox.com/v2/devices?page=2"}}'
+            text='{"data": [{"id": "d1", "name": "Device 1", "satelliteCapable": false, "repeater": false, "messageModulo": 0, "group": {"id": "g1"}, "prototype": false, "location": {"lat": 0.0, "lng": 0.0}, "pac": "0000000000000000", "lqi": 0, "creationTime": 0, "state": 0, "comState": 0, "createdBy": "user", "lastEditionTime": 0, "lastEditedBy": "user", "automaticRenewal": false, "automaticRenewalStatus": 0, "activable": false}], "paging": {"next": "https://api.sigfox.com/v2/devices?page=2"}}',
         )
         page2_error = MagicMock(status_code=500)
-        
+
         mock_get.side_effect = [page1, page2_error]
-        
+
         sm = SigfoxManager("user", "pwd")
         response = sm.get_devices_by_contract("c1", fetch_all_pages=True)
-        
+
         # Should return only the first page data
         assert len(response.data) == 1
         assert response.data[0].id == "d1"
+        assert not response.complete
+        assert response.paging.next == "https://api.sigfox.com/v2/devices?page=2"
 
     @patch("sigfox_manager.sigfox_manager.do_get")
     def test_get_device_types_pagination_break_on_403_second_page(self, mock_get):
         """Test get_device_types raises SigfoxAuthError on 403 during pagination"""
-        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import SigfoxAuthError
-        
+        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+            SigfoxAuthError,
+        )
+
         page1 = MagicMock(
             status_code=200,
-            text='{"data": [{"id": "dt1", "name": "Type A"}], "paging": {"next": "https://api.sigfox.com/v2/devicetypes?page=2"}}'
+            text='{"data": [{"id": "dt1", "name": "Type A"}], "paging": {"next": "https://api.sigfox.com/v2/devicetypes?page=2"}}',
         )
         page2_auth_error = MagicMock(status_code=403)
-        
+
         mock_get.side_effect = [page1, page2_auth_error]
-        
+
         sm = SigfoxManager("user", "pwd")
-        
+
         with pytest.raises(SigfoxAuthError):
             sm.get_device_types(fetch_all_pages=True)
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_get_device_info_many_collects_results_and_errors(self, mock_get):
+        """Test get_device_info_many reports per-id failures without aborting the batch"""
+        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+            SigfoxAuthError,
+            SigfoxDeviceNotFoundError,
+        )
+
+        def fake_get(url, auth, transport=None):
+            dev_id = url.rsplit("/", 1)[-1]
+            if dev_id == "missing":
+                return MagicMock(status_code=404)
+            if dev_id == "forbidden":
+                return MagicMock(status_code=403)
+            return MagicMock(status_code=200, text=device_text(dev_id))
+
+        mock_get.side_effect = fake_get
+
+        sm = SigfoxManager("user", "pwd")
+        ids = [f"D{i}" for i in range(20)] + ["missing", "forbidden", "D0"]
+        batch = sm.get_device_info_many(ids, max_concurrency=4)
+
+        assert set(batch.results) == {f"D{i}" for i in range(20)}
+        assert batch.results["D7"].id == "D7"
+        assert isinstance(batch.errors["missing"], SigfoxDeviceNotFoundError)
+        assert isinstance(batch.errors["forbidden"], SigfoxAuthError)
+        assert not batch.ok
+        # Duplicate ids are only fetched once
+        assert mock_get.call_count == 22
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_iter_device_info_many_yields_as_completed(self, mock_get):
+        """Test iter_device_info_many streams results and stops submitting on early exit"""
+        mock_get.side_effect = lambda url, auth, transport=None: MagicMock(
+            status_code=200, text=device_text(url.rsplit("/", 1)[-1])
+        )
+
+        sm = SigfoxManager("user", "pwd")
+        results = sm.iter_device_info_many(
+            (f"D{i}" for i in range(1000)), max_concurrency=2
+        )
+        first = next(results)
+        results.close()
+
+        assert first[1].id == first[0]
+        assert first[2] is None
+        assert mock_get.call_count < 10
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_pagination_prefetches_next_page_while_parsing(self, mock_get):
+        """Test page N+1 is requested before page N is handed back to the caller"""
+        import threading
+
+        second_page_requested = threading.Event()
+
+        def fake_get(url, auth, transport=None):
+            second_page_requested.set()
+            return MagicMock(
+                status_code=200,
+                text='{"data": [{"id": "dt2", "name": "Type B"}], "paging": {"next": null}}',
+            )
+
+        mock_get.side_effect = fake_get
+        first_page = {
+            "data": [{"id": "dt1", "name": "Type A"}],
+            "paging": {"next": "https://api.sigfox.com/v2/devicetypes?page=2"},
+        }
+
+        sm = SigfoxManager("user", "pwd")
+        pages = sm._iter_pages(first_page, DeviceTypesResponse)
+        page1 = next(pages)
+
+        # The lookahead request is already in flight while page 1 is being consumed
+        assert second_page_requested.wait(timeout=5)
+        assert page1.data[0].id == "dt1"
+        assert [p.data[0].id for p in pages] == ["dt2"]
+        assert mock_get.call_count == 1
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_iter_devices_by_contract_streams_and_resumes(self, mock_get):
+        """Test iter_devices_by_contract yields across pages and resumes from its cursor"""
+        pages = {
+            "https://api.sigfox.com/v2/contract-infos/c1/devices": (
+                ["d1", "d2"],
+                "https://api.sigfox.com/v2/devices?page=2",
+            ),
+            "https://api.sigfox.com/v2/devices?page=2": (["d3", "d4"], None),
+        }
+
+        def fake_get(url, auth, transport=None):
+            ids, next_url = pages[url]
+            body = '{"data": [%s], "paging": {"next": %s}}' % (
+                ", ".join(device_text(i) for i in ids),
+                '"%s"' % next_url if next_url else "null",
+            )
+            return MagicMock(status_code=200, text=body)
+
+        mock_get.side_effect = fake_get
+        sm = SigfoxManager("user", "pwd")
+
+        devices = sm.iter_devices_by_contract("c1")
+        seen = []
+        for device in devices:
+            seen.append(device.id)
+            if device.id == "d3":
+                break
+        devices.close()
+
+        assert seen == ["d1", "d2", "d3"]
+        assert devices.cursor == "https://api.sigfox.com/v2/devices?page=2"
+        assert devices.skip == 1
+        assert not devices.complete
+
+        resumed = sm.iter_devices_by_contract(
+            "c1", cursor=devices.cursor, skip=devices.skip
+        )
+        assert [d.id for d in resumed] == ["d4"]
+        assert resumed.complete
+        assert resumed.cursor is None
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_iter_contracts_stops_at_failed_page(self, mock_get):
+        """Test a failing page ends the stream with an incomplete flag and its URL as cursor"""
+        page1 = MagicMock(
+            status_code=200,
+            text='{"data": [{"id": "c1", "name": "Contract 1", "activationEndTime": 0, "communicationEndTime": 0, "bidir": false, "highPriorityDownlink": false, "maxUplinkFrames": 0, "maxDownlinkFrames": 0, "maxTokens": 0, "automaticRenewal": false, "renewalDuration": 0, "contractId": "c1", "userId": "u1", "createdBy": "user", "lastEditionTime": 0, "creationTime": 0, "lastEditedBy": "user", "startTime": 0, "timezone": "UTC", "tokenDuration": 0, "tokensInUse": 0, "tokensUsed": 0}], "paging": {"next": "https://api.sigfox.com/v2/contract-infos?page=2"}}',
+        )
+        mock_get.side_effect = [page1, MagicMock(status_code=500)]
+
+        sm = SigfoxManager("user", "pwd")
+        contracts = sm.iter_contracts()
+
+        assert [c.id for c in contracts] == ["c1"]
+        assert not contracts.complete
+        assert contracts.cursor == "https://api.sigfox.com/v2/contract-infos?page=2"
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_iter_device_types_raises_auth_error_on_first_page(self, mock_get):
+        """Test iter_device_types maps a 403 on the first page eagerly"""
+        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+            SigfoxAuthError,
+        )
+
+        mock_get.return_value = MagicMock(status_code=403)
+        sm = SigfoxManager("user", "pwd")
+
+        with pytest.raises(SigfoxAuthError):
+            sm.iter_device_types()
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_get_device_messages_fetch_all_pages_with_window(self, mock_get):
+        """Test get_device_messages follows paging.next and stops at the since bound"""
+        mock_get.side_effect = [
+            MagicMock(
+                status_code=200,
+                text=messages_text(
+                    [900, 800],
+                    "https://api.sigfox.com/v2/devices/d1/messages?before=800",
+                ),
+            ),
+            MagicMock(
+                status_code=200,
+                text=messages_text(
+                    [700, 600, 500],
+                    "https://api.sigfox.com/v2/devices/d1/messages?before=500",
+                ),
+            ),
+        ]
+
+        sm = SigfoxManager("user", "pwd")
+        messages = sm.get_device_messages(
+            "d1", since=600, before=1000, fetch_all_pages=True
+        )
+
+        assert [m.time for m in messages.data] == [900, 800, 700, 600]
+        assert messages.paging.next is None
+        first_url = mock_get.call_args_list[0][0][0]
+        assert "since=600" in first_url and "before=1000" in first_url
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_get_device_messages_max_messages_cap(self, mock_get):
+        """Test max_messages truncates the walk and keeps a cursor to continue"""
+        mock_get.side_effect = [
+            MagicMock(
+                status_code=200,
+                text=messages_text(
+                    [900, 800],
+                    "https://api.sigfox.com/v2/devices/d1/messages?before=800",
+                ),
+            ),
+            MagicMock(status_code=200, text=messages_text([700, 600], None)),
+        ]
+
+        sm = SigfoxManager("user", "pwd")
+        messages = sm.get_device_messages("d1", fetch_all_pages=True, max_messages=3)
+
+        assert [m.time for m in messages.data] == [900, 800, 700]
+        assert (
+            messages.paging.next
+            == "https://api.sigfox.com/v2/devices/d1/messages?before=800"
+        )
+        assert messages.paging.skip == 1
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_get_device_messages_resumes_mid_page(self, mock_get):
+        """Test resuming a capped read with paging.next and paging.skip returns no message twice"""
+        next_url = "https://api.sigfox.com/v2/devices/d1/messages?before=800"
+        pages = {next_url: messages_text([700, 600], None)}
+        mock_get.side_effect = lambda url, auth, transport=None: MagicMock(
+            status_code=200, text=pages.get(url) or messages_text([900, 800], next_url)
+        )
+
+        sm = SigfoxManager("user", "pwd")
+        first = sm.get_device_messages("d1", fetch_all_pages=True, max_messages=3)
+        rest = sm.get_device_messages(
+            "d1", fetch_all_pages=True, cursor=first.paging.next, skip=first.paging.skip
+        )
+
+        assert [m.time for m in first.data + rest.data] == [900, 800, 700, 600]
+        assert rest.complete and rest.paging.skip == 0
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_get_device_messages_first_page_only_does_not_prefetch(self, mock_get):
+        """Test a capped first-page read issues a single request"""
+        mock_get.return_value = MagicMock(
+            status_code=200,
+            text=messages_text(
+                [900, 800], "https://api.sigfox.com/v2/devices/d1/messages?before=800"
+            ),
+        )
+
+        sm = SigfoxManager("user", "pwd")
+        messages = sm.get_device_messages("d1", max_messages=5)
+
+        assert len(messages.data) == 2
+        assert (
+            messages.paging.next
+            == "https://api.sigfox.com/v2/devices/d1/messages?before=800"
+        )
+        assert mock_get.call_count == 1
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_iter_device_messages_streams_pages(self, mock_get):
+        """Test iter_device_messages yields messages lazily across pages"""
+        mock_get.side_effect = [
+            MagicMock(
+                status_code=200,
+                text=messages_text(
+                    [900], "https://api.sigfox.com/v2/devices/d1/messages?before=900"
+                ),
+            ),
+            MagicMock(status_code=200, text=messages_text([800], None)),
+        ]
+
+        sm = SigfoxManager("user", "pwd")
+        messages = sm.iter_device_messages("d1")
+
+        assert [m.time for m in messages] == [900, 800]
+        assert messages.complete
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_deadline_exceeded_keeps_partial_results_and_cursor(self, mock_get):
+        """Test a pagination walk past its deadline raises with the pages fetched so far"""
+        import threading
+        import time
+        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+            SigfoxTimeoutError,
+        )
+
+        release = threading.Event()
+        stalled_url = "https://api.sigfox.com/v2/devices?page=2"
+
+        def fake_get(url, auth, transport=None):
+            if url == stalled_url:
+                release.wait(timeout=5)
+                return MagicMock(
+                    status_code=200, text='{"data": [], "paging": {"next": null}}'
+                )
+            return MagicMock(
+                status_code=200,
+                text='{"data": [%s], "paging": {"next": "%s"}}'
+                % (device_text("d1"), stalled_url),
+            )
+
+        mock_get.side_effect = fake_get
+        sm = SigfoxManager("user", "pwd")
+
+        start = time.monotonic()
+        with pytest.raises(SigfoxTimeoutError) as exc_info:
+            sm.get_devices_by_contract("c1", deadline=0.05)
+        release.set()
+
+        assert time.monotonic() - start < 2
+        assert [d.id for d in exc_info.value.partial] == ["d1"]
+        assert exc_info.value.cursor == stalled_url
+        assert exc_info.value.status_code == 408
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_request_timeout_raises_typed_error(self, mock_get):
+        """Test a requests timeout on a later page surfaces as SigfoxTimeoutError with partial data"""
+        import requests
+        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+            SigfoxTimeoutError,
+        )
+
+        mock_get.side_effect = [
+            MagicMock(
+                status_code=200,
+                text=messages_text(
+                    [900, 800],
+                    "https://api.sigfox.com/v2/devices/d1/messages?before=800",
+                ),
+            ),
+            requests.ReadTimeout("read timed out"),
+        ]
+
+        sm = SigfoxManager("user", "pwd")
+        with pytest.raises(SigfoxTimeoutError) as exc_info:
+            sm.get_device_messages("d1", fetch_all_pages=True)
+
+        assert [m.time for m in exc_info.value.partial] == [900, 800]
+        assert (
+            exc_info.value.cursor
+            == "https://api.sigfox.com/v2/devices/d1/messages?before=800"
+        )
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_deadline_bounds_first_page(self, mock_get):
+        """Test the deadline also bounds the request of the first page"""
+        import threading
+        import time
+        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+            SigfoxTimeoutError,
+        )
+
+        release = threading.Event()
+
+        def fake_get(url, auth, transport=None):
+            release.wait(timeout=5)
+            return MagicMock(
+                status_code=200, text='{"data": [], "paging": {"next": null}}'
+            )
+
+        mock_get.side_effect = fake_get
+        sm = SigfoxManager("user", "pwd")
+
+        start = time.monotonic()
+        with pytest.raises(SigfoxTimeoutError) as exc_info:
+            sm.get_devices_by_contract("c1", deadline=0.05)
+        with pytest.raises(SigfoxTimeoutError):
+            sm.iter_device_messages("d1", deadline=0.05)
+        release.set()
+
+        assert time.monotonic() - start < 2
+        assert exc_info.value.partial == []
+        assert (
+            exc_info.value.cursor
+            == "https://api.sigfox.com/v2/contract-infos/c1/devices"
+        )
+
+    @patch("sigfox_manager.sigfox_manager.do_post")
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_single_requests_raise_typed_timeout(self, mock_get, mock_post):
+        """Test device info, message metrics and device creation map request timeouts to SigfoxTimeoutError"""
+        import requests
+        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+            SigfoxTimeoutError,
+        )
+
+        mock_get.side_effect = requests.ReadTimeout("read timed out")
+        mock_post.side_effect = requests.ConnectTimeout("connect timed out")
+        sm = SigfoxManager("user", "pwd")
+
+        with pytest.raises(SigfoxTimeoutError) as exc_info:
+            sm.get_device_info("d1")
+        assert exc_info.value.cursor == "https://api.sigfox.com/v2/devices/d1"
+        with pytest.raises(SigfoxTimeoutError):
+            sm.get_device_message_number("d1")
+        with pytest.raises(SigfoxTimeoutError):
+            sm.create_device("d1", "pac", "dt1", "Device 1")
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_get_devices_by_contract_resumes_from_checkpoint(self, mock_get, tmp_path):
+        """Test an interrupted walk is flagged partial and resumes from its checkpoint"""
+        first_url = "https://api.sigfox.com/v2/contract-infos/c1/devices"
+        pages = {
+            first_url: (["d1", "d2"], "https://api.sigfox.com/v2/devices?page=2"),
+            "https://api.sigfox.com/v2/devices?page=2": (
+                ["d3"],
+                "https://api.sigfox.com/v2/devices?page=3",
+            ),
+            "https://api.sigfox.com/v2/devices?page=3": (["d4"], None),
+        }
+        failing = {"https://api.sigfox.com/v2/devices?page=3"}
+
+        def fake_get(url, auth, transport=None):
+            if url in failing:
+                return MagicMock(status_code=500)
+            ids, next_url = pages[url]
+            body = '{"data": [%s], "paging": {"next": %s}}' % (
+                ", ".join(device_text(i) for i in ids),
+                '"%s"' % next_url if next_url else "null",
+            )
+            return MagicMock(status_code=200, text=body)
+
+        mock_get.side_effect = fake_get
+        checkpoint = str(tmp_path / "devices.ckpt")
+        sm = SigfoxManager("user", "pwd")
+
+        partial = sm.get_devices_by_contract("c1", checkpoint=checkpoint)
+        assert [d.id for d in partial.data] == ["d1", "d2", "d3"]
+        assert not partial.complete
+        assert partial.paging.next == "https://api.sigfox.com/v2/devices?page=3"
+
+        failing.clear()
+        mock_get.reset_mock()
+        full = sm.get_devices_by_contract("c1", checkpoint=checkpoint)
+
+        assert [d.id for d in full.data] == ["d1", "d2", "d3", "d4"]
+        assert full.complete
+        assert full.paging.next is None
+        # Only the page that failed is downloaded again
+        assert [c[0][0] for c in mock_get.call_args_list] == [
+            "https://api.sigfox.com/v2/devices?page=3"
+        ]
+        assert not (tmp_path / "devices.ckpt").exists()
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_backfill_device_messages_shards_and_dedupes(self, mock_get):
+        """Test backfill splits the window into shards and merges them without boundary duplicates"""
+        from urllib.parse import urlparse, parse_qs
+
+        history = list(range(0, 1000, 10))
+
+        def fake_get(url, auth, transport=None):
+            query = parse_qs(urlparse(url).query)
+            since, before = int(query["since"][0]), int(query["before"][0])
+            # Simulate an API that treats `before` inclusively, duplicating boundary messages
+            times = [t for t in reversed(history) if since <= t <= before]
+            return MagicMock(status_code=200, text=messages_text(times))
+
+        mock_get.side_effect = fake_get
+
+        sm = SigfoxManager("user", "pwd")
+        messages = sm.backfill_device_messages(
+            "d1", since=0, before=1000, shards=4, max_concurrency=2
+        )
+
+        assert mock_get.call_count == 4
+        assert [m.time for m in messages.data] == list(reversed(history))
+
+        oldest_first = sm.backfill_device_messages(
+            "d1", since=0, before=1000, shards=3, newest_first=False
+        )
+        assert [m.time for m in oldest_first.data] == history
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_backfill_device_messages_reports_incomplete_shard(self, mock_get):
+        """Test a shard whose second page fails raises with the merged messages and the failed window"""
+        from urllib.parse import urlparse, parse_qs
+
+        def fake_get(url, auth, transport=None):
+            if "page=2" in url:
+                return MagicMock(status_code=500, text="")
+            query = parse_qs(urlparse(url).query)
+            since = int(query["since"][0])
+            if since == 0:
+                return MagicMock(
+                    status_code=200,
+                    text=messages_text([400, 300], next_url=f"{url}&page=2"),
+                )
+            return MagicMock(status_code=200, text=messages_text([900, 600]))
+
+        mock_get.side_effect = fake_get
+
+        sm = SigfoxManager("user", "pwd")
+        with pytest.raises(SigfoxIncompleteBackfillError) as exc_info:
+            sm.backfill_device_messages("d1", since=0, before=1000, shards=2)
+
+        assert exc_info.value.windows == [(0, 500)]
+        assert not exc_info.value.partial.complete
+        assert [m.time for m in exc_info.value.partial.data] == [900, 600, 400, 300]
+
+    def test_backfill_device_messages_rejects_empty_window(self):
+        """Test backfill validates the time window"""
+        sm = SigfoxManager("user", "pwd")
+
+        with pytest.raises(ValueError):
+            sm.backfill_device_messages("d1", since=1000, before=1000)
+
+    @patch.object(SigfoxManager, "get_device_types")
+    def test_resolve_device_type_id_uses_cached_catalog(self, mock_get_device_types):
+        """Test repeated resolutions download the device-type catalog once"""
+        mock_get_device_types.return_value = DeviceTypesResponse(
+            data=[
+                DeviceType(id="dt1", name="Type A"),
+                DeviceType(id="dt2", name="Type B"),
+            ],
+            paging=Paging(next=None),
+        )
+
+        sm = SigfoxManager("user", "pwd")
+        results = [
+            sm.resolve_device_type_id(ref) for ref in ["Type A", "dt2", "Type B"] * 100
+        ]
+
+        assert results[:3] == ["dt1", "dt2", "dt2"]
+        mock_get_device_types.assert_called_once_with(fetch_all_pages=True)
+
+        sm.invalidate_device_type_catalog()
+        sm.resolve_device_type_id("dt1")
+        assert mock_get_device_types.call_count == 2
+
+    @patch.object(SigfoxManager, "get_device_types")
+    def test_device_type_catalog_ttl_expiry(self, mock_get_device_types):
+        """Test a zero TTL reloads the catalog on every lookup"""
+        mock_get_device_types.return_value = DeviceTypesResponse(
+            data=[DeviceType(id="dt1", name="Type A")], paging=Paging(next=None)
+        )
+
+        sm = SigfoxManager("user", "pwd", device_type_cache_ttl=0)
+        sm.resolve_device_type_id("dt1")
+        sm.resolve_device_type_id("dt1")
+
+        assert mock_get_device_types.call_count == 2
+
+    @patch.object(SigfoxManager, "get_device_types")
+    def test_resolve_device_type_id_reloads_stale_catalog_on_miss(
+        self, mock_get_device_types
+    ):
+        """Test an unknown reference reloads a cached catalog once before failing"""
+        mock_get_device_types.side_effect = [
+            DeviceTypesResponse(
+                data=[DeviceType(id="dt1", name="Type A")], paging=Paging(next=None)
+            ),
+            DeviceTypesResponse(
+                data=[
+                    DeviceType(id="dt1", name="Type A"),
+                    DeviceType(id="dt9", name="New Type"),
+                ],
+                paging=Paging(next=None),
+            ),
+            DeviceTypesResponse(
+                data=[DeviceType(id="dt1", name="Type A")], paging=Paging(next=None)
+            ),
+        ]
+
+        sm = SigfoxManager("user", "pwd")
+        catalog = sm.get_device_type_catalog()
+
+        assert catalog.by_name["Type A"].id == "dt1"
+        assert sm.resolve_device_type_id("New Type") == "dt9"
+        assert mock_get_device_types.call_count == 2
+        assert sm.resolve_device_type_id("New Type") == "dt9"
+        assert mock_get_device_types.call_count == 2
+
+    @patch.object(SigfoxManager, "create_device")
+    @patch.object(SigfoxManager, "resolve_device_type_id")
+    def test_provision_devices_reports_per_row(self, mock_resolve, mock_create):
+        """Test provision_devices validates up front, resolves each type once and reports every row"""
+        from sigfox_manager.models.schemas import BaseDevice
+        from sigfox_manager.sigfox_manager_exceptions.sigfox_exceptions import (
+            SigfoxDeviceCreateConflictException,
+        )
+
+        def resolve(ref):
+            if ref == "Unknown":
+                raise SigfoxDeviceTypeNotFoundException(f"Device type not found: {ref}")
+            return {"Type A": "dt1", "Type B": "dt2"}[ref]
+
+        def create(**kwargs):
+            if kwargs["dev_id"] == "C0FFEE":
+                raise SigfoxDeviceCreateConflictException
+            return BaseDevice(id=kwargs["dev_id"])
+
+        mock_resolve.side_effect = resolve
+        mock_create.side_effect = create
+
+        rows = [
+            {
+                "dev_id": "19C3B",
+                "pac": "1234567890ABCDEF",
+                "dev_type_ref": "Type A",
+                "prototype": True,
+            },
+            {"dev_id": "bad", "pac": "1234567890ABCDEF", "dev_type_ref": "Type A"},
+            {"dev_id": "C0FFEE", "pac": "1234567890ABCDEF", "dev_type_ref": "Type B"},
+            {"dev_id": "19C3C", "pac": "1234567890ABCDEF", "dev_type_ref": "Unknown"},
+            {
+                "dev_id": "19C3D",
+                "pac": "1234567890ABCDEF",
+                "dev_type_ref": "Type A",
+                "name": "node-4",
+            },
+            {"dev_id": "19C3E", "dev_type_ref": "Type A"},
+        ]
+
+        sm = SigfoxManager("user", "pwd")
+        report = sm.provision_devices(rows, max_concurrency=3)
+
+        assert [r.status for r in report.rows] == [
+            "created",
+            "invalid",
+            "conflict",
+            "invalid",
+            "created",
+            "invalid",
+        ]
+        assert [r.index for r in report.rows] == list(range(6))
+        assert [r.device.id for r in report.created] == ["19C3B", "19C3D"]
+        assert isinstance(report.invalid[1].error, SigfoxDeviceTypeNotFoundException)
+        assert sorted(c.args[0] for c in mock_resolve.call_args_list) == [
+            "Type A",
+            "Type B",
+            "Unknown",
+        ]
+
+        created_kwargs = {c[1]["dev_id"]: c[1] for c in mock_create.call_args_list}
+        assert created_kwargs["19C3B"]["prototype"] is True
+        assert created_kwargs["19C3B"]["dev_type_id"] == "dt1"
+        assert created_kwargs["19C3D"]["name"] == "node-4"
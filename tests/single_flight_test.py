@@ -0,0 +1,93 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from sigfox_manager.sigfox_manager import SigfoxManager
+from sigfox_manager.utils.http_utils import HttpTransport
+from sigfox_manager.utils.single_flight import SingleFlight
+
+
+def run_concurrently(fn, n=8):
+    """Call fn from n threads released at the same moment and return their results"""
+    barrier = threading.Barrier(n)
+
+    def call():
+        barrier.wait()
+        return fn()
+
+    with ThreadPoolExecutor(max_workers=n) as executor:
+        futures = [executor.submit(call) for _ in range(n)]
+        return [f.result() for f in futures]
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_one_execution(self):
+        """Test callers of an in-flight key get the leader's result without running fn"""
+        flight = SingleFlight()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.1)
+            return object()
+
+        results = run_concurrently(lambda: flight.do("k", slow))
+
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+        assert flight.in_flight() == 0
+
+    def test_error_is_shared_and_key_released(self):
+        """Test the leader's exception reaches every waiter and the next call runs again"""
+        flight = SingleFlight()
+
+        def failing():
+            time.sleep(0.05)
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            run_concurrently(lambda: flight.do("k", failing), n=4)
+        assert flight.do("k", lambda: 42) == 42
+
+
+class TestCoalescedRequests:
+    def test_transport_coalesces_identical_gets(self):
+        """Test concurrent GETs of one URL send a single upstream request"""
+        transport = HttpTransport(b"dXNlcjpwd2Q=")
+
+        def slow_get(url, timeout=None):
+            time.sleep(0.1)
+            return MagicMock(status_code=200, headers={})
+
+        with patch.object(
+            transport.session, "get", side_effect=slow_get
+        ) as mock_session_get:
+            responses = run_concurrently(
+                lambda: transport.get("https://api.sigfox.com/v2/devices/d1")
+            )
+
+        assert mock_session_get.call_count == 1
+        assert all(r is responses[0] for r in responses)
+
+    @patch("sigfox_manager.sigfox_manager.do_get")
+    def test_get_device_info_shares_parsed_result(self, mock_get):
+        """Test concurrent get_device_info calls for a device parse one response"""
+
+        def slow_get(url, auth, transport=None):
+            time.sleep(0.1)
+            return MagicMock(
+                status_code=200,
+                text='{"id": "d1", "name": "Device d1", "satelliteCapable": false, "repeater": false, "messageModulo": 0, "group": {"id": "g1"}, "prototype": false, "location": {"lat": 0.0, "lng": 0.0}, "pac": "0000000000000000", "lqi": 0, "creationTime": 0, "state": 0, "comState": 0, "createdBy": "user", "lastEditionTime": 0, "lastEditedBy": "user", "automaticRenewal": false, "automaticRenewalStatus": 0, "activable": false}',
+            )
+
+        mock_get.side_effect = slow_get
+        sm = SigfoxManager("user", "pwd")
+
+        devices = run_concurrently(lambda: sm.get_device_info("d1"))
+
+        assert mock_get.call_count == 1
+        assert all(d is devices[0] for d in devices)
+        assert devices[0].id == "d1"